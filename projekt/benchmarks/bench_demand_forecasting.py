@@ -0,0 +1,60 @@
+"""
+Pomiar czasu prognozy popytu dla dużego magazynu.
+
+Uruchomienie (z katalogu projekt):
+    python -m benchmarks.bench_demand_forecasting
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from src.demand_forecasting import PrognozaPopytu
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+from src.stock_ledger import RejestrRuchow
+
+LICZBA_SKLADNIKOW = 5000
+DNI = 365
+
+
+def przygotuj_magazyn():
+    """Tworzy magazyn z rokiem historii zużycia (jeden ruch dziennie)."""
+    losowosc = random.Random(42)
+    rejestr = RejestrRuchow()
+    zarzadzanie = ZarzadzanieSkladnikami()
+    for numer in range(LICZBA_SKLADNIKOW):
+        zarzadzanie.dodaj_skladnik(
+            Skladnik(f"Składnik {numer}", "kg", 20, 10, 5.0,
+                     rejestr=rejestr))
+
+    kody = [skladnik.kod for skladnik in zarzadzanie.skladniki.values()]
+    koniec = datetime(2025, 1, 1)
+    poczatek = koniec - timedelta(days=DNI)
+    for dzien in range(DNI):
+        czas = poczatek + timedelta(days=dzien, hours=12)
+        for kod in kody:
+            rejestr.dopisz(kod, czas, "zużycie", -losowosc.uniform(0, 4))
+    return zarzadzanie, koniec
+
+
+def main():
+    """Uruchamia pomiar i wypisuje czasy."""
+    zarzadzanie, koniec = przygotuj_magazyn()
+    prognoza = PrognozaPopytu(zarzadzanie, dni_historii=DNI)
+
+    start = time.perf_counter()
+    szeregi = prognoza.szeregi_dzienne(koniec)
+    czas_szeregow = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sugestie = prognoza.sugerowane_zamowienia(koniec=koniec)
+    czas_calkowity = time.perf_counter() - start
+
+    print(f"Składniki: {len(szeregi)}, dni: {DNI}")
+    print(f"Szeregi dzienne: {czas_szeregow:.2f} s")
+    print(f"Szeregi + prognoza + sugestie: {czas_calkowity:.2f} s "
+          f"({len(sugestie)} sugestii)")
+
+
+if __name__ == "__main__":
+    main()
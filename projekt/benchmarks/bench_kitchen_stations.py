@@ -0,0 +1,83 @@
+"""
+Pomiar przepustowości równoległych stanowisk kuchennych.
+
+Porównuje blokady składników z jedną blokadą globalną dla dwóch
+scenariuszy: stanowisk przygotowujących dania o rozłącznych
+składnikach oraz stanowisk korzystających ze wspólnych składników.
+Każde danie symuluje krótką pracę stanowiska (np. odczyt wagi)
+wykonywaną w trakcie przygotowania, czyli pod blokadą.
+
+Uruchomienie (z katalogu projekt):
+    python -m benchmarks.bench_kitchen_stations
+"""
+
+import threading
+import time
+
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+
+STANOWISKA = 8
+DANIA_NA_STANOWISKO = 200
+PRACA_STANOWISKA = 0.0002  # sekundy pod blokadą na jedno danie
+
+
+class WagaKuchenna(Skladnik):
+    """Składnik, którego zużycie wymaga odczytu wagi."""
+
+    def zuzyj(self, ilosc, cel="", czas=None):
+        """Zużywa składnik po odczekaniu na wagę."""
+        time.sleep(PRACA_STANOWISKA)
+        super().zuzyj(ilosc, cel, czas)
+
+
+def przygotuj_magazyn(blokada_globalna, wspolne):
+    """Tworzy magazyn z jednym daniem na stanowisko."""
+    zarzadzanie = ZarzadzanieSkladnikami(blokada_globalna)
+    zarzadzanie.dodaj_skladnik(
+        WagaKuchenna("Sól", "kg", 10 ** 6, 0, 1.0))
+    for numer in range(STANOWISKA):
+        nazwa = f"Składnik {numer}"
+        zarzadzanie.dodaj_skladnik(
+            WagaKuchenna(nazwa, "kg", 10 ** 6, 0, 1.0))
+        przepis = {nazwa: 0.1}
+        if wspolne:
+            przepis["Sól"] = 0.01
+        zarzadzanie.dodaj_przepis(f"Danie {numer}", przepis)
+    return zarzadzanie
+
+
+def zmierz(blokada_globalna, wspolne):
+    """Zwraca czas przygotowania wszystkich dań przez stanowiska."""
+    zarzadzanie = przygotuj_magazyn(blokada_globalna, wspolne)
+    bariera = threading.Barrier(STANOWISKA + 1)
+
+    def stanowisko(numer):
+        bariera.wait()
+        for _ in range(DANIA_NA_STANOWISKO):
+            zarzadzanie.przygotuj_danie(f"Danie {numer}")
+
+    watki = [threading.Thread(target=stanowisko, args=(numer,))
+             for numer in range(STANOWISKA)]
+    for watek in watki:
+        watek.start()
+    bariera.wait()
+    start = time.perf_counter()
+    for watek in watki:
+        watek.join()
+    return time.perf_counter() - start
+
+
+def main():
+    """Uruchamia pomiar i wypisuje czasy."""
+    print(f"Stanowiska: {STANOWISKA}, dania na stanowisko: "
+          f"{DANIA_NA_STANOWISKO}")
+    for wspolne, opis in ((False, "rozłączne składniki"),
+                          (True, "wspólny składnik")):
+        czas_skladnikow = zmierz(False, wspolne)
+        czas_globalny = zmierz(True, wspolne)
+        print(f"{opis}: blokady składników {czas_skladnikow:.2f} s, "
+              f"blokada globalna {czas_globalny:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Pomiar zimnego wczytania dużego menu.
+
+Porównuje tworzenie menu pętlą konstruktorów Danie i wywołań
+dodaj_danie z wczytaniem tego samego menu z pliku JSON lines
+i z pliku binarnego (z leniwym tworzeniem dań).
+
+Uruchomienie (z katalogu projekt):
+    python -m benchmarks.bench_menu_load
+"""
+
+import gc
+import os
+import random
+import tempfile
+import time
+
+from src.menu_management import Danie, Menu
+from src.menu_storage import (wczytaj_binarnie, wczytaj_jsonl,
+                              zapisz_binarnie, zapisz_jsonl)
+
+LICZBA_DAN = 10000
+KATEGORIE = ["przystawka", "zupa", "danie główne", "deser", "napój"]
+SKLADNIKI = [f"Składnik {numer}" for numer in range(400)]
+
+
+def przygotuj_dane():
+    """Losuje dane dań (jak odczytane z systemu lokali)."""
+    losowosc = random.Random(42)
+    return [(f"Danie {numer}", round(losowosc.uniform(8, 120), 2),
+             losowosc.choice(KATEGORIE), losowosc.randrange(5, 60),
+             losowosc.sample(SKLADNIKI, 6), losowosc.randrange(100, 1500))
+            for numer in range(LICZBA_DAN)]
+
+
+def zbuduj_menu(dane):
+    """Tworzy menu pętlą konstruktorów."""
+    menu = Menu()
+    for nazwa, cena, kategoria, czas, skladniki, kalorie in dane:
+        menu.dodaj_danie(Danie(nazwa, cena, kategoria, czas,
+                               list(skladniki), kalorie))
+    return menu
+
+
+def zmierz(funkcja, *argumenty):
+    """Zwraca czas wywołania funkcji w sekundach."""
+    # Porządki po poprzednim pomiarze nie wliczają się do czasu
+    gc.collect()
+    start = time.perf_counter()
+    funkcja(*argumenty)
+    return time.perf_counter() - start
+
+
+def main():
+    """Uruchamia pomiar i wypisuje czasy."""
+    dane = przygotuj_dane()
+    czas_petli = zmierz(zbuduj_menu, dane)
+    menu = zbuduj_menu(dane)
+
+    print(f"Dania: {LICZBA_DAN}")
+    print(f"Pętla konstruktorów: {czas_petli:.3f} s")
+    with tempfile.TemporaryDirectory() as katalog:
+        for opis, zapisz, wczytaj, nazwa_pliku in (
+                ("JSON lines", zapisz_jsonl, wczytaj_jsonl, "menu.jsonl"),
+                ("binarny", zapisz_binarnie, wczytaj_binarnie, "menu.bin")):
+            sciezka = os.path.join(katalog, nazwa_pliku)
+            czas_zapisu = zmierz(zapisz, menu, sciezka)
+            czas_odczytu = zmierz(wczytaj, sciezka)
+            print(f"{opis}: zapis {czas_zapisu:.3f} s, "
+                  f"wczytanie {czas_odczytu:.3f} s, "
+                  f"plik {os.path.getsize(sciezka) // 1024} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Pomiar mediany czasu zapytań wielokryterialnych do dużego menu.
+
+Porównuje Menu.zapytanie z łańcuchem pełnych przeglądów dań
+(kategoria, cena, kalorie, dostępność, składniki), jakim front-end
+filtrował menu wcześniej.
+
+Uruchomienie (z katalogu projekt):
+    python -m benchmarks.bench_menu_query
+"""
+
+import random
+import statistics
+import time
+
+from src.menu_management import Danie, Menu, normalizuj_tekst
+
+LICZBA_DAN = 5000
+LICZBA_ZAPYTAN = 2000
+KATEGORIE = ["przystawka", "zupa", "danie główne", "deser", "napój",
+             "sałatka", "pizza", "makaron"]
+SKLADNIKI = [f"Składnik {numer}" for numer in range(300)] + \
+    ["Orzechy włoskie", "Łosoś", "Jajko", "Gluten", "Mleko"]
+
+
+def przygotuj_menu(losowosc):
+    """Tworzy menu z losowymi daniami."""
+    menu = Menu()
+    for numer in range(LICZBA_DAN):
+        danie = Danie(f"Danie {numer}", round(losowosc.uniform(8, 120), 2),
+                      losowosc.choice(KATEGORIE),
+                      skladniki=losowosc.sample(SKLADNIKI, 6),
+                      kalorie=losowosc.randrange(100, 1500))
+        danie.dostepne = losowosc.random() < 0.9
+        menu.dodaj_danie(danie)
+    return menu
+
+
+def losuj_zapytanie(losowosc):
+    """Losuje kryteria jak z filtrów front-endu."""
+    min_cena = losowosc.uniform(8, 100)
+    return {
+        "kategoria": losowosc.choice(KATEGORIE),
+        "min_cena": min_cena,
+        "max_cena": min_cena + losowosc.uniform(5, 40),
+        "max_kalorie": losowosc.randrange(300, 1500),
+        "dostepne": True,
+        "bez": [losowosc.choice(["orzech", "gluten", "mleko"])],
+    }
+
+
+def przeglad(menu, kryteria):
+    """Filtruje menu łańcuchem pełnych przeglądów."""
+    dania = [danie for danie in menu.dania.values()
+             if danie.kategoria == kryteria["kategoria"]]
+    dania = [danie for danie in dania
+             if kryteria["min_cena"] <= danie.cena <= kryteria["max_cena"]]
+    dania = [danie for danie in dania
+             if danie.kalorie is not None
+             and danie.kalorie <= kryteria["max_kalorie"]]
+    dania = [danie for danie in dania if danie.dostepne]
+    bez = [normalizuj_tekst(nazwa) for nazwa in kryteria["bez"]]
+    return [danie for danie in dania
+            if not any(normalizuj_tekst(skladnik).startswith(nazwa)
+                       for skladnik in danie.skladniki for nazwa in bez)]
+
+
+def mediana_czasu(funkcja, zapytania):
+    """Zwraca medianę czasu wywołania funkcji w mikrosekundach."""
+    czasy = []
+    for kryteria in zapytania:
+        start = time.perf_counter()
+        funkcja(kryteria)
+        czasy.append(time.perf_counter() - start)
+    return statistics.median(czasy) * 1e6
+
+
+def main():
+    """Uruchamia pomiar i wypisuje mediany czasów."""
+    losowosc = random.Random(42)
+    menu = przygotuj_menu(losowosc)
+    zapytania = [losuj_zapytanie(losowosc) for _ in range(LICZBA_ZAPYTAN)]
+
+    for kryteria in zapytania[:50]:
+        assert menu.zapytanie(**kryteria) == przeglad(menu, kryteria)
+
+    czas_zapytania = mediana_czasu(
+        lambda kryteria: menu.zapytanie(sortuj="cena", na_strone=20,
+                                        **kryteria), zapytania)
+    czas_przegladu = mediana_czasu(
+        lambda kryteria: sorted(przeglad(menu, kryteria),
+                                key=lambda danie: danie.cena)[:20],
+        zapytania)
+
+    print(f"Dania: {LICZBA_DAN}, zapytania: {LICZBA_ZAPYTAN}")
+    print(f"Menu.zapytanie: mediana {czas_zapytania:.0f} µs")
+    print(f"Pełne przeglądy: mediana {czas_przegladu:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Pomiar mediany czasu obsługi żądań widoku menu.
+
+Porównuje renderowanie menu z Menu.dania przy każdym żądaniu
+z gotowymi widokami WidokiMenu, przy zmianie ceny losowego dania
+co kilkadziesiąt żądań.
+
+Uruchomienie (z katalogu projekt):
+    python -m benchmarks.bench_menu_views
+"""
+
+import json
+import random
+import statistics
+import time
+
+from src.events import SzynaZdarzen
+from src.menu_management import Danie, Menu
+from src.menu_views import WidokiMenu
+
+LICZBA_DAN = 2000
+LICZBA_ZADAN = 2000
+ZADAN_NA_ZMIANE = 50
+KATEGORIE = ["przystawka", "zupa", "danie główne", "deser", "napój",
+             "sałatka", "pizza", "makaron"]
+
+
+def przygotuj_menu(losowosc):
+    """Tworzy menu z losowymi daniami i szyną zdarzeń."""
+    menu = Menu(szyna=SzynaZdarzen())
+    for numer in range(LICZBA_DAN):
+        menu.dodaj_danie(Danie(f"Danie {numer}",
+                               round(losowosc.uniform(8, 120), 2),
+                               losowosc.choice(KATEGORIE),
+                               skladniki=[f"Składnik {numer % 300}"],
+                               kalorie=losowosc.randrange(100, 1500)))
+    return menu
+
+
+def renderuj(menu, kategoria):
+    """Renderuje kategorię z Menu.dania (jak front-end wcześniej)."""
+    dania = [{"nazwa": danie.nazwa, "cena": danie.cena,
+              "dostepne": danie.dostepne, "kalorie": danie.kalorie,
+              "skladniki": list(danie.skladniki)}
+             for danie in menu.dania.values()
+             if danie.kategoria == kategoria]
+    return json.dumps({"kategoria": kategoria, "dania": dania},
+                      ensure_ascii=False).encode("utf-8")
+
+
+def mediana_czasu(menu, obsluz, losowosc):
+    """Zwraca medianę czasu żądania w mikrosekundach."""
+    dania = list(menu.dania.values())
+    czasy = []
+    for numer in range(LICZBA_ZADAN):
+        if numer % ZADAN_NA_ZMIANE == 0:
+            losowosc.choice(dania).zmien_cene(
+                round(losowosc.uniform(8, 120), 2))
+        kategoria = losowosc.choice(KATEGORIE)
+        start = time.perf_counter()
+        obsluz(kategoria)
+        czasy.append(time.perf_counter() - start)
+    return statistics.median(czasy) * 1e6
+
+
+def main():
+    """Uruchamia pomiar i wypisuje mediany czasów."""
+    menu = przygotuj_menu(random.Random(42))
+    widoki = WidokiMenu(menu)
+
+    czas_renderowania = mediana_czasu(
+        menu, lambda kategoria: renderuj(menu, kategoria), random.Random(7))
+    czas_widokow = mediana_czasu(menu, widoki.json_kategorii,
+                                 random.Random(7))
+
+    print(f"Dania: {LICZBA_DAN}, żądania: {LICZBA_ZADAN}, "
+          f"zmiana ceny co {ZADAN_NA_ZMIANE} żądań")
+    print(f"Renderowanie z Menu.dania: mediana {czas_renderowania:.1f} µs")
+    print(f"WidokiMenu: mediana {czas_widokow:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
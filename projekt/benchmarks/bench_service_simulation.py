@@ -0,0 +1,56 @@
+"""
+Pomiar czasu 1000 replikacji symulacji tygodnia pracy restauracji.
+
+Uruchomienie (z katalogu projekt):
+    python -m benchmarks.bench_service_simulation
+"""
+
+import time
+
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+from src.menu_management import Danie, Menu
+from src.service_simulation import PolitykaZaopatrzenia, SymulacjaSerwisu
+
+LICZBA_DAN = 15
+REPLIKACJE = 1000
+
+
+def przygotuj_symulacje():
+    """Tworzy restaurację z 15 daniami i 300 zamówieniami dziennie."""
+    zarzadzanie = ZarzadzanieSkladnikami()
+    menu = Menu()
+    popyt = {}
+    for numer in range(2 * LICZBA_DAN):
+        zarzadzanie.dodaj_skladnik(
+            Skladnik(f"Składnik {numer}", "kg", 20, 10, 2.0))
+    for numer in range(LICZBA_DAN):
+        nazwa = f"Danie {numer}"
+        zarzadzanie.dodaj_przepis(nazwa, {
+            f"Składnik {numer}": 0.2,
+            f"Składnik {numer + LICZBA_DAN}": 0.1,
+        })
+        menu.dodaj_danie(Danie(nazwa, 20.0, "Danie główne"))
+        popyt[nazwa] = 20
+    return SymulacjaSerwisu(zarzadzanie, menu, popyt, dni=7)
+
+
+def main():
+    """Uruchamia pomiar i wypisuje wynik."""
+    symulacja = przygotuj_symulacje()
+    polityka = PolitykaZaopatrzenia(
+        co_ile_dni=2, dni_przydatnosci={"Składnik 0": 3})
+
+    start = time.perf_counter()
+    wynik = symulacja.uruchom(polityka, replikacje=REPLIKACJE)
+    czas = time.perf_counter() - start
+
+    print(f"Replikacje: {wynik['replikacje']}, czas: {czas:.1f} s")
+    print(f"Obsłużone zamówienia (średnio): {wynik['srednio_obsluzone']:.0f}")
+    print(f"Utracone zamówienia (średnio): {wynik['srednio_utracone']:.1f}")
+    print(f"P(brak) Składnik 0: "
+          f"{wynik['prawdopodobienstwo_braku']['Składnik 0']:.2f}, "
+          f"straty: {wynik['srednie_straty']['Składnik 0']} kg")
+
+
+if __name__ == "__main__":
+    main()
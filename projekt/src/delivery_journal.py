@@ -0,0 +1,135 @@
+"""
+Moduł z indeksowanym dziennikiem dostaw.
+Zawiera dziennik przechowujący dostawy wraz z indeksem czasowym,
+indeksami dostawców i bieżącymi sumami wydatków.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .stock_ledger import EPOKA, MIKROSEKUNDA
+
+
+class DziennikDostaw:
+    """
+    Indeksowany dziennik dostaw.
+
+    Dostawy są przechowywane w kolejności rejestracji, a obok nich
+    utrzymywane są uporządkowane czasowo tablice (czas, numer dostawy):
+    jedna dla wszystkich dostaw i po jednej dla każdego dostawcy.
+    Zapytania zakresowe wyszukują granice binarnie. Wydatki na dostawcę
+    i na składnik u dostawcy są sumowane przy dopisywaniu dostawy.
+
+    Atrybuty:
+        dostawy (List[Dict]): Dostawy w kolejności rejestracji.
+    """
+
+    def __init__(self):
+        """
+        Inicjalizuje pusty dziennik dostaw.
+        """
+        self.dostawy: List[Dict] = []
+        # Indeks czasowy: rosnące czasy (µs) i numery dostaw
+        self._czasy = array("q")
+        self._numery = array("I")
+        # dostawca: (rosnące czasy, numery dostaw)
+        self._indeks_dostawcow: Dict[str, Tuple[array, array]] = {}
+        # dostawca: łączne wydatki / {nazwa_skladnika: wydatki}
+        self._wydatki_dostawcow: Dict[str, float] = {}
+        self._wydatki_skladnikow: Dict[str, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        """Zwraca liczbę dostaw w dzienniku."""
+        return len(self.dostawy)
+
+    @staticmethod
+    def _wstaw(czasy: array, numery: array, czas: int, numer: int) -> None:
+        """Wstawia wpis do indeksu z zachowaniem porządku czasowego."""
+        if not czasy or czas >= czasy[-1]:
+            czasy.append(czas)
+            numery.append(numer)
+        else:
+            pozycja = bisect_right(czasy, czas)
+            czasy.insert(pozycja, czas)
+            numery.insert(pozycja, numer)
+
+    def dopisz(self, dostawa: Dict, wartosci: Dict[str, float]) -> int:
+        """
+        Dopisuje dostawę do dziennika i aktualizuje indeksy.
+
+        Args:
+            dostawa: Słownik dostawy z kluczami "dostawca" i "czas_dostawy".
+            wartosci: Słownik {nazwa_skladnika: wartość pozycji}.
+
+        Returns:
+            Numer dostawy w dzienniku.
+        """
+        numer = len(self.dostawy)
+        self.dostawy.append(dostawa)
+
+        dostawca = dostawa["dostawca"]
+        czas = (dostawa["czas_dostawy"] - EPOKA) // MIKROSEKUNDA
+        self._wstaw(self._czasy, self._numery, czas, numer)
+        czasy, numery = self._indeks_dostawcow.setdefault(
+            dostawca, (array("q"), array("I")))
+        self._wstaw(czasy, numery, czas, numer)
+
+        wydatki = self._wydatki_skladnikow.setdefault(dostawca, {})
+        for nazwa, wartosc in wartosci.items():
+            wydatki[nazwa] = wydatki.get(nazwa, 0.0) + wartosc
+        self._wydatki_dostawcow[dostawca] = \
+            self._wydatki_dostawcow.get(dostawca, 0.0) + sum(wartosci.values())
+        return numer
+
+    def znajdz(self, dostawca: Optional[str] = None,
+               od: Optional[datetime] = None,
+               do: Optional[datetime] = None) -> List[Dict]:
+        """
+        Znajduje dostawy w zakresie czasu.
+
+        Args:
+            dostawca: Nazwa dostawcy lub None dla wszystkich.
+            od: Początek zakresu (włącznie) lub None.
+            do: Koniec zakresu (włącznie) lub None.
+
+        Returns:
+            Lista dostaw uporządkowana według czasu dostawy.
+        """
+        if dostawca is None:
+            czasy, numery = self._czasy, self._numery
+        elif dostawca in self._indeks_dostawcow:
+            czasy, numery = self._indeks_dostawcow[dostawca]
+        else:
+            return []
+
+        poczatek = 0 if od is None else \
+            bisect_left(czasy, (od - EPOKA) // MIKROSEKUNDA)
+        koniec = len(czasy) if do is None else \
+            bisect_right(czasy, (do - EPOKA) // MIKROSEKUNDA)
+        return [self.dostawy[numer] for numer in numery[poczatek:koniec]]
+
+    def wydatki_dostawcow(self) -> Dict[str, float]:
+        """
+        Zwraca łączne wydatki na każdego dostawcę.
+
+        Returns:
+            Słownik {dostawca: wydatki}.
+        """
+        return {dostawca: round(wartosc, 2)
+                for dostawca, wartosc in self._wydatki_dostawcow.items()}
+
+    def wydatki_dostawcy(self, dostawca: str) -> Dict[str, float]:
+        """
+        Zwraca wydatki na poszczególne składniki u dostawcy.
+
+        Args:
+            dostawca: Nazwa dostawcy.
+
+        Returns:
+            Słownik {nazwa_skladnika: wydatki} (pusty dla nieznanego
+            dostawcy).
+        """
+        return {nazwa: round(wartosc, 2) for nazwa, wartosc
+                in self._wydatki_skladnikow.get(dostawca, {}).items()}
@@ -0,0 +1,191 @@
+"""
+Moduł prognozowania popytu na składniki.
+Zawiera klasę budującą dzienne szeregi zużycia z rejestru ruchów
+magazynowych, prognozującą popyt i sugerującą wielkości zamówień.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from .inventory_control import ZarzadzanieSkladnikami
+from .stock_ledger import EPOKA, MIKROSEKUNDA
+
+DZIEN = timedelta(days=1) // MIKROSEKUNDA
+
+
+class PrognozaPopytu:
+    """
+    Klasa prognozująca dzienny popyt na składniki.
+
+    Szeregi dzienne powstają z wpisów "zużycie" w rejestrze ruchów
+    (wyszukiwanych binarnie w zakresie czasu), a prognoza jest liczona
+    dla wszystkich składników jednym przebiegiem po szeregach.
+
+    Atrybuty:
+        zarzadzanie (ZarzadzanieSkladnikami): System zarządzania składnikami.
+        dni_historii (int): Liczba dni historii branych pod uwagę.
+        alfa (float): Współczynnik wygładzania wykładniczego (0-1].
+    """
+
+    def __init__(self, zarzadzanie: ZarzadzanieSkladnikami,
+                 dni_historii: int = 365, alfa: float = 0.3):
+        """
+        Inicjalizuje prognozę popytu.
+
+        Args:
+            zarzadzanie: System zarządzania składnikami.
+            dni_historii: Liczba dni historii.
+            alfa: Współczynnik wygładzania wykładniczego.
+
+        Raises:
+            ValueError: Gdy liczba dni historii jest mniejsza od 1
+            lub alfa jest spoza przedziału (0, 1].
+        """
+        if dni_historii < 1:
+            raise ValueError("Liczba dni historii musi być większa od zera")
+        if not 0 < alfa <= 1:
+            raise ValueError("Współczynnik alfa musi należeć do (0, 1]")
+
+        self.zarzadzanie = zarzadzanie
+        self.dni_historii = dni_historii
+        self.alfa = alfa
+
+    def szeregi_dzienne(
+            self, koniec: Optional[datetime] = None) -> Dict[str, array]:
+        """
+        Buduje dzienne szeregi zużycia składników.
+
+        Dzień i obejmuje przedział [początek + i dni, początek + i+1 dni),
+        gdzie początek = koniec - dni_historii.
+
+        Args:
+            koniec: Koniec okresu historii (domyślnie bieżący czas).
+
+        Returns:
+            Słownik {nazwa_skladnika: tablica dziennego zużycia}.
+        """
+        if koniec is None:
+            koniec = datetime.now()
+        poczatek = koniec - timedelta(days=self.dni_historii)
+        poczatek_us = (poczatek - EPOKA) // MIKROSEKUNDA
+        dni = self.dni_historii
+        puste = bytes(8 * dni)
+
+        szeregi = {}
+        for nazwa, skladnik in self.zarzadzanie.skladniki.items():
+            szereg = array("d", puste)
+            rejestr = skladnik.rejestr
+            # Odczyt nie nadaje kodu operacji, której nie ma w rejestrze
+            kod_zuzycia = rejestr.kod_operacji("zużycie", utworz=False)
+            if kod_zuzycia is None:
+                szeregi[nazwa] = szereg
+                continue
+            czasy = rejestr.czasy
+            operacje = rejestr.kody_operacji
+            ilosci = rejestr.ilosci
+            for wiersz in rejestr.wiersze(skladnik.kod, poczatek, koniec):
+                if operacje[wiersz] == kod_zuzycia:
+                    dzien = (czasy[wiersz] - poczatek_us) // DZIEN
+                    if dzien < dni:
+                        szereg[dzien] -= ilosci[wiersz]
+            szeregi[nazwa] = szereg
+        return szeregi
+
+    def prognoza_dzienna(self, metoda: str = "wygladzanie", okno: int = 7,
+                         koniec: Optional[datetime] = None
+                         ) -> Dict[str, float]:
+        """
+        Prognozuje dzienny popyt na każdy składnik.
+
+        Args:
+            metoda: "wygladzanie" (wykładnicze) lub "srednia" (ruchoma).
+            okno: Liczba ostatnich dni dla średniej ruchomej.
+            koniec: Koniec okresu historii (domyślnie bieżący czas).
+
+        Returns:
+            Słownik {nazwa_skladnika: prognozowane_dzienne_zuzycie}.
+
+        Raises:
+            ValueError: Gdy metoda jest nieznana lub okno mniejsze od 1.
+        """
+        if metoda not in ("wygladzanie", "srednia"):
+            raise ValueError(f"Nieznana metoda prognozy: {metoda}")
+        if okno < 1:
+            raise ValueError("Okno średniej musi być większe od zera")
+
+        szeregi = self.szeregi_dzienne(koniec)
+        if metoda == "srednia":
+            okno = min(okno, self.dni_historii)
+            return {nazwa: sum(szereg[-okno:]) / okno
+                    for nazwa, szereg in szeregi.items()}
+
+        alfa = self.alfa
+        prognozy = {}
+        for nazwa, szereg in szeregi.items():
+            poziom = szereg[0]
+            for wartosc in szereg:
+                poziom += alfa * (wartosc - poziom)
+            prognozy[nazwa] = poziom
+        return prognozy
+
+    def popyt_z_planu(self, plan_dan: Dict[str, float]) -> Dict[str, float]:
+        """
+        Przelicza planowaną dzienną sprzedaż dań na popyt na składniki.
+
+        Args:
+            plan_dan: Słownik {nazwa_dania: porcje_dziennie}.
+
+        Returns:
+            Słownik {nazwa_skladnika: dzienne_zapotrzebowanie}.
+
+        Raises:
+            KeyError: Gdy przepis dla któregoś dania nie istnieje.
+        """
+        popyt: Dict[str, float] = {}
+        for nazwa_dania, porcje in plan_dan.items():
+            for nazwa, ilosc in self.zarzadzanie.zapotrzebowanie_dania(
+                    nazwa_dania, porcje).items():
+                popyt[nazwa] = popyt.get(nazwa, 0.0) + ilosc
+        return popyt
+
+    def sugerowane_zamowienia(self, dni_pokrycia: float = 7,
+                              plan_dan: Optional[Dict[str, float]] = None,
+                              metoda: str = "wygladzanie",
+                              koniec: Optional[datetime] = None
+                              ) -> Dict[str, float]:
+        """
+        Sugeruje ilości do zamówienia dla składników.
+
+        Docelowy zapas to prognozowany popyt na dni_pokrycia dni
+        powiększony o minimalną ilość składnika. Sugestia to brakująca
+        do celu ilość (tylko dodatnie wartości).
+
+        Args:
+            dni_pokrycia: Liczba dni, na które ma wystarczyć zapas.
+            plan_dan: Dodatkowa planowana dzienna sprzedaż dań
+            (np. catering) ponad popyt wynikający z historii.
+            metoda: Metoda prognozy (patrz prognoza_dzienna).
+            koniec: Koniec okresu historii (domyślnie bieżący czas).
+
+        Returns:
+            Słownik {nazwa_skladnika: sugerowana_ilosc}.
+
+        Raises:
+            ValueError: Gdy liczba dni pokrycia jest ujemna.
+        """
+        if dni_pokrycia < 0:
+            raise ValueError("Liczba dni pokrycia nie może być ujemna")
+
+        popyt = self.prognoza_dzienna(metoda, koniec=koniec)
+        for nazwa, ilosc in self.popyt_z_planu(plan_dan or {}).items():
+            popyt[nazwa] += ilosc
+
+        sugestie = {}
+        for nazwa, dzienny in popyt.items():
+            skladnik = self.zarzadzanie.skladniki[nazwa]
+            brak = dzienny * dni_pokrycia + skladnik.min_ilosc \
+                - skladnik.ilosc_na_stanie
+            if brak > 0:
+                sugestie[nazwa] = round(brak, 3)
+        return sugestie
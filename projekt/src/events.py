@@ -0,0 +1,165 @@
+"""
+Moduł z szyną zdarzeń o zmianach.
+Zawiera typy zdarzeń publikowanych przez menu i magazyn oraz szynę,
+która łączy serie zdarzeń w jedno powiadomienie na subskrybenta.
+"""
+
+from contextlib import contextmanager, nullcontext
+from typing import (Any, Callable, ContextManager, Dict, Iterable, Iterator,
+                    List, NamedTuple, Optional, Set, Tuple)
+import threading
+
+# Typy zdarzeń
+TYP_DANIE = "danie"
+TYP_SKLADNIK = "skladnik"
+TYP_PRZEPIS = "przepis"
+
+# Pola zdarzeń o dodaniu i usunięciu obiektu
+POLE_DODANO = "dodano"
+POLE_USUNIETO = "usunieto"
+
+
+class Zdarzenie(NamedTuple):
+    """
+    Zdarzenie o zmianie obiektu.
+
+    Atrybuty:
+        typ: Typ obiektu (TYP_DANIE, TYP_SKLADNIK, TYP_PRZEPIS).
+        nazwa: Nazwa obiektu.
+        pole: Zmienione pole albo POLE_DODANO / POLE_USUNIETO.
+        stara_wartosc: Wartość przed zmianą.
+        nowa_wartosc: Wartość po zmianie.
+        zrodlo: Zmieniony obiekt (np. Danie lub Skladnik).
+    """
+    typ: str
+    nazwa: str
+    pole: str
+    stara_wartosc: Any = None
+    nowa_wartosc: Any = None
+    zrodlo: Any = None
+
+
+Subskrybent = Callable[[List[Zdarzenie]], None]
+
+
+class SzynaZdarzen:
+    """
+    Szyna zdarzeń działająca w obrębie procesu.
+
+    Subskrybenci otrzymują listy zdarzeń. Poza partią każde zdarzenie
+    jest dostarczane od razu jako lista jednoelementowa. W partii
+    zdarzenia są zbierane, a zmiany tego samego pola tego samego obiektu
+    łączone (pierwsza stara i ostatnia nowa wartość), a zmiany, które
+    się znoszą, pomijane. Po zakończeniu najbardziej zewnętrznej partii
+    każdy subskrybent jest wywoływany co najwyżej raz. Partie są
+    odrębne dla każdego wątku.
+    """
+
+    def __init__(self):
+        """
+        Inicjalizuje szynę bez subskrybentów.
+        """
+        self._subskrybenci: List[Tuple[Subskrybent, Optional[Set[str]]]] = []
+        self._watek = threading.local()
+
+    def subskrybuj(self, subskrybent: Subskrybent,
+                   typy: Optional[Iterable[str]] = None) -> None:
+        """
+        Rejestruje funkcję otrzymującą zdarzenia.
+
+        Args:
+            subskrybent: Funkcja wywoływana z listą zdarzeń.
+            typy: Typy zdarzeń do dostarczania lub None dla wszystkich.
+        """
+        self._subskrybenci = self._subskrybenci + [
+            (subskrybent, None if typy is None else set(typy))]
+
+    def anuluj_subskrypcje(self, subskrybent: Subskrybent) -> None:
+        """
+        Wyrejestrowuje funkcję subskrybenta.
+
+        Args:
+            subskrybent: Wcześniej zarejestrowana funkcja.
+
+        Raises:
+            ValueError: Gdy funkcja nie była zarejestrowana.
+        """
+        pozostali = [wpis for wpis in self._subskrybenci
+                     if wpis[0] != subskrybent]
+        if len(pozostali) == len(self._subskrybenci):
+            raise ValueError("Subskrybent nie był zarejestrowany")
+        self._subskrybenci = pozostali
+
+    def publikuj(self, zdarzenie: Zdarzenie) -> None:
+        """
+        Publikuje zdarzenie (w partii - odkłada je do jej końca).
+
+        Args:
+            zdarzenie: Zdarzenie do opublikowania.
+        """
+        if not self._subskrybenci:
+            return
+        oczekujace = getattr(self._watek, "oczekujace", None)
+        if oczekujace is None:
+            self._dostarcz([zdarzenie])
+            return
+
+        klucz = (zdarzenie.typ, zdarzenie.nazwa, zdarzenie.pole)
+        poprzednie = oczekujace.get(klucz)
+        if poprzednie is not None:
+            zdarzenie = zdarzenie._replace(
+                stara_wartosc=poprzednie.stara_wartosc)
+        oczekujace[klucz] = zdarzenie
+
+    @contextmanager
+    def partia(self) -> Iterator[None]:
+        """
+        Zbiera zdarzenia publikowane w bloku i dostarcza je po jego końcu.
+
+        Partie można zagnieżdżać; zdarzenia są dostarczane po zakończeniu
+        najbardziej zewnętrznej. Zdarzenia są dostarczane także wtedy,
+        gdy blok zakończy się wyjątkiem (zmiany wykonane przed nim już
+        nastąpiły).
+        """
+        watek = self._watek
+        if getattr(watek, "oczekujace", None) is not None:
+            yield
+            return
+
+        watek.oczekujace = {}
+        try:
+            yield
+        finally:
+            oczekujace: Dict[Tuple[str, str, str], Zdarzenie] = \
+                watek.oczekujace
+            watek.oczekujace = None
+            zdarzenia = [zdarzenie for zdarzenie in oczekujace.values()
+                         if zdarzenie.stara_wartosc != zdarzenie.nowa_wartosc]
+            if zdarzenia:
+                self._dostarcz(zdarzenia)
+
+    def _dostarcz(self, zdarzenia: List[Zdarzenie]) -> None:
+        """Wywołuje każdego subskrybenta raz z pasującymi zdarzeniami."""
+        for subskrybent, typy in self._subskrybenci:
+            if typy is None:
+                subskrybent(zdarzenia)
+                continue
+            pasujace = [zdarzenie for zdarzenie in zdarzenia
+                        if zdarzenie.typ in typy]
+            if pasujace:
+                subskrybent(pasujace)
+
+
+def partia_zdarzen(szyna: Optional[SzynaZdarzen]) -> ContextManager:
+    """
+    Zwraca partię zdarzeń szyny lub pusty kontekst, gdy szyny nie ma.
+
+    Args:
+        szyna: Szyna zdarzeń lub None.
+
+    Returns:
+        Menedżer kontekstu partii.
+    """
+    if szyna is None:
+        return nullcontext()
+    return szyna.partia()
@@ -1,470 +1,1955 @@
-"""
-Moduł zarządzający stanem magazynowym restauracji.
-Zawiera klasy do obsługi składników, przepisów i zarządzania zapasami.
-
-Kod aplikacji z modułu inventory_control.py wygenerwoany przy użyciu Claude.ai
-model Claude Sonnet 3.7
-"""
-
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import uuid
-
-
-class Skladnik:
-    """
-    Klasa reprezentująca składnik używany w restauracji.
-
-    Atrybuty:
-        nazwa (str): Unikalna nazwa składnika.
-        jednostka (str): Jednostka miary (np. kg, l, szt).
-        ilosc_na_stanie (float): Aktualna ilość na stanie.
-        min_ilosc (float): Minimalna wymagana ilość.
-        cena_jednostkowa (float): Cena za jednostkę.
-        data_waznosci (Optional[datetime]): Data ważności składnika.
-        dostawca (str): Nazwa dostawcy.
-        kategoria (str): Kategoria składnika (np. mięso, warzywa).
-        lokalizacja (str): Miejsce przechowywania w magazynie.
-    """
-
-    def __init__(self, nazwa: str, jednostka: str, ilosc_na_stanie: float = 0,
-                 min_ilosc: float = 10, cena_jednostkowa: float = 0,
-                 data_waznosci: Optional[datetime] = None,
-                 dostawca: str = "", kategoria: str = "",
-                 lokalizacja: str = ""):
-        """
-        Inicjalizuje nowy składnik.
-
-        Args:
-            nazwa: Unikalna nazwa składnika.
-            jednostka: Jednostka miary.
-            ilosc_na_stanie: Aktualna ilość na stanie.
-            min_ilosc: Minimalna wymagana ilość.
-            cena_jednostkowa: Cena za jednostkę.
-            data_waznosci: Data ważności składnika.
-            dostawca: Nazwa dostawcy.
-            kategoria: Kategoria składnika.
-            lokalizacja: Miejsce przechowywania w magazynie.
-
-        Raises:
-            ValueError: Gdy ilość na stanie, minimalna ilość
-            lub cena jednostkowa są ujemne.
-        """
-        if ilosc_na_stanie < 0:
-            raise ValueError("Ilość na stanie nie może być ujemna")
-        if min_ilosc < 0:
-            raise ValueError("Minimalna ilość nie może być ujemna")
-        if cena_jednostkowa < 0:
-            raise ValueError("Cena jednostkowa nie może być ujemna")
-
-        self.nazwa = nazwa
-        self.jednostka = jednostka
-        self.ilosc_na_stanie = ilosc_na_stanie
-        self.min_ilosc = min_ilosc
-        self.cena_jednostkowa = cena_jednostkowa
-        self.data_waznosci = data_waznosci
-        self.dostawca = dostawca
-        self.kategoria = kategoria
-        self.lokalizacja = lokalizacja
-        self.historia_zmian = []  # [(datetime, operacja, ilosc)]
-
-        # Zapisz początkowy stan
-        if ilosc_na_stanie > 0:
-            self.historia_zmian.append((datetime.now(),
-                                        "początkowy stan", ilosc_na_stanie))
-
-    def dodaj_zapas(self, ilosc: float, dostawa_id: str = "") -> None:
-        """
-        Dodaje zapas składnika.
-
-        Args:
-            ilosc: Ilość do dodania.
-            dostawa_id: Identyfikator dostawy.
-
-        Raises:
-            ValueError: Gdy ilość jest ujemna lub zero.
-        """
-        if ilosc <= 0:
-            raise ValueError("Ilość musi być większa od zera")
-
-        self.ilosc_na_stanie += ilosc
-        operacja = f"dostawa {dostawa_id}" if dostawa_id else "dostawa"
-        self.historia_zmian.append((datetime.now(), operacja, ilosc))
-
-    def zuzyj(self, ilosc: float, cel: str = "") -> None:
-        """
-        Zużywa składnik.
-
-        Args:
-            ilosc: Ilość do zużycia.
-            cel: Cel zużycia.
-
-        Raises:
-            ValueError: Gdy ilość jest ujemna lub zero.
-            ValueError: Gdy na stanie jest za mało składnika.
-        """
-        if ilosc <= 0:
-            raise ValueError("Ilość musi być większa od zera")
-
-        if ilosc > self.ilosc_na_stanie:
-            raise ValueError(f"Za mało składnika {self.nazwa} na stanie")
-
-        self.ilosc_na_stanie -= ilosc
-        operacja = f"zużycie {cel}" if cel else "zużycie"
-        self.historia_zmian.append((datetime.now(), operacja, -ilosc))
-
-    def zmien_cene(self, nowa_cena: float) -> None:
-        """
-        Zmienia cenę jednostkową składnika.
-
-        Args:
-            nowa_cena: Nowa cena jednostkowa.
-
-        Raises:
-            ValueError: Gdy nowa cena jest ujemna.
-        """
-        if nowa_cena < 0:
-            raise ValueError("Cena nie może być ujemna")
-
-        self.cena_jednostkowa = nowa_cena
-
-    def ustaw_date_waznosci(self, data_waznosci: datetime) -> None:
-        """
-        Ustawia datę ważności składnika.
-
-        Args:
-            data_waznosci: Nowa data ważności.
-
-        Raises:
-            ValueError: Gdy data ważności jest w przeszłości.
-        """
-        if data_waznosci < datetime.now():
-            raise ValueError("Data ważności nie może być w przeszłości")
-
-        self.data_waznosci = data_waznosci
-
-    def czy_wymaga_zamowienia(self) -> bool:
-        """
-        Sprawdza czy składnik wymaga zamówienia.
-
-        Returns:
-            True jeśli ilość na stanie jest mniejsza
-             od minimalnej wymaganej ilości.
-        """
-        return self.ilosc_na_stanie < self.min_ilosc
-
-    def czy_przeterminowany(self) -> bool:
-        """
-        Sprawdza czy składnik jest przeterminowany.
-
-        Returns:
-            True jeśli składnik jest przeterminowany, False jeśli nie lub
-            data ważności nie jest ustawiona.
-        """
-        if self.data_waznosci is None:
-            return False
-
-        return datetime.now() > self.data_waznosci
-
-    def wartosc_zapasu(self) -> float:
-        """
-        Oblicza wartość zapasu składnika.
-
-        Returns:
-            Wartość zapasu (ilość * cena jednostkowa).
-        """
-        return round(self.ilosc_na_stanie * self.cena_jednostkowa, 2)
-
-
-class ZarzadzanieSkladnikami:
-    """
-    Klasa zarządzająca wszystkimi składnikami i przepisami w restauracji.
-
-    Atrybuty:
-        skladniki (Dict[str, Skladnik]): Słownik składników.
-        przepisy (Dict[str, Dict[str, float]]): Słownik przepisów.
-        dostawy (List[Dict]): Lista wszystkich dostaw.
-        kategorie_skladnikow (Set[str]): Zbiór wszystkich kategorii składników.
-        dostawcy (Set[str]): Zbiór wszystkich dostawców.
-    """
-
-    def __init__(self):
-        """
-        Inicjalizuje nowy system zarządzania składnikami.
-        """
-        self.skladniki = {}
-        self.przepisy = {}  # nazwa_dania: {nazwa_skladnika: ilosc, ...}
-        self.dostawy = []
-        self.kategorie_skladnikow = set()
-        self.dostawcy = set()
-
-    def dodaj_skladnik(self, skladnik: Skladnik):
-        """
-        Dodaje składnik do systemu.
-
-        Args:
-            skladnik: Obiekt składnika do dodania.
-
-        Raises:
-            ValueError: Gdy składnik o takiej nazwie już istnieje.
-        """
-        if skladnik.nazwa in self.skladniki:
-            raise ValueError(f"Składnik {skladnik.nazwa} już istnieje")
-        self.skladniki[skladnik.nazwa] = skladnik
-
-        if skladnik.kategoria:
-            self.kategorie_skladnikow.add(skladnik.kategoria)
-
-        if skladnik.dostawca:
-            self.dostawcy.add(skladnik.dostawca)
-
-    def usun_skladnik(self, nazwa: str):
-        """
-        Usuwa składnik z systemu.
-
-        Args:
-            nazwa: Nazwa składnika do usunięcia.
-
-        Raises:
-            KeyError: Gdy składnik o podanej nazwie nie istnieje.
-            ValueError: Gdy składnik jest używany w przepisach.
-        """
-        if nazwa not in self.skladniki:
-            raise KeyError(f"Składnik {nazwa} nie istnieje")
-
-        # Sprawdź czy składnik jest używany w przepisach
-        for nazwa_dania, skladniki in self.przepisy.items():
-            if nazwa in skladniki:
-                raise ValueError(
-                    f"Nie można usunąć składnika {nazwa}, "
-                    f"jest używany w przepisie {nazwa_dania}"
-                )
-
-        kategoria = self.skladniki[nazwa].kategoria
-        dostawca = self.skladniki[nazwa].dostawca
-
-        del self.skladniki[nazwa]
-
-        # Aktualizuj kategorie i dostawców
-        if kategoria:
-            if not any(s.kategoria == kategoria
-                       for s in self.skladniki.values()):
-                self.kategorie_skladnikow.remove(kategoria)
-
-        if dostawca:
-            if not any(s.dostawca == dostawca
-                       for s in self.skladniki.values()):
-                self.dostawcy.remove(dostawca)
-
-    def dodaj_przepis(self, nazwa_dania: str,
-                      skladniki_ilosci: Dict[str, float]):
-        """
-        Dodaje przepis do systemu.
-
-        Args:
-            nazwa_dania: Nazwa dania.
-            skladniki_ilosci: Słownik z nazwami składników i ich ilościami.
-
-        Raises:
-            ValueError: Gdy przepis jest pusty.
-            KeyError: Gdy jakiś składnik nie istnieje.
-            ValueError: Gdy przepis o takiej nazwie już istnieje.
-        """
-        if not skladniki_ilosci:
-            raise ValueError("Przepis musi zawierać "
-                             "przynajmniej jeden składnik")
-
-        for skladnik_nazwa, ilosc in skladniki_ilosci.items():
-            if skladnik_nazwa not in self.skladniki:
-                raise KeyError(f"Składnik {skladnik_nazwa} nie istnieje")
-
-            if ilosc <= 0:
-                raise ValueError(
-                    f"Ilość składnika {skladnik_nazwa} "
-                    f"musi być większa od zera"
-                )
-
-        if nazwa_dania in self.przepisy:
-            raise ValueError(f"Przepis dla dania {nazwa_dania} już istnieje")
-
-        self.przepisy[nazwa_dania] = skladniki_ilosci.copy()
-
-    def aktualizuj_przepis(self, nazwa_dania: str,
-                           skladniki_ilosci: Dict[str, float]):
-        """
-        Aktualizuje istniejący przepis.
-
-        Args:
-            nazwa_dania: Nazwa dania.
-            skladniki_ilosci: Słownik z nazwami składników i ich ilościami.
-
-        Raises:
-            KeyError: Gdy przepis o podanej nazwie nie istnieje.
-            ValueError: Gdy nowy przepis jest pusty.
-            KeyError: Gdy jakiś składnik nie istnieje.
-        """
-        if nazwa_dania not in self.przepisy:
-            raise KeyError(f"Przepis dla dania {nazwa_dania} nie istnieje")
-
-        if not skladniki_ilosci:
-            raise ValueError("Przepis musi zawierać "
-                             "przynajmniej jeden składnik")
-
-        for skladnik_nazwa, ilosc in skladniki_ilosci.items():
-            if skladnik_nazwa not in self.skladniki:
-                raise KeyError(f"Składnik {skladnik_nazwa} nie istnieje")
-
-            if ilosc <= 0:
-                raise ValueError(
-                    f"Ilość składnika {skladnik_nazwa} "
-                    f"musi być większa od zera"
-                )
-
-        self.przepisy[nazwa_dania] = skladniki_ilosci.copy()
-
-    def usun_przepis(self, nazwa_dania: str):
-        """
-        Usuwa przepis z systemu.
-
-        Args:
-            nazwa_dania: Nazwa dania.
-
-        Raises:
-            KeyError: Gdy przepis o podanej nazwie nie istnieje.
-        """
-        if nazwa_dania not in self.przepisy:
-            raise KeyError(f"Przepis dla dania {nazwa_dania} nie istnieje")
-
-        del self.przepisy[nazwa_dania]
-
-    def sprawdz_mozliwosc_przygotowania(self, nazwa_dania: str,
-                                        ilosc: int = 1) -> bool:
-        """
-        Sprawdza możliwość przygotowania dania w podanej ilości.
-
-        Args:
-            nazwa_dania: Nazwa dania.
-            ilosc: Liczba porcji.
-
-        Returns:
-            True jeśli możliwe jest przygotowanie, False w przeciwnym przypadku
-        Raises:
-            KeyError: Gdy przepis o podanej nazwie nie istnieje.
-        """
-        if nazwa_dania not in self.przepisy:
-            raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
-
-        for skladnik_nazwa, potrzebna_ilosc in \
-                self.przepisy[nazwa_dania].items():
-            if skladnik_nazwa not in self.skladniki:
-                return False
-            if self.skladniki[skladnik_nazwa].ilosc_na_stanie \
-                    < potrzebna_ilosc * ilosc:
-                return False
-        return True
-
-    def przygotuj_danie(self, nazwa_dania: str, ilosc: int = 1):
-        """
-        Przygotowuje danie, zużywając odpowiednie składniki.
-
-        Args:
-            nazwa_dania: Nazwa dania.
-            ilosc: Liczba porcji.
-
-        Raises:
-            KeyError: Gdy przepis o podanej nazwie nie istnieje.
-            ValueError: Gdy nie ma wystarczającej ilości składników.
-        """
-        if not self.sprawdz_mozliwosc_przygotowania(nazwa_dania, ilosc):
-            raise ValueError(
-                f"Brak wystarczającej ilości składników "
-                f"do przygotowania {nazwa_dania}"
-            )
-
-        for skladnik_nazwa, potrzebna_ilosc in self.przepisy[nazwa_dania].\
-                items():
-            self.skladniki[skladnik_nazwa].zuzyj(
-                potrzebna_ilosc * ilosc, nazwa_dania
-            )
-
-    def zarejestruj_dostawe(
-        self, dostawca: str, pozycje: Dict[str, Tuple[float, float]],
-            uwagi: str = "") -> str:
-        """
-        Rejestruje nową dostawę składników.
-
-        Args:
-            dostawca: Nazwa dostawcy.
-            pozycje: Słownik z nazwami składników i
-            krotkami (ilość, cena jednostkowa).
-            uwagi: Dodatkowe uwagi do dostawy.
-
-        Returns:
-            ID dostawy.
-
-        Raises:
-            KeyError: Gdy jakiś składnik nie istnieje.
-        """
-        dostawa_id = str(uuid.uuid4())
-        czas_dostawy = datetime.now()
-
-        for skladnik_nazwa, (ilosc, cena) in pozycje.items():
-            if skladnik_nazwa not in self.skladniki:
-                raise KeyError(f"Składnik {skladnik_nazwa} nie istnieje")
-
-            # Aktualizuj stan składnika
-            self.skladniki[skladnik_nazwa].dodaj_zapas(ilosc, dostawa_id)
-
-            # Aktualizuj cenę jeśli podano
-            if cena > 0:
-                self.skladniki[skladnik_nazwa].zmien_cene(cena)
-
-        # Dodaj dostawcę jeśli nowy
-        self.dostawcy.add(dostawca)
-
-        # Zapisz dostawę
-        dostawa = {
-            "id": dostawa_id,
-            "dostawca": dostawca,
-            "czas_dostawy": czas_dostawy,
-            "pozycje": pozycje.copy(),
-            "uwagi": uwagi
-        }
-
-        self.dostawy.append(dostawa)
-        return dostawa_id
-
-    def lista_do_zamowienia(self) -> List[Skladnik]:
-        """
-        Tworzy listę składników do zamówienia.
-
-        Returns:
-            Lista składników, których ilość jest poniżej minimalnej.
-        """
-        return [
-            skladnik for skladnik in self.skladniki.values()
-            if skladnik.czy_wymaga_zamowienia()
-        ]
-
-    def znajdz_przeterminowane(self) -> List[Skladnik]:
-        """
-        Znajduje wszystkie przeterminowane składniki.
-
-        Returns:
-            Lista przeterminowanych składników.
-        """
-        return [
-            skladnik for skladnik in self.skladniki.values()
-            if skladnik.czy_przeterminowany()
-        ]
-
-    def oblicz_wartosc_magazynu(self) -> float:
-        """
-        Oblicza całkowitą wartość magazynu.
-
-        Returns:
-            Całkowita wartość wszystkich składników w magazynie.
-        """
-        return sum(
-            skladnik.wartosc_zapasu() for skladnik in self.skladniki.values()
-        )
+"""
+Moduł zarządzający stanem magazynowym restauracji.
+Zawiera klasy do obsługi składników, przepisów i zarządzania zapasami.
+
+Kod aplikacji z modułu inventory_control.py wygenerwoany przy użyciu Claude.ai
+model Claude Sonnet 3.7
+"""
+
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Set, Tuple)
+import math
+import threading
+import uuid
+
+from .delivery_journal import DziennikDostaw
+from .events import (POLE_DODANO, POLE_USUNIETO, TYP_PRZEPIS, TYP_SKLADNIK,
+                     SzynaZdarzen, Zdarzenie, partia_zdarzen)
+from .stock_ledger import RejestrRuchow, WidokHistorii
+
+# Mnożniki przeliczające jednostkę (klucz) na jednostkę bazową składnika
+PRZELICZNIKI_JEDNOSTEK: Dict[Tuple[str, str], float] = {
+    ("mg", "kg"): 0.000001,
+    ("g", "kg"): 0.001,
+    ("dag", "kg"): 0.01,
+    ("mg", "g"): 0.001,
+    ("dag", "g"): 10,
+    ("kg", "g"): 1000,
+    ("ml", "l"): 0.001,
+    ("cl", "l"): 0.01,
+    ("dl", "l"): 0.1,
+    ("cl", "ml"): 10,
+    ("dl", "ml"): 100,
+    ("l", "ml"): 1000,
+}
+
+
+def przelicz_jednostke(ilosc: float, jednostka: str,
+                       jednostka_bazowa: str) -> float:
+    """
+    Przelicza ilość z podanej jednostki na jednostkę bazową.
+
+    Args:
+        ilosc: Ilość w jednostce źródłowej.
+        jednostka: Jednostka źródłowa (np. "g").
+        jednostka_bazowa: Jednostka docelowa (np. "kg").
+
+    Returns:
+        Ilość w jednostce bazowej.
+
+    Raises:
+        ValueError: Gdy nie jest znany przelicznik między jednostkami.
+    """
+    if jednostka == jednostka_bazowa:
+        return ilosc
+    mnoznik = PRZELICZNIKI_JEDNOSTEK.get((jednostka, jednostka_bazowa))
+    if mnoznik is None:
+        raise ValueError(
+            f"Nie można przeliczyć jednostki {jednostka} "
+            f"na {jednostka_bazowa}"
+        )
+    return ilosc * mnoznik
+
+
+class Partia:
+    """
+    Klasa reprezentująca partię składnika z jednej dostawy.
+
+    Atrybuty:
+        ilosc (float): Pozostała ilość w partii.
+        data_waznosci (Optional[datetime]): Data ważności partii lub None,
+            gdy obowiązuje data ważności ustawiona dla składnika.
+        dostawa_id (str): Identyfikator dostawy, z której pochodzi partia.
+    """
+
+    __slots__ = ("ilosc", "data_waznosci", "dostawa_id")
+
+    def __init__(self, ilosc: float,
+                 data_waznosci: Optional[datetime] = None,
+                 dostawa_id: str = ""):
+        """
+        Inicjalizuje nową partię.
+
+        Args:
+            ilosc: Ilość w partii.
+            data_waznosci: Data ważności partii.
+            dostawa_id: Identyfikator dostawy.
+        """
+        self.ilosc = ilosc
+        self.data_waznosci = data_waznosci
+        self.dostawa_id = dostawa_id
+
+    def __repr__(self) -> str:
+        """Zwraca czytelną reprezentację partii."""
+        return (f"Partia({self.ilosc!r}, {self.data_waznosci!r}, "
+                f"{self.dostawa_id!r})")
+
+
+class Skladnik:
+    """
+    Klasa reprezentująca składnik używany w restauracji.
+
+    Zapas jest przechowywany w partiach. Partie z własną datą ważności
+    tworzą kolejkę uporządkowaną według tej daty, a partie bez daty
+    (np. stan początkowy) dzielą datę ważności ustawioną dla składnika.
+    Zużycie pobiera najpierw z partii o najwcześniejszej dacie ważności
+    (FEFO), a ilosc_na_stanie i data_waznosci są wartościami pochodnymi.
+
+    Atrybuty:
+        nazwa (str): Unikalna nazwa składnika.
+        jednostka (str): Jednostka miary (np. kg, l, szt).
+        ilosc_na_stanie (float): Aktualna ilość na stanie.
+        min_ilosc (float): Minimalna wymagana ilość.
+        cena_jednostkowa (float): Cena za jednostkę.
+        data_waznosci (Optional[datetime]): Najwcześniejsza data ważności
+            zapasu (lub data ustawiona dla składnika, gdy brak partii).
+        dostawca (str): Nazwa dostawcy.
+        kategoria (str): Kategoria składnika (np. mięso, warzywa).
+        lokalizacja (str): Miejsce przechowywania w magazynie.
+        rejestr (RejestrRuchow): Rejestr ruchów magazynowych (własny
+            składnika albo wspólny, np. systemu zarządzania).
+        historia_zmian (WidokHistorii): Historia ruchów składnika
+            w postaci krotek (datetime, operacja, ilosc).
+    """
+
+    def __init__(self, nazwa: str, jednostka: str, ilosc_na_stanie: float = 0,
+                 min_ilosc: float = 10, cena_jednostkowa: float = 0,
+                 data_waznosci: Optional[datetime] = None,
+                 dostawca: str = "", kategoria: str = "",
+                 lokalizacja: str = "",
+                 rejestr: Optional[RejestrRuchow] = None):
+        """
+        Inicjalizuje nowy składnik.
+
+        Args:
+            nazwa: Unikalna nazwa składnika.
+            jednostka: Jednostka miary.
+            ilosc_na_stanie: Aktualna ilość na stanie.
+            min_ilosc: Minimalna wymagana ilość.
+            cena_jednostkowa: Cena za jednostkę.
+            data_waznosci: Data ważności składnika.
+            dostawca: Nazwa dostawcy.
+            kategoria: Kategoria składnika.
+            lokalizacja: Miejsce przechowywania w magazynie.
+            rejestr: Rejestr ruchów (domyślnie własny rejestr składnika,
+            przenoszony do rejestru systemu przy dodaniu składnika).
+
+        Raises:
+            ValueError: Gdy ilość na stanie, minimalna ilość
+            lub cena jednostkowa są ujemne.
+        """
+        if ilosc_na_stanie < 0:
+            raise ValueError("Ilość na stanie nie może być ujemna")
+        if min_ilosc < 0:
+            raise ValueError("Minimalna ilość nie może być ujemna")
+        if cena_jednostkowa < 0:
+            raise ValueError("Cena jednostkowa nie może być ujemna")
+
+        # Funkcje wywoływane jako (skladnik, pole, stara_wartosc)
+        self._obserwatorzy: List[Callable[["Skladnik", str, Any], None]] = []
+        # Partie z datą ważności (rosnąco) i partie bez własnej daty
+        self._partie: deque = deque()
+        self._partie_bez_daty: deque = deque()
+        self._ilosc_na_stanie = 0
+        self._data_waznosci = None
+        self.nazwa = nazwa
+        self.jednostka = jednostka
+        self.ilosc_na_stanie = ilosc_na_stanie
+        self.min_ilosc = min_ilosc
+        self.cena_jednostkowa = cena_jednostkowa
+        self.data_waznosci = data_waznosci
+        self.dostawca = dostawca
+        self.kategoria = kategoria
+        self.lokalizacja = lokalizacja
+        self._wlasny_rejestr = rejestr is None
+        self.rejestr = RejestrRuchow() if rejestr is None else rejestr
+        self._kod = self.rejestr.zarejestruj_skladnik()
+        self._historia = WidokHistorii(self.rejestr, self._kod)
+
+        # Zapisz początkowy stan
+        if ilosc_na_stanie > 0:
+            self.rejestr.dopisz(self._kod, datetime.now(),
+                                "początkowy stan", ilosc_na_stanie)
+
+    @classmethod
+    def odtworz(cls, nazwa: str, jednostka: str, ilosc_na_stanie: float,
+                min_ilosc: float, cena_jednostkowa: float,
+                data_waznosci: Optional[datetime], dostawca: str,
+                kategoria: str, lokalizacja: str, partie: List[Partia],
+                rejestr: RejestrRuchow, kod: int) -> "Skladnik":
+        """
+        Odtwarza zapisany składnik bez walidacji i bez wpisów w historii.
+
+        Historia pozostaje w podanym rejestrze pod istniejącym kodem.
+
+        Args:
+            nazwa: Unikalna nazwa składnika.
+            jednostka: Jednostka miary.
+            ilosc_na_stanie: Ilość na stanie.
+            min_ilosc: Minimalna wymagana ilość.
+            cena_jednostkowa: Cena za jednostkę.
+            data_waznosci: Data ważności ustawiona dla składnika
+            (obowiązuje partie bez własnej daty).
+            dostawca: Nazwa dostawcy.
+            kategoria: Kategoria składnika.
+            lokalizacja: Miejsce przechowywania w magazynie.
+            partie: Partie w kolejności zużycia.
+            rejestr: Rejestr ruchów zawierający historię składnika.
+            kod: Kod składnika w rejestrze.
+
+        Returns:
+            Odtworzony składnik.
+        """
+        skladnik = cls.__new__(cls)
+        skladnik.__dict__.update(
+            _obserwatorzy=[],
+            _wlasny_rejestr=False,
+            _partie=deque(p for p in partie if p.data_waznosci is not None),
+            _partie_bez_daty=deque(p for p in partie
+                                   if p.data_waznosci is None),
+            _ilosc_na_stanie=ilosc_na_stanie,
+            _data_waznosci=data_waznosci,
+            _min_ilosc=min_ilosc,
+            _cena_jednostkowa=cena_jednostkowa,
+            nazwa=nazwa,
+            jednostka=jednostka,
+            _dostawca=dostawca,
+            _kategoria=kategoria,
+            lokalizacja=lokalizacja,
+            rejestr=rejestr,
+            _kod=kod,
+            _historia=WidokHistorii(rejestr, kod),
+        )
+        return skladnik
+
+    @property
+    def cena_jednostkowa(self) -> float:
+        """Cena za jednostkę."""
+        return self._cena_jednostkowa
+
+    @cena_jednostkowa.setter
+    def cena_jednostkowa(self, wartosc: float) -> None:
+        stara = self.__dict__.get("_cena_jednostkowa")
+        self._cena_jednostkowa = wartosc
+        self._powiadom("cena_jednostkowa", stara)
+
+    @property
+    def dostawca(self) -> str:
+        """Nazwa dostawcy."""
+        return self._dostawca
+
+    @dostawca.setter
+    def dostawca(self, wartosc: str) -> None:
+        stara = self.__dict__.get("_dostawca")
+        self._dostawca = wartosc
+        self._powiadom("dostawca", stara)
+
+    @property
+    def kategoria(self) -> str:
+        """Kategoria składnika."""
+        return self._kategoria
+
+    @kategoria.setter
+    def kategoria(self, wartosc: str) -> None:
+        stara = self.__dict__.get("_kategoria")
+        self._kategoria = wartosc
+        self._powiadom("kategoria", stara)
+
+    @property
+    def min_ilosc(self) -> float:
+        """Minimalna wymagana ilość."""
+        return self._min_ilosc
+
+    @min_ilosc.setter
+    def min_ilosc(self, wartosc: float) -> None:
+        stara = self.__dict__.get("_min_ilosc")
+        self._min_ilosc = wartosc
+        self._powiadom("min_ilosc", stara)
+
+    @property
+    def data_waznosci(self) -> Optional[datetime]:
+        """Najwcześniejsza data ważności zapasu składnika."""
+        if self._partie:
+            najwczesniejsza = self._partie[0].data_waznosci
+            if self._partie_bez_daty and self._data_waznosci is not None \
+                    and self._data_waznosci < najwczesniejsza:
+                return self._data_waznosci
+            return najwczesniejsza
+        return self._data_waznosci
+
+    @data_waznosci.setter
+    def data_waznosci(self, wartosc: Optional[datetime]) -> None:
+        stara = self.data_waznosci
+        self._data_waznosci = wartosc
+        self._powiadom_o_dacie(stara)
+
+    @property
+    def data_waznosci_skladnika(self) -> Optional[datetime]:
+        """Data ważności ustawiona dla składnika (bez uwzględnienia partii)."""
+        return self._data_waznosci
+
+    @property
+    def partie(self) -> List[Partia]:
+        """Partie z niezerową ilością w kolejności zużycia (FEFO)."""
+        datowane = list(self._partie)
+        if self._data_waznosci is None:
+            return datowane + list(self._partie_bez_daty)
+        granica = 0
+        while granica < len(datowane) \
+                and datowane[granica].data_waznosci <= self._data_waznosci:
+            granica += 1
+        return datowane[:granica] + list(self._partie_bez_daty) \
+            + datowane[granica:]
+
+    @property
+    def kod(self) -> int:
+        """Kod składnika w rejestrze ruchów."""
+        return self._kod
+
+    @property
+    def historia_zmian(self) -> WidokHistorii:
+        """Historia ruchów składnika dekodowana leniwie z rejestru."""
+        return self._historia
+
+    def przenies_do_rejestru(self, rejestr: RejestrRuchow) -> None:
+        """
+        Przenosi historię składnika z jego własnego rejestru do podanego.
+
+        Składnik korzystający już ze wspólnego rejestru (podanego przy
+        tworzeniu lub wcześniej przeniesiony) pozostaje bez zmian.
+
+        Args:
+            rejestr: Rejestr, do którego trafia historia składnika.
+        """
+        if not self._wlasny_rejestr or rejestr is self.rejestr:
+            return
+
+        stary, stary_kod = self.rejestr, self._kod
+        kod = rejestr.zarejestruj_skladnik()
+        for wiersz in stary.wiersze(stary_kod):
+            rejestr.dopisz(kod, stary.czas(wiersz), stary.operacja(wiersz),
+                           stary.ilosci[wiersz], stary.referencja(wiersz))
+        self.rejestr = rejestr
+        self._kod = kod
+        self._historia = WidokHistorii(rejestr, kod)
+        self._wlasny_rejestr = False
+
+    @property
+    def ilosc_na_stanie(self) -> float:
+        """Aktualna ilość na stanie."""
+        return self._ilosc_na_stanie
+
+    @ilosc_na_stanie.setter
+    def ilosc_na_stanie(self, wartosc: float) -> None:
+        stara_data = self.data_waznosci
+        roznica = wartosc - self._ilosc_na_stanie
+        if roznica > 0:
+            self._partie_bez_daty.append(Partia(roznica))
+        elif roznica < 0:
+            self._pobierz_z_partii(-roznica)
+        self._zmien_ilosc(wartosc)
+        self._powiadom_o_dacie(stara_data)
+
+    def _zmien_ilosc(self, wartosc: float) -> None:
+        """Ustawia ilość na stanie (bez zmian w partiach) i powiadamia."""
+        stara = self._ilosc_na_stanie
+        self._ilosc_na_stanie = wartosc
+        self._powiadom("ilosc_na_stanie", stara)
+
+    def _powiadom_o_dacie(self, stara_data: Optional[datetime]) -> None:
+        """Powiadamia obserwatorów, jeśli data ważności się zmieniła."""
+        if self.data_waznosci != stara_data:
+            self._powiadom("data_waznosci", stara_data)
+
+    def _dodaj_partie(self, partia: Partia) -> None:
+        """
+        Wstawia partię do kolejki FEFO.
+
+        Partie dostarczane zwykle mają datę nie wcześniejszą niż
+        poprzednie, więc typowe wstawienie to dopisanie na końcu.
+        """
+        if partia.data_waznosci is None:
+            self._partie_bez_daty.append(partia)
+            return
+
+        indeks = len(self._partie)
+        while indeks > 0 and \
+                self._partie[indeks - 1].data_waznosci > partia.data_waznosci:
+            indeks -= 1
+        self._partie.insert(indeks, partia)
+
+    def _najblizsza_kolejka(self) -> Optional[deque]:
+        """Zwraca kolejkę, której pierwsza partia wygasa najwcześniej."""
+        if not self._partie:
+            return self._partie_bez_daty or None
+        if self._partie_bez_daty and self._data_waznosci is not None \
+                and self._data_waznosci < self._partie[0].data_waznosci:
+            return self._partie_bez_daty
+        return self._partie
+
+    def _pobierz_z_partii(self, ilosc: float) -> None:
+        """Pobiera ilość z partii w kolejności FEFO."""
+        while ilosc > 0:
+            kolejka = self._najblizsza_kolejka()
+            if kolejka is None:
+                return
+            partia = kolejka[0]
+            if partia.ilosc > ilosc:
+                partia.ilosc -= ilosc
+                return
+            ilosc -= partia.ilosc
+            partia.ilosc = 0
+            kolejka.popleft()
+
+    def dodaj_obserwatora(
+            self, obserwator: Callable[["Skladnik", str, Any], None]) -> None:
+        """
+        Rejestruje funkcję wywoływaną po zmianie stanu składnika.
+
+        Args:
+            obserwator: Funkcja wywoływana jako
+            obserwator(skladnik, pole, stara_wartosc).
+        """
+        self._obserwatorzy.append(obserwator)
+
+    def usun_obserwatora(
+            self, obserwator: Callable[["Skladnik", str, Any], None]) -> None:
+        """
+        Wyrejestrowuje funkcję obserwatora.
+
+        Args:
+            obserwator: Wcześniej zarejestrowana funkcja.
+
+        Raises:
+            ValueError: Gdy funkcja nie była zarejestrowana.
+        """
+        self._obserwatorzy.remove(obserwator)
+
+    def _powiadom(self, pole: str, stara_wartosc: Any) -> None:
+        """Powiadamia obserwatorów o zmianie pola."""
+        for obserwator in self._obserwatorzy:
+            obserwator(self, pole, stara_wartosc)
+
+    def dodaj_zapas(self, ilosc: float, dostawa_id: str = "",
+                    data_waznosci: Optional[datetime] = None,
+                    czas: Optional[datetime] = None) -> None:
+        """
+        Dodaje zapas składnika jako nową partię.
+
+        Args:
+            ilosc: Ilość do dodania.
+            dostawa_id: Identyfikator dostawy.
+            data_waznosci: Data ważności partii (None - obowiązuje
+            data ważności składnika).
+            czas: Czas operacji w historii (domyślnie bieżący czas).
+
+        Raises:
+            ValueError: Gdy ilość jest ujemna lub zero.
+        """
+        if ilosc <= 0:
+            raise ValueError("Ilość musi być większa od zera")
+
+        stara_data = self.data_waznosci
+        self._dodaj_partie(Partia(ilosc, data_waznosci, dostawa_id))
+        self._zmien_ilosc(self._ilosc_na_stanie + ilosc)
+        self.rejestr.dopisz(self._kod, czas or datetime.now(), "dostawa",
+                            ilosc, dostawa_id)
+        self._powiadom_o_dacie(stara_data)
+
+    def zuzyj(self, ilosc: float, cel: str = "",
+              czas: Optional[datetime] = None) -> None:
+        """
+        Zużywa składnik.
+
+        Args:
+            ilosc: Ilość do zużycia.
+            cel: Cel zużycia.
+            czas: Czas operacji w historii (domyślnie bieżący czas).
+
+        Raises:
+            ValueError: Gdy ilość jest ujemna lub zero.
+            ValueError: Gdy na stanie jest za mało składnika.
+        """
+        if ilosc <= 0:
+            raise ValueError("Ilość musi być większa od zera")
+
+        if ilosc > self.ilosc_na_stanie:
+            raise ValueError(f"Za mało składnika {self.nazwa} na stanie")
+
+        stara_data = self.data_waznosci
+        self._pobierz_z_partii(ilosc)
+        self._zmien_ilosc(self._ilosc_na_stanie - ilosc)
+        self.rejestr.dopisz(self._kod, czas or datetime.now(), "zużycie",
+                            -ilosc, cel)
+        self._powiadom_o_dacie(stara_data)
+
+    def koryguj_stan(self, ilosc_rzeczywista: float, powod: str = "",
+                     czas: Optional[datetime] = None) -> float:
+        """
+        Koryguje stan do ilości stwierdzonej przy inwentaryzacji.
+
+        Nadwyżka trafia do nowej partii bez własnej daty ważności,
+        a niedobór jest pobierany z partii w kolejności FEFO. Różnica
+        jest zapisywana w historii jako operacja "korekta".
+
+        Args:
+            ilosc_rzeczywista: Ilość faktycznie znajdująca się na stanie.
+            powod: Powód korekty (np. "inwentaryzacja").
+            czas: Czas operacji w historii (domyślnie bieżący czas).
+
+        Returns:
+            Różnica między nowym a poprzednim stanem (0, gdy stan
+            się nie zmienił).
+
+        Raises:
+            ValueError: Gdy ilość rzeczywista jest ujemna.
+        """
+        if ilosc_rzeczywista < 0:
+            raise ValueError("Ilość nie może być ujemna")
+
+        roznica = ilosc_rzeczywista - self._ilosc_na_stanie
+        if roznica == 0:
+            return 0.0
+
+        stara_data = self.data_waznosci
+        if roznica > 0:
+            self._dodaj_partie(Partia(roznica, None, powod))
+        else:
+            self._pobierz_z_partii(-roznica)
+        self._zmien_ilosc(ilosc_rzeczywista)
+        self.rejestr.dopisz(self._kod, czas or datetime.now(), "korekta",
+                            roznica, powod)
+        self._powiadom_o_dacie(stara_data)
+        return roznica
+
+    def spisz_przeterminowane(self, teraz: Optional[datetime] = None) -> float:
+        """
+        Spisuje ze stanu wszystkie partie przeterminowane.
+
+        Każda spisana partia trafia do historii jako operacja "spisanie"
+        z identyfikatorem swojej dostawy.
+
+        Args:
+            teraz: Chwila odniesienia (domyślnie bieżący czas).
+
+        Returns:
+            Łączna spisana ilość.
+        """
+        if teraz is None:
+            teraz = datetime.now()
+
+        stara_data = self.data_waznosci
+        spisano = 0.0
+        while True:
+            kolejka = self._najblizsza_kolejka()
+            if kolejka is None:
+                break
+            partia = kolejka[0]
+            data = partia.data_waznosci or self._data_waznosci
+            if data is None or not teraz > data:
+                break
+            kolejka.popleft()
+            if partia.ilosc > 0:
+                spisano += partia.ilosc
+                self.rejestr.dopisz(self._kod, teraz, "spisanie",
+                                    -partia.ilosc, partia.dostawa_id)
+                partia.ilosc = 0
+
+        if spisano:
+            self._zmien_ilosc(max(0, self._ilosc_na_stanie - spisano))
+        self._powiadom_o_dacie(stara_data)
+        return spisano
+
+    def zmien_cene(self, nowa_cena: float) -> None:
+        """
+        Zmienia cenę jednostkową składnika.
+
+        Args:
+            nowa_cena: Nowa cena jednostkowa.
+
+        Raises:
+            ValueError: Gdy nowa cena jest ujemna.
+        """
+        if nowa_cena < 0:
+            raise ValueError("Cena nie może być ujemna")
+
+        self.cena_jednostkowa = nowa_cena
+
+    def ustaw_date_waznosci(self, data_waznosci: datetime) -> None:
+        """
+        Ustawia datę ważności składnika.
+
+        Args:
+            data_waznosci: Nowa data ważności.
+
+        Raises:
+            ValueError: Gdy data ważności jest w przeszłości.
+        """
+        if data_waznosci < datetime.now():
+            raise ValueError("Data ważności nie może być w przeszłości")
+
+        self.data_waznosci = data_waznosci
+
+    def czy_wymaga_zamowienia(self) -> bool:
+        """
+        Sprawdza czy składnik wymaga zamówienia.
+
+        Returns:
+            True jeśli ilość na stanie jest mniejsza
+             od minimalnej wymaganej ilości.
+        """
+        return self.ilosc_na_stanie < self.min_ilosc
+
+    def czy_przeterminowany(self) -> bool:
+        """
+        Sprawdza czy składnik jest przeterminowany.
+
+        Returns:
+            True jeśli składnik jest przeterminowany, False jeśli nie lub
+            data ważności nie jest ustawiona.
+        """
+        if self.data_waznosci is None:
+            return False
+
+        return datetime.now() > self.data_waznosci
+
+    def wartosc_zapasu(self) -> float:
+        """
+        Oblicza wartość zapasu składnika.
+
+        Returns:
+            Wartość zapasu (ilość * cena jednostkowa).
+        """
+        return round(self.ilosc_na_stanie * self.cena_jednostkowa, 2)
+
+
+class ZarzadzanieSkladnikami:
+    """
+    Klasa zarządzająca wszystkimi składnikami i przepisami w restauracji.
+
+    Atrybuty:
+        skladniki (Dict[str, Skladnik]): Słownik składników.
+        przepisy (Dict[str, Dict[str, float]]): Słownik przepisów.
+        dostawy (List[Dict]): Lista wszystkich dostaw.
+        dziennik_dostaw (DziennikDostaw): Indeksowany dziennik dostaw
+            (dostawy to jego lista wpisów).
+        kategorie_skladnikow (Set[str]): Zbiór wszystkich kategorii składników.
+        dostawcy (Set[str]): Zbiór wszystkich dostawców.
+        rejestr (RejestrRuchow): Rejestr ruchów składników systemu.
+
+    Przepis może zamiast składnika używać innego przepisu (np. sosu
+    wspólnego dla wielu dań) podanego w porcjach. Zależności między
+    przepisami tworzą graf acykliczny; cykle są odrzucane.
+
+    Przepisy są dodatkowo kompilowane do rzadkiej macierzy
+    danie × składnik (wiersz to krotka par (slot, ilość)), a stany
+    składników trzymane są w wektorze wyrównanym do slotów. Dzięki temu
+    maksymalna liczba porcji każdego dania jest utrzymywana przyrostowo:
+    zmiana stanu składnika przelicza tylko dania, które go używają.
+    Wiersz przepisu złożonego jest spłaszczony do składników, więc
+    sprawdzanie i zużycie działają tak samo szybko jak dla przepisów
+    płaskich; zmiana przepisu przelicza tylko przepisy, które od niego
+    (pośrednio) zależą.
+    Analogicznie zmiana ceny składnika oznacza jako nieaktualne tylko
+    koszty dań, które go używają; są one przeliczane przy odczycie.
+
+    Operacje zmieniające stany (przygotowanie dań, dostawy, korekty)
+    są bezpieczne wątkowo: sprawdzenie i zużycie odbywają się pod
+    blokadami składników brane w kolejności slotów, więc dania
+    o rozłącznych składnikach nie czekają na siebie. Wspólne sumy
+    i indeksy są aktualizowane pod osobną, krótką blokadą. Dodawanie
+    i usuwanie składników oraz przepisów nie jest synchronizowane.
+
+    Historia ruchów składników trafia do rejestru ruchów systemu;
+    składniki z własnym rejestrem są do niego przenoszone przy dodaniu.
+
+    Jeśli podano szynę zdarzeń, zmiany składników oraz dodanie i usunięcie
+    składników i przepisów są na nią publikowane. Operacje zbiorcze
+    (dostawy, korekty, przygotowanie dań) publikują zdarzenia w jednej
+    partii, więc subskrybent dostaje jedno powiadomienie na operację.
+    """
+
+    def __init__(self, blokada_globalna: bool = False,
+                 szyna: Optional[SzynaZdarzen] = None,
+                 rejestr: Optional[RejestrRuchow] = None):
+        """
+        Inicjalizuje nowy system zarządzania składnikami.
+
+        Args:
+            blokada_globalna: Czy zamiast blokad składników używać jednej
+            blokady dla całego magazynu.
+            szyna: Szyna zdarzeń, na którą publikowane są zmiany.
+            rejestr: Rejestr ruchów systemu (domyślnie nowy).
+        """
+        self.szyna = szyna
+        self.rejestr = RejestrRuchow() if rejestr is None else rejestr
+        self.skladniki = {}
+        self.przepisy = {}  # nazwa_dania: {nazwa_skladnika: ilosc, ...}
+        self.dziennik_dostaw = DziennikDostaw()
+        self.dostawy = self.dziennik_dostaw.dostawy
+        self.kategorie_skladnikow = set()
+        self.dostawcy = set()
+        # kategoria/dostawca: {nazwa_skladnika: Skladnik, ...}
+        self._skladniki_kategorii: Dict[str, Dict[str, Skladnik]] = {}
+        self._skladniki_dostawcy: Dict[str, Dict[str, Skladnik]] = {}
+        # Macierz wykonalności: sloty składników, wektor stanów,
+        # skompilowane wiersze przepisów i indeks odwrotny slot -> dania
+        self._sloty: Dict[str, int] = {}
+        self._wolne_sloty: List[int] = []
+        self._skladniki_slotow: List[Optional[Skladnik]] = []
+        self._stan = array("d")
+        self._wymagania: Dict[str, Tuple[Tuple[int, float], ...]] = {}
+        self._dania_skladnika: Dict[int, Set[str]] = {}
+        self._max_porcje: Dict[str, int] = {}
+        # Graf przepisów: danie -> użyte przepisy i przepis -> dania,
+        # które go używają
+        self._skladowe: Dict[str, Set[str]] = {}
+        self._uzycia_przepisu: Dict[str, Set[str]] = {}
+        # Wektor cen wyrównany do slotów, koszty dań i dania do przeliczenia
+        self._ceny = array("d")
+        self._koszty_dan: Dict[str, float] = {}
+        self._nieaktualne_koszty: Set[str] = set()
+        # Posortowany indeks (data_waznosci, nazwa_skladnika)
+        self._indeks_waznosci: List[Tuple[datetime, str]] = []
+        # Składniki poniżej minimalnej ilości i obserwatorzy przekroczeń
+        self._do_zamowienia: Dict[str, Skladnik] = {}
+        self._obserwatorzy_zamowien: List[
+            Callable[[Skladnik, bool], None]] = []
+        # Obserwatorzy zmian wykonalności dań (max_porcje 0 <-> > 0)
+        # i usunięcia przepisów
+        self._obserwatorzy_dostepnosci: List[
+            Callable[[str, Optional[bool]], None]] = []
+        # Bieżąca wartość magazynu: łącznie, per kategoria i per składnik
+        self._wartosc_magazynu = 0.0
+        self._wartosc_kategorii: Dict[str, float] = {}
+        self._wartosci_skladnikow: Dict[str, float] = {}
+        # Blokady składników (wyrównane do slotów) lub jedna globalna
+        # oraz blokada wspólnych sum i indeksów
+        self._blokady: List[threading.Lock] = []
+        self._blokada_globalna = threading.Lock() if blokada_globalna \
+            else None
+        self._blokada_stanu = threading.RLock()
+
+    def dodaj_skladnik(self, skladnik: Skladnik):
+        """
+        Dodaje składnik do systemu.
+
+        Args:
+            skladnik: Obiekt składnika do dodania.
+
+        Raises:
+            ValueError: Gdy składnik o takiej nazwie już istnieje.
+            ValueError: Gdy przepis o takiej nazwie jest używany
+            w innych przepisach.
+        """
+        if skladnik.nazwa in self.skladniki:
+            raise ValueError(f"Składnik {skladnik.nazwa} już istnieje")
+        if skladnik.nazwa in self._uzycia_przepisu:
+            raise ValueError(
+                f"Nazwa {skladnik.nazwa} jest używana jako przepis "
+                f"w innych przepisach"
+            )
+        skladnik.przenies_do_rejestru(self.rejestr)
+        self.skladniki[skladnik.nazwa] = skladnik
+
+        if self._wolne_sloty:
+            slot = self._wolne_sloty.pop()
+            self._stan[slot] = skladnik.ilosc_na_stanie
+            self._ceny[slot] = skladnik.cena_jednostkowa
+            self._skladniki_slotow[slot] = skladnik
+        else:
+            slot = len(self._stan)
+            self._stan.append(skladnik.ilosc_na_stanie)
+            self._ceny.append(skladnik.cena_jednostkowa)
+            self._blokady.append(threading.Lock())
+            self._skladniki_slotow.append(skladnik)
+        self._sloty[skladnik.nazwa] = slot
+        skladnik.dodaj_obserwatora(self._na_zmiane_skladnika)
+        if skladnik.data_waznosci is not None:
+            insort(self._indeks_waznosci,
+                   (skladnik.data_waznosci, skladnik.nazwa))
+        if skladnik.czy_wymaga_zamowienia():
+            self._do_zamowienia[skladnik.nazwa] = skladnik
+        self._wartosci_skladnikow[skladnik.nazwa] = 0.0
+        self._aktualizuj_wartosc(skladnik)
+        self._dodaj_do_kategorii(skladnik)
+        self._dodaj_do_dostawcy(skladnik)
+        self._publikuj(TYP_SKLADNIK, skladnik.nazwa, POLE_DODANO, None,
+                       skladnik, skladnik)
+
+    def usun_skladnik(self, nazwa: str):
+        """
+        Usuwa składnik z systemu.
+
+        Args:
+            nazwa: Nazwa składnika do usunięcia.
+
+        Raises:
+            KeyError: Gdy składnik o podanej nazwie nie istnieje.
+            ValueError: Gdy składnik jest używany w przepisach.
+        """
+        if nazwa not in self.skladniki:
+            raise KeyError(f"Składnik {nazwa} nie istnieje")
+
+        # Sprawdź czy składnik jest używany w przepisach (także pośrednio,
+        # przez przepisy użyte jako składniki)
+        dania = self._dania_skladnika.get(self._sloty[nazwa])
+        if dania:
+            raise ValueError(
+                f"Nie można usunąć składnika {nazwa}, "
+                f"jest używany w przepisie {min(dania)}"
+            )
+
+        skladnik = self.skladniki[nazwa]
+        kategoria = skladnik.kategoria
+        dostawca = skladnik.dostawca
+
+        self.skladniki[nazwa].usun_obserwatora(self._na_zmiane_skladnika)
+        self._usun_z_indeksu_waznosci(self.skladniki[nazwa].data_waznosci,
+                                      nazwa)
+        self._do_zamowienia.pop(nazwa, None)
+        wartosc = self._wartosci_skladnikow.pop(nazwa)
+        self._wartosc_magazynu -= wartosc
+        self._odejmij_wartosc_kategorii(kategoria, wartosc)
+        slot = self._sloty.pop(nazwa)
+        self._stan[slot] = 0
+        self._ceny[slot] = 0
+        self._skladniki_slotow[slot] = None
+        self._wolne_sloty.append(slot)
+        del self.skladniki[nazwa]
+
+        # Aktualizuj kategorie i dostawców
+        self._usun_z_kategorii(nazwa, kategoria)
+        self._usun_z_dostawcy(nazwa, dostawca)
+        self._publikuj(TYP_SKLADNIK, nazwa, POLE_USUNIETO, skladnik, None,
+                       skladnik)
+
+    def _dodaj_do_kategorii(self, skladnik: Skladnik) -> None:
+        """Dopisuje składnik do rejestru jego kategorii."""
+        if skladnik.kategoria:
+            self.kategorie_skladnikow.add(skladnik.kategoria)
+            self._skladniki_kategorii.setdefault(
+                skladnik.kategoria, {})[skladnik.nazwa] = skladnik
+
+    def _usun_z_kategorii(self, nazwa: str, kategoria: str) -> None:
+        """Usuwa składnik z rejestru kategorii (i pustą kategorię)."""
+        if kategoria:
+            czlonkowie = self._skladniki_kategorii[kategoria]
+            del czlonkowie[nazwa]
+            if not czlonkowie:
+                del self._skladniki_kategorii[kategoria]
+                self.kategorie_skladnikow.remove(kategoria)
+
+    def _odejmij_wartosc_kategorii(self, kategoria: str,
+                                   wartosc: float) -> None:
+        """Odejmuje wartość opuszczającego kategorię składnika od sum."""
+        if kategoria:
+            # Kategoria bez wartości nie ma wpisu w sumach
+            if len(self._skladniki_kategorii[kategoria]) == 1:
+                self._wartosc_kategorii.pop(kategoria, None)
+            elif wartosc:
+                self._wartosc_kategorii[kategoria] -= wartosc
+
+    def _dodaj_do_dostawcy(self, skladnik: Skladnik) -> None:
+        """Dopisuje składnik do rejestru jego dostawcy."""
+        if skladnik.dostawca:
+            self.dostawcy.add(skladnik.dostawca)
+            self._skladniki_dostawcy.setdefault(
+                skladnik.dostawca, {})[skladnik.nazwa] = skladnik
+
+    def _usun_z_dostawcy(self, nazwa: str, dostawca: str) -> None:
+        """Usuwa składnik z rejestru dostawcy (i dostawcę bez składników)."""
+        if dostawca:
+            czlonkowie = self._skladniki_dostawcy[dostawca]
+            del czlonkowie[nazwa]
+            if not czlonkowie:
+                del self._skladniki_dostawcy[dostawca]
+                self.dostawcy.discard(dostawca)
+
+    def skladniki_w_kategorii(self, kategoria: str) -> List[Skladnik]:
+        """
+        Zwraca składniki należące do danej kategorii.
+
+        Args:
+            kategoria: Nazwa kategorii.
+
+        Returns:
+            Lista składników z kategorii (pusta, gdy kategoria nie istnieje).
+        """
+        return list(self._skladniki_kategorii.get(kategoria, {}).values())
+
+    def skladniki_dostawcy(self, dostawca: str) -> List[Skladnik]:
+        """
+        Zwraca składniki dostarczane przez danego dostawcę.
+
+        Args:
+            dostawca: Nazwa dostawcy.
+
+        Returns:
+            Lista składników dostawcy (pusta, gdy dostawca nie ma składników).
+        """
+        return list(self._skladniki_dostawcy.get(dostawca, {}).values())
+
+    def dodaj_przepis(self, nazwa_dania: str,
+                      skladniki_ilosci: Dict[str, float]):
+        """
+        Dodaje przepis do systemu.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+            skladniki_ilosci: Słownik z nazwami składników i ich ilościami.
+            Ilość może być liczbą w jednostce składnika albo krotką
+            (ilosc, jednostka), np. (250, "g") dla składnika w kg.
+            Kluczem może być też nazwa istniejącego przepisu, a ilością
+            liczba jego porcji. Nazwa składnika ma pierwszeństwo przed
+            nazwą przepisu.
+
+        Raises:
+            ValueError: Gdy przepis jest pusty.
+            KeyError: Gdy jakiś składnik lub przepis nie istnieje.
+            ValueError: Gdy ilość nie jest dodatnia lub jednostki nie
+            da się przeliczyć.
+            ValueError: Gdy przepis o takiej nazwie już istnieje.
+        """
+        if not skladniki_ilosci:
+            raise ValueError("Przepis musi zawierać "
+                             "przynajmniej jeden składnik")
+
+        self._sprawdz_pozycje(nazwa_dania, skladniki_ilosci)
+
+        if nazwa_dania in self.przepisy:
+            raise ValueError(f"Przepis dla dania {nazwa_dania} już istnieje")
+
+        self.przepisy[nazwa_dania] = skladniki_ilosci.copy()
+        self._kompiluj_przepis(nazwa_dania)
+        self._publikuj(TYP_PRZEPIS, nazwa_dania, POLE_DODANO, None,
+                       self.przepisy[nazwa_dania])
+
+    def aktualizuj_przepis(self, nazwa_dania: str,
+                           skladniki_ilosci: Dict[str, float]):
+        """
+        Aktualizuje istniejący przepis.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+            skladniki_ilosci: Słownik z nazwami składników i ich ilościami
+            (liczby lub krotki (ilosc, jednostka), jak w dodaj_przepis).
+
+        Przepisy używające tego przepisu są przeliczane.
+
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+            ValueError: Gdy nowy przepis jest pusty.
+            KeyError: Gdy jakiś składnik lub przepis nie istnieje.
+            ValueError: Gdy ilość nie jest dodatnia lub jednostki nie
+            da się przeliczyć.
+            ValueError: Gdy nowy przepis tworzyłby cykl zależności.
+        """
+        if nazwa_dania not in self.przepisy:
+            raise KeyError(f"Przepis dla dania {nazwa_dania} nie istnieje")
+
+        if not skladniki_ilosci:
+            raise ValueError("Przepis musi zawierać "
+                             "przynajmniej jeden składnik")
+
+        self._sprawdz_pozycje(nazwa_dania, skladniki_ilosci)
+
+        stary = self.przepisy[nazwa_dania]
+        self.przepisy[nazwa_dania] = skladniki_ilosci.copy()
+        self._kompiluj_przepis(nazwa_dania)
+        self._publikuj(TYP_PRZEPIS, nazwa_dania, "skladniki", stary,
+                       self.przepisy[nazwa_dania])
+
+    def usun_przepis(self, nazwa_dania: str):
+        """
+        Usuwa przepis z systemu.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+            ValueError: Gdy przepis jest używany w innych przepisach.
+        """
+        if nazwa_dania not in self.przepisy:
+            raise KeyError(f"Przepis dla dania {nazwa_dania} nie istnieje")
+
+        if nazwa_dania in self._uzycia_przepisu:
+            raise ValueError(
+                f"Nie można usunąć przepisu {nazwa_dania}, jest używany "
+                f"w przepisie {min(self._uzycia_przepisu[nazwa_dania])}"
+            )
+
+        stary = self.przepisy.pop(nazwa_dania)
+        self._odlacz_skladowe(nazwa_dania)
+        self._odlacz_wymagania(nazwa_dania)
+        del self._max_porcje[nazwa_dania]
+        self._koszty_dan.pop(nazwa_dania, None)
+        self._nieaktualne_koszty.discard(nazwa_dania)
+        self._powiadom_o_dostepnosci(nazwa_dania, None)
+        self._publikuj(TYP_PRZEPIS, nazwa_dania, POLE_USUNIETO, stary, None)
+
+    def dodaj_przepisy(self, przepisy: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Dodaje kilka przepisów, które mogą używać siebie nawzajem.
+
+        Przepisy są dodawane w kolejności zależności (używane przed
+        używającymi), niezależnie od kolejności w słowniku. W razie
+        błędu żaden z nich nie zostaje dodany.
+
+        Args:
+            przepisy: Słownik {nazwa_dania: skladniki_ilosci}, jak
+            w dodaj_przepis.
+
+        Raises:
+            ValueError: Gdy przepisy tworzą cykl zależności.
+            KeyError, ValueError: Jak w dodaj_przepis.
+        """
+        kolejnosc: List[str] = []
+        # nazwa: False w trakcie odwiedzania, True po dodaniu do kolejności
+        odwiedzone: Dict[str, bool] = {}
+
+        def odwiedz(nazwa_dania: str) -> None:
+            odwiedzone[nazwa_dania] = False
+            for pozycja in przepisy[nazwa_dania]:
+                if pozycja not in przepisy or pozycja in self.skladniki:
+                    continue
+                if odwiedzone.get(pozycja) is False:
+                    raise ValueError(
+                        f"Przepisy {nazwa_dania} i {pozycja} "
+                        f"tworzą cykl zależności"
+                    )
+                if pozycja not in odwiedzone:
+                    odwiedz(pozycja)
+            odwiedzone[nazwa_dania] = True
+            kolejnosc.append(nazwa_dania)
+
+        for nazwa_dania in przepisy:
+            if nazwa_dania not in odwiedzone:
+                odwiedz(nazwa_dania)
+
+        dodane: List[str] = []
+        with partia_zdarzen(self.szyna):
+            try:
+                for nazwa_dania in kolejnosc:
+                    self.dodaj_przepis(nazwa_dania, przepisy[nazwa_dania])
+                    dodane.append(nazwa_dania)
+            except (KeyError, ValueError):
+                for nazwa_dania in reversed(dodane):
+                    self.usun_przepis(nazwa_dania)
+                raise
+
+    def _sprawdz_pozycje(self, nazwa_dania: str,
+                         skladniki_ilosci: Dict[str, Any]) -> None:
+        """
+        Sprawdza pozycje przepisu, w tym brak cykli przez inne przepisy.
+
+        Raises:
+            KeyError: Gdy składnik lub przepis nie istnieje.
+            ValueError: Gdy ilość jest niepoprawna lub przepis tworzyłby
+            cykl zależności.
+        """
+        zalezne = None
+        for pozycja, ilosc in skladniki_ilosci.items():
+            if pozycja in self.skladniki or pozycja not in self.przepisy:
+                self._ilosc_bazowa(pozycja, ilosc)
+                continue
+
+            if isinstance(ilosc, tuple) or ilosc <= 0:
+                raise ValueError(
+                    f"Ilość przepisu {pozycja} musi być dodatnią "
+                    f"liczbą porcji"
+                )
+            if zalezne is None:
+                zalezne = set(self._zalezne_przepisy(nazwa_dania))
+            if pozycja in zalezne:
+                raise ValueError(
+                    f"Przepis {nazwa_dania} nie może używać przepisu "
+                    f"{pozycja}: powstałby cykl zależności"
+                )
+
+    def _zalezne_przepisy(self, nazwa_dania: str) -> List[str]:
+        """
+        Zwraca przepis i wszystkie przepisy, które go (pośrednio) używają.
+
+        Kolejność jest topologiczna: każdy przepis występuje przed
+        przepisami, które go używają (odwrócony porządek post-order
+        przeszukiwania krawędzi przepis -> danie).
+        """
+        odwiedzone = set()
+        kolejnosc: List[str] = []
+
+        def odwiedz(nazwa: str) -> None:
+            odwiedzone.add(nazwa)
+            for uzywajacy in self._uzycia_przepisu.get(nazwa, ()):
+                if uzywajacy not in odwiedzone:
+                    odwiedz(uzywajacy)
+            kolejnosc.append(nazwa)
+
+        odwiedz(nazwa_dania)
+        kolejnosc.reverse()
+        return kolejnosc
+
+    def _ilosc_bazowa(self, skladnik_nazwa: str, ilosc: Any) -> float:
+        """
+        Sprawdza pozycję przepisu i zwraca ilość w jednostce składnika.
+
+        Args:
+            skladnik_nazwa: Nazwa składnika.
+            ilosc: Liczba lub krotka (ilosc, jednostka).
+
+        Returns:
+            Ilość przeliczona na jednostkę składnika.
+
+        Raises:
+            KeyError: Gdy składnik nie istnieje.
+            ValueError: Gdy ilość nie jest dodatnia lub jednostki nie
+            da się przeliczyć.
+        """
+        if skladnik_nazwa not in self.skladniki:
+            raise KeyError(f"Składnik {skladnik_nazwa} nie istnieje")
+
+        jednostka_bazowa = self.skladniki[skladnik_nazwa].jednostka
+        jednostka = jednostka_bazowa
+        if isinstance(ilosc, tuple):
+            ilosc, jednostka = ilosc
+
+        if ilosc <= 0:
+            raise ValueError(
+                f"Ilość składnika {skladnik_nazwa} "
+                f"musi być większa od zera"
+            )
+        return przelicz_jednostke(ilosc, jednostka, jednostka_bazowa)
+
+    def _kompiluj_przepis(self, nazwa_dania: str) -> None:
+        """
+        Kompiluje przepis i przepisy, które go używają.
+
+        Aktualizowane są krawędzie grafu przepisów tego dania, a potem
+        wiersze macierzy jego i przepisów od niego zależnych, w kolejności
+        topologicznej. Pozostałe wiersze pozostają bez zmian.
+
+        Args:
+            nazwa_dania: Nazwa dania z istniejącym przepisem.
+        """
+        self._odlacz_skladowe(nazwa_dania)
+        skladowe = {pozycja for pozycja in self.przepisy[nazwa_dania]
+                    if pozycja not in self.skladniki}
+        if skladowe:
+            self._skladowe[nazwa_dania] = skladowe
+            for pozycja in skladowe:
+                self._uzycia_przepisu.setdefault(
+                    pozycja, set()).add(nazwa_dania)
+
+        for nazwa in self._zalezne_przepisy(nazwa_dania):
+            self._splaszcz_przepis(nazwa)
+
+    def _odlacz_skladowe(self, nazwa_dania: str) -> None:
+        """Usuwa krawędzie grafu przepisów wychodzące z dania."""
+        for pozycja in self._skladowe.pop(nazwa_dania, ()):
+            uzywajace = self._uzycia_przepisu[pozycja]
+            uzywajace.discard(nazwa_dania)
+            if not uzywajace:
+                del self._uzycia_przepisu[pozycja]
+
+    def _splaszcz_przepis(self, nazwa_dania: str) -> None:
+        """
+        Kompiluje przepis do wiersza macierzy wykonalności.
+
+        Nazwy składników są zamieniane na sloty, a ilości przeliczane
+        na jednostki bazowe składników. Użyte przepisy są rozwijane
+        z ich (już skompilowanych) wierszy pomnożonych przez liczbę
+        porcji. Wiersz zastępuje poprzednią wersję przepisu, a indeks
+        odwrotny jest aktualizowany tylko dla składników tego dania.
+
+        Args:
+            nazwa_dania: Nazwa dania z istniejącym przepisem.
+        """
+        self._odlacz_wymagania(nazwa_dania)
+        ilosci: Dict[int, float] = {}
+        for pozycja, ilosc in self.przepisy[nazwa_dania].items():
+            if pozycja in self.skladniki:
+                slot = self._sloty[pozycja]
+                ilosci[slot] = ilosci.get(slot, 0.0) + \
+                    self._ilosc_bazowa(pozycja, ilosc)
+            else:
+                for slot, potrzebna in self._wymagania[pozycja]:
+                    ilosci[slot] = ilosci.get(slot, 0.0) + potrzebna * ilosc
+        wiersz = tuple(ilosci.items())
+        self._wymagania[nazwa_dania] = wiersz
+        for slot, _ in wiersz:
+            self._dania_skladnika.setdefault(slot, set()).add(nazwa_dania)
+        self._ustaw_max_porcje(nazwa_dania, self._oblicz_max_porcje(wiersz))
+        self._nieaktualne_koszty.add(nazwa_dania)
+
+    def _odlacz_wymagania(self, nazwa_dania: str) -> None:
+        """Usuwa wiersz dania z macierzy i z indeksu odwrotnego."""
+        for slot, _ in self._wymagania.pop(nazwa_dania, ()):
+            dania = self._dania_skladnika[slot]
+            dania.discard(nazwa_dania)
+            if not dania:
+                del self._dania_skladnika[slot]
+
+    def _oblicz_max_porcje(self,
+                           wiersz: Tuple[Tuple[int, float], ...]) -> int:
+        """
+        Oblicza maksymalną liczbę porcji dla wiersza macierzy.
+
+        Wynik jest zgodny z warunkiem stosowanym przy sprawdzaniu
+        możliwości przygotowania (stan >= ilość * porcje), także przy
+        błędach zaokrągleń liczb zmiennoprzecinkowych.
+
+        Args:
+            wiersz: Skompilowany wiersz przepisu.
+
+        Returns:
+            Maksymalna liczba porcji możliwa do przygotowania.
+        """
+        stan = self._stan
+        wynik = math.inf
+        for slot, ilosc in wiersz:
+            dostepne = stan[slot]
+            porcje = math.floor(dostepne / ilosc)
+            if ilosc * (porcje + 1) <= dostepne:
+                porcje += 1
+            elif porcje > 0 and dostepne < ilosc * porcje:
+                porcje -= 1
+            if porcje < wynik:
+                wynik = porcje
+                if wynik <= 0:
+                    return 0
+        return int(wynik)
+
+    def _na_zmiane_skladnika(self, skladnik: Skladnik, pole: str,
+                             stara_wartosc: Any) -> None:
+        """
+        Aktualizuje wektor stanów po zmianie składnika.
+
+        Przeliczane są tylko dania, których przepisy używają składnika.
+        Zmiana jest następnie publikowana na szynę zdarzeń.
+        """
+        with self._blokada_stanu:
+            self._aktualizuj_po_zmianie(skladnik, pole, stara_wartosc)
+        self._publikuj(TYP_SKLADNIK, skladnik.nazwa, pole, stara_wartosc,
+                       getattr(skladnik, pole), skladnik)
+
+    def _publikuj(self, typ: str, nazwa: str, pole: str, stara_wartosc: Any,
+                  nowa_wartosc: Any, zrodlo: Any = None) -> None:
+        """Publikuje zdarzenie na szynę, jeśli ją podano."""
+        if self.szyna is not None:
+            self.szyna.publikuj(Zdarzenie(typ, nazwa, pole, stara_wartosc,
+                                          nowa_wartosc, zrodlo))
+
+    def _aktualizuj_po_zmianie(self, skladnik: Skladnik, pole: str,
+                               stara_wartosc: Any) -> None:
+        """Aktualizuje sumy i indeksy po zmianie pola składnika."""
+        if pole == "ilosc_na_stanie":
+            slot = self._sloty[skladnik.nazwa]
+            self._stan[slot] = skladnik.ilosc_na_stanie
+            for nazwa_dania in self._dania_skladnika.get(slot, ()):
+                self._ustaw_max_porcje(nazwa_dania, self._oblicz_max_porcje(
+                    self._wymagania[nazwa_dania]))
+            self._aktualizuj_do_zamowienia(skladnik)
+            self._aktualizuj_wartosc(skladnik)
+        elif pole == "cena_jednostkowa":
+            slot = self._sloty[skladnik.nazwa]
+            self._ceny[slot] = skladnik.cena_jednostkowa
+            self._nieaktualne_koszty.update(
+                self._dania_skladnika.get(slot, ()))
+            self._aktualizuj_wartosc(skladnik)
+        elif pole == "min_ilosc":
+            self._aktualizuj_do_zamowienia(skladnik)
+        elif pole == "data_waznosci":
+            self._usun_z_indeksu_waznosci(stara_wartosc, skladnik.nazwa)
+            if skladnik.data_waznosci is not None:
+                insort(self._indeks_waznosci,
+                       (skladnik.data_waznosci, skladnik.nazwa))
+        elif pole == "kategoria" and stara_wartosc != skladnik.kategoria:
+            wartosc = self._wartosci_skladnikow[skladnik.nazwa]
+            self._odejmij_wartosc_kategorii(stara_wartosc, wartosc)
+            self._usun_z_kategorii(skladnik.nazwa, stara_wartosc)
+            self._dodaj_do_kategorii(skladnik)
+            if skladnik.kategoria and wartosc:
+                self._wartosc_kategorii[skladnik.kategoria] = \
+                    self._wartosc_kategorii.get(skladnik.kategoria, 0.0) \
+                    + wartosc
+        elif pole == "dostawca" and stara_wartosc != skladnik.dostawca:
+            self._usun_z_dostawcy(skladnik.nazwa, stara_wartosc)
+            self._dodaj_do_dostawcy(skladnik)
+
+    @contextmanager
+    def _zablokuj(self, sloty: Iterable[int]) -> Iterator[None]:
+        """
+        Zajmuje blokady podanych slotów w rosnącej kolejności.
+
+        Stała kolejność zajmowania wyklucza zakleszczenie między
+        operacjami na częściowo wspólnych zbiorach składników.
+
+        Args:
+            sloty: Sloty składników (mogą się powtarzać).
+        """
+        if self._blokada_globalna is not None:
+            with self._blokada_globalna:
+                yield
+            return
+
+        blokady = [self._blokady[slot] for slot in sorted(set(sloty))]
+        for blokada in blokady:
+            blokada.acquire()
+        try:
+            yield
+        finally:
+            for blokada in reversed(blokady):
+                blokada.release()
+
+    def _aktualizuj_wartosc(self, skladnik: Skladnik) -> None:
+        """Przenosi zmianę wartości zapasu składnika do sum bieżących."""
+        nowa = skladnik.wartosc_zapasu()
+        roznica = nowa - self._wartosci_skladnikow[skladnik.nazwa]
+        if not roznica:
+            return
+
+        self._wartosci_skladnikow[skladnik.nazwa] = nowa
+        self._wartosc_magazynu += roznica
+        if skladnik.kategoria:
+            self._wartosc_kategorii[skladnik.kategoria] = \
+                self._wartosc_kategorii.get(skladnik.kategoria, 0.0) + roznica
+
+    def _aktualizuj_do_zamowienia(self, skladnik: Skladnik) -> None:
+        """
+        Aktualizuje zbiór składników do zamówienia dla jednego składnika.
+
+        Obserwatorzy są powiadamiani tylko przy przekroczeniu progu.
+        """
+        wymaga = skladnik.czy_wymaga_zamowienia()
+        if wymaga == (skladnik.nazwa in self._do_zamowienia):
+            return
+
+        if wymaga:
+            self._do_zamowienia[skladnik.nazwa] = skladnik
+        else:
+            del self._do_zamowienia[skladnik.nazwa]
+
+        for obserwator in list(self._obserwatorzy_zamowien):
+            obserwator(skladnik, wymaga)
+
+    def dodaj_obserwatora_zamowien(
+            self, obserwator: Callable[[Skladnik, bool], None]) -> None:
+        """
+        Rejestruje funkcję wywoływaną, gdy składnik przekracza próg
+        minimalnej ilości.
+
+        Args:
+            obserwator: Funkcja wywoływana jako obserwator(skladnik, wymaga),
+            gdzie wymaga=True oznacza spadek poniżej minimum.
+        """
+        self._obserwatorzy_zamowien.append(obserwator)
+
+    def usun_obserwatora_zamowien(
+            self, obserwator: Callable[[Skladnik, bool], None]) -> None:
+        """
+        Wyrejestrowuje funkcję obserwatora progu minimalnej ilości.
+
+        Args:
+            obserwator: Wcześniej zarejestrowana funkcja.
+
+        Raises:
+            ValueError: Gdy funkcja nie była zarejestrowana.
+        """
+        self._obserwatorzy_zamowien.remove(obserwator)
+
+    def _ustaw_max_porcje(self, nazwa_dania: str, porcje: int) -> None:
+        """
+        Zapisuje maksymalną liczbę porcji dania.
+
+        Obserwatorzy dostępności są powiadamiani tylko dla nowego
+        przepisu oraz gdy danie staje się wykonalne lub niewykonalne.
+        """
+        poprzednie = self._max_porcje.get(nazwa_dania)
+        self._max_porcje[nazwa_dania] = porcje
+        if poprzednie is not None and (poprzednie > 0) == (porcje > 0):
+            return
+        self._powiadom_o_dostepnosci(nazwa_dania, porcje > 0)
+
+    def _powiadom_o_dostepnosci(self, nazwa_dania: str,
+                                dostepne: Optional[bool]) -> None:
+        """Powiadamia obserwatorów dostępności o zmianie dania."""
+        for obserwator in list(self._obserwatorzy_dostepnosci):
+            obserwator(nazwa_dania, dostepne)
+
+    def dodaj_obserwatora_dostepnosci(
+            self,
+            obserwator: Callable[[str, Optional[bool]], None]) -> None:
+        """
+        Rejestruje funkcję wywoływaną, gdy danie staje się wykonalne
+        lub niewykonalne z aktualnych stanów składników.
+
+        Wywoływana jest tylko dla dań używających zmienionego składnika
+        (po zmianie przepisu - także dla niego i dań, które go używają),
+        dla każdego nowo dodanego przepisu oraz po usunięciu przepisu.
+
+        Args:
+            obserwator: Funkcja wywoływana jako
+            obserwator(nazwa_dania, dostepne), gdzie dostepne=True
+            oznacza, że można przygotować przynajmniej jedną porcję,
+            a dostepne=None, że przepis dania został usunięty.
+        """
+        self._obserwatorzy_dostepnosci.append(obserwator)
+
+    def usun_obserwatora_dostepnosci(
+            self,
+            obserwator: Callable[[str, Optional[bool]], None]) -> None:
+        """
+        Wyrejestrowuje funkcję obserwatora dostępności dań.
+
+        Args:
+            obserwator: Wcześniej zarejestrowana funkcja.
+
+        Raises:
+            ValueError: Gdy funkcja nie była zarejestrowana.
+        """
+        self._obserwatorzy_dostepnosci.remove(obserwator)
+
+    def _usun_z_indeksu_waznosci(self, data_waznosci: Optional[datetime],
+                                 nazwa: str) -> None:
+        """Usuwa wpis składnika z indeksu dat ważności."""
+        if data_waznosci is None:
+            return
+        wpis = (data_waznosci, nazwa)
+        indeks = bisect_left(self._indeks_waznosci, wpis)
+        if indeks < len(self._indeks_waznosci) \
+                and self._indeks_waznosci[indeks] == wpis:
+            del self._indeks_waznosci[indeks]
+
+    def zapotrzebowanie_dania(self, nazwa_dania: str,
+                              ilosc: float = 1) -> Dict[str, float]:
+        """
+        Zwraca ilości składników potrzebne do przygotowania dania.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+            ilosc: Liczba porcji.
+
+        Returns:
+            Słownik {nazwa_skladnika: ilosc}.
+
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+        """
+        if nazwa_dania not in self._wymagania:
+            raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+        return {self._skladniki_slotow[slot].nazwa: potrzebna * ilosc
+                for slot, potrzebna in self._wymagania[nazwa_dania]}
+
+    def max_porcje(self, nazwa_dania: str) -> int:
+        """
+        Zwraca maksymalną liczbę porcji dania możliwą do przygotowania.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+
+        Returns:
+            Liczba porcji wynikająca z aktualnych stanów składników.
+
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+        """
+        if nazwa_dania not in self._max_porcje:
+            raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+        return self._max_porcje[nazwa_dania]
+
+    def max_porcje_menu(self) -> Dict[str, int]:
+        """
+        Zwraca maksymalną liczbę porcji dla wszystkich dań z przepisami.
+
+        Returns:
+            Słownik {nazwa_dania: liczba_porcji}.
+        """
+        return dict(self._max_porcje)
+
+    def _odswiez_koszty(self) -> None:
+        """Przelicza koszty dań oznaczonych jako nieaktualne."""
+        ceny = self._ceny
+        for nazwa_dania in self._nieaktualne_koszty:
+            self._koszty_dan[nazwa_dania] = sum(
+                ilosc * ceny[slot]
+                for slot, ilosc in self._wymagania[nazwa_dania])
+        self._nieaktualne_koszty.clear()
+
+    def koszt_dania(self, nazwa_dania: str) -> float:
+        """
+        Zwraca koszt składników jednej porcji dania.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+
+        Returns:
+            Suma ilość * cena jednostkowa po składnikach przepisu.
+
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+        """
+        if nazwa_dania not in self._wymagania:
+            raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+        self._odswiez_koszty()
+        return round(self._koszty_dan[nazwa_dania], 2)
+
+    def koszty_dan(self) -> Dict[str, float]:
+        """
+        Zwraca koszty składników porcji wszystkich dań z przepisami.
+
+        Returns:
+            Słownik {nazwa_dania: koszt}.
+        """
+        self._odswiez_koszty()
+        return {nazwa_dania: round(koszt, 2)
+                for nazwa_dania, koszt in self._koszty_dan.items()}
+
+    def raport_marzy(self, menu) -> Dict[str, Dict[str, float]]:
+        """
+        Tworzy raport marży dań z menu względem kosztu składników.
+
+        Pomijane są dania bez przepisu. Ceny są odczytywane z rekordów
+        menu, więc dania wczytane z pliku nie są tworzone.
+
+        Args:
+            menu: Menu restauracji (obiekt z metodą rekordy).
+
+        Returns:
+            Słownik {nazwa_dania: {"cena", "koszt", "marza",
+            "marza_procent"}}, gdzie marża = cena - koszt,
+            a marża procentowa odnosi się do ceny.
+        """
+        self._odswiez_koszty()
+        raport = {}
+        for nazwa_dania, cena, *_ in menu.rekordy():
+            koszt = self._koszty_dan.get(nazwa_dania)
+            if koszt is None:
+                continue
+            marza = cena - koszt
+            raport[nazwa_dania] = {
+                "cena": cena,
+                "koszt": round(koszt, 2),
+                "marza": round(marza, 2),
+                "marza_procent": round(marza / cena * 100, 2),
+            }
+        return raport
+
+    def sprawdz_mozliwosc_przygotowania(self, nazwa_dania: str,
+                                        ilosc: int = 1) -> bool:
+        """
+        Sprawdza możliwość przygotowania dania w podanej ilości.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+            ilosc: Liczba porcji.
+
+        Returns:
+            True jeśli możliwe jest przygotowanie, False w przeciwnym przypadku
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+        """
+        wiersz = self._wymagania.get(nazwa_dania)
+        if wiersz is None:
+            raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+
+        stan = self._stan
+        for slot, potrzebna_ilosc in wiersz:
+            if stan[slot] < potrzebna_ilosc * ilosc:
+                return False
+        return True
+
+    def przygotuj_danie(self, nazwa_dania: str, ilosc: int = 1,
+                        czas: Optional[datetime] = None):
+        """
+        Przygotowuje danie, zużywając odpowiednie składniki.
+
+        Args:
+            nazwa_dania: Nazwa dania.
+            ilosc: Liczba porcji.
+            czas: Czas zużycia w historii (domyślnie bieżący czas).
+
+        Raises:
+            KeyError: Gdy przepis o podanej nazwie nie istnieje.
+            ValueError: Gdy nie ma wystarczającej ilości składników.
+        """
+        wiersz = self._wymagania.get(nazwa_dania)
+        if wiersz is None:
+            raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+
+        with partia_zdarzen(self.szyna), \
+                self._zablokuj(slot for slot, _ in wiersz):
+            if not self.sprawdz_mozliwosc_przygotowania(nazwa_dania, ilosc):
+                raise ValueError(
+                    f"Brak wystarczającej ilości składników "
+                    f"do przygotowania {nazwa_dania}"
+                )
+
+            skladniki_slotow = self._skladniki_slotow
+            if czas is None:
+                czas = datetime.now()
+            for slot, potrzebna_ilosc in wiersz:
+                skladniki_slotow[slot].zuzyj(potrzebna_ilosc * ilosc,
+                                             nazwa_dania, czas)
+
+    def przygotuj_dania(self, dania: Dict[str, int],
+                        czas: Optional[datetime] = None) -> None:
+        """
+        Przygotowuje kilka dań naraz (np. cały bonik z kuchni).
+
+        Zapotrzebowanie jest sumowane po wszystkich daniach i sprawdzane
+        jednorazowo. Dopiero gdy wystarcza wszystkich składników, każdy
+        z nich jest zużywany jednym odjęciem z jednym wpisem w historii,
+        którego referencją są nazwy dań używających tego składnika.
+        W razie błędu żaden składnik nie zostaje zużyty.
+
+        Args:
+            dania: Słownik {nazwa_dania: liczba_porcji}.
+            czas: Czas zużycia w historii (domyślnie bieżący czas).
+
+        Raises:
+            ValueError: Gdy słownik dań jest pusty lub liczba porcji
+            jest mniejsza od 1.
+            KeyError: Gdy przepis dla któregoś dania nie istnieje.
+            ValueError: Gdy nie ma wystarczającej ilości składników.
+        """
+        if not dania:
+            raise ValueError("Należy podać przynajmniej jedno danie")
+
+        zapotrzebowanie: Dict[int, float] = {}
+        dania_slotow: Dict[int, List[str]] = {}
+        for nazwa_dania, ilosc in dania.items():
+            if nazwa_dania not in self._wymagania:
+                raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+            if ilosc < 1:
+                raise ValueError("Liczba porcji musi być większa od zera")
+            for slot, potrzebna_ilosc in self._wymagania[nazwa_dania]:
+                zapotrzebowanie[slot] = \
+                    zapotrzebowanie.get(slot, 0) + potrzebna_ilosc * ilosc
+                dania_slotow.setdefault(slot, []).append(nazwa_dania)
+
+        with partia_zdarzen(self.szyna), self._zablokuj(zapotrzebowanie):
+            for slot, suma in zapotrzebowanie.items():
+                if self._stan[slot] < suma:
+                    raise ValueError(
+                        f"Brak wystarczającej ilości składnika "
+                        f"{self._skladniki_slotow[slot].nazwa} "
+                        f"do przygotowania zamówionych dań"
+                    )
+
+            if czas is None:
+                czas = datetime.now()
+            for slot, suma in zapotrzebowanie.items():
+                self._skladniki_slotow[slot].zuzyj(
+                    suma, ", ".join(dania_slotow[slot]), czas)
+
+    def zarejestruj_dostawe(
+        self, dostawca: str, pozycje: Dict[str, Tuple],
+            uwagi: str = "",
+            czas_dostawy: Optional[datetime] = None) -> str:
+        """
+        Rejestruje nową dostawę składników.
+
+        Wszystkie pozycje są sprawdzane przed wprowadzeniem jakiejkolwiek
+        zmiany, więc błędna pozycja nie pozostawia częściowo przyjętej
+        dostawy. Każda pozycja tworzy nową partię składnika, a wszystkie
+        wpisy w historii dostają ten sam czas dostawy. Wartość pozycji
+        (ilość * cena, a dla ceny 0 - bieżąca cena składnika) trafia
+        do sum wydatków w dzienniku dostaw.
+
+        Args:
+            dostawca: Nazwa dostawcy.
+            pozycje: Słownik z nazwami składników i
+            krotkami (ilość, cena jednostkowa) lub
+            (ilość, cena jednostkowa, data ważności partii).
+            uwagi: Dodatkowe uwagi do dostawy.
+            czas_dostawy: Czas dostawy (domyślnie bieżący czas).
+
+        Returns:
+            ID dostawy.
+
+        Raises:
+            KeyError: Gdy jakiś składnik nie istnieje.
+            ValueError: Gdy ilość nie jest dodatnia, cena jest ujemna
+            lub data ważności partii nie jest datą.
+        """
+        self._sprawdz_skladniki(pozycje)
+        for skladnik_nazwa, (ilosc, cena, *data) in pozycje.items():
+            if ilosc <= 0:
+                raise ValueError(
+                    f"Ilość składnika {skladnik_nazwa} "
+                    f"musi być większa od zera"
+                )
+            if cena < 0:
+                raise ValueError("Cena nie może być ujemna")
+            if data and data[0] is not None \
+                    and not isinstance(data[0], datetime):
+                raise ValueError(
+                    f"Niepoprawna data ważności partii składnika "
+                    f"{skladnik_nazwa}"
+                )
+
+        dostawa_id = str(uuid.uuid4())
+        if czas_dostawy is None:
+            czas_dostawy = datetime.now()
+        wartosci = {}
+
+        with partia_zdarzen(self.szyna), \
+                self._zablokuj(self._sloty[nazwa] for nazwa in pozycje):
+            for skladnik_nazwa, (ilosc, cena, *data) in pozycje.items():
+                # Aktualizuj stan składnika (nowa partia)
+                self.skladniki[skladnik_nazwa].dodaj_zapas(
+                    ilosc, dostawa_id, data[0] if data else None,
+                    czas_dostawy)
+
+                # Aktualizuj cenę jeśli podano
+                if cena > 0:
+                    self.skladniki[skladnik_nazwa].zmien_cene(cena)
+                wartosci[skladnik_nazwa] = \
+                    ilosc * self.skladniki[skladnik_nazwa].cena_jednostkowa
+
+        # Dodaj dostawcę jeśli nowy
+        self.dostawcy.add(dostawca)
+
+        # Zapisz dostawę
+        dostawa = {
+            "id": dostawa_id,
+            "dostawca": dostawca,
+            "czas_dostawy": czas_dostawy,
+            "pozycje": pozycje.copy(),
+            "uwagi": uwagi
+        }
+
+        with self._blokada_stanu:
+            self.dziennik_dostaw.dopisz(dostawa, wartosci)
+        return dostawa_id
+
+    def koryguj_stany(self, stany: Dict[str, float],
+                      powod: str = "inwentaryzacja",
+                      czas: Optional[datetime] = None) -> Dict[str, float]:
+        """
+        Koryguje stany wielu składników naraz (np. po inwentaryzacji).
+
+        Wszystkie pozycje są sprawdzane przed wprowadzeniem zmian,
+        a korekty dostają wspólny czas w historii.
+
+        Args:
+            stany: Słownik {nazwa_skladnika: ilosc_rzeczywista}.
+            powod: Powód korekty zapisywany w historii.
+            czas: Czas korekty (domyślnie bieżący czas).
+
+        Returns:
+            Słownik {nazwa_skladnika: roznica} dla zmienionych stanów.
+
+        Raises:
+            KeyError: Gdy jakiś składnik nie istnieje.
+            ValueError: Gdy któraś ilość jest ujemna.
+        """
+        self._sprawdz_skladniki(stany)
+        for skladnik_nazwa, ilosc in stany.items():
+            if ilosc < 0:
+                raise ValueError(
+                    f"Ilość składnika {skladnik_nazwa} nie może być ujemna"
+                )
+
+        if czas is None:
+            czas = datetime.now()
+        roznice = {}
+        with partia_zdarzen(self.szyna), \
+                self._zablokuj(self._sloty[nazwa] for nazwa in stany):
+            for skladnik_nazwa, ilosc in stany.items():
+                roznica = self.skladniki[skladnik_nazwa].koryguj_stan(
+                    ilosc, powod, czas)
+                if roznica:
+                    roznice[skladnik_nazwa] = roznica
+        return roznice
+
+    def _sprawdz_skladniki(self, nazwy) -> None:
+        """Zgłasza KeyError dla pierwszej nazwy spoza systemu."""
+        for skladnik_nazwa in nazwy:
+            if skladnik_nazwa not in self.skladniki:
+                raise KeyError(f"Składnik {skladnik_nazwa} nie istnieje")
+
+    def znajdz_dostawy(self, dostawca: Optional[str] = None,
+                       od: Optional[datetime] = None,
+                       do: Optional[datetime] = None) -> List[Dict]:
+        """
+        Znajduje dostawy (opcjonalnie jednego dostawcy) w zakresie czasu.
+
+        Args:
+            dostawca: Nazwa dostawcy lub None dla wszystkich.
+            od: Początek zakresu (włącznie) lub None.
+            do: Koniec zakresu (włącznie) lub None.
+
+        Returns:
+            Lista dostaw uporządkowana według czasu dostawy.
+        """
+        return self.dziennik_dostaw.znajdz(dostawca, od, do)
+
+    def wydatki_dostawcow(self) -> Dict[str, float]:
+        """
+        Zwraca łączne wydatki na dostawy od każdego dostawcy.
+
+        Returns:
+            Słownik {dostawca: wydatki}.
+        """
+        return self.dziennik_dostaw.wydatki_dostawcow()
+
+    def wydatki_dostawcy(self, dostawca: str) -> Dict[str, float]:
+        """
+        Zwraca wydatki na poszczególne składniki u dostawcy.
+
+        Args:
+            dostawca: Nazwa dostawcy.
+
+        Returns:
+            Słownik {nazwa_skladnika: wydatki}.
+        """
+        return self.dziennik_dostaw.wydatki_dostawcy(dostawca)
+
+    def lista_do_zamowienia(self) -> List[Skladnik]:
+        """
+        Tworzy listę składników do zamówienia.
+
+        Returns:
+            Lista składników, których ilość jest poniżej minimalnej.
+        """
+        return list(self._do_zamowienia.values())
+
+    def znajdz_przeterminowane(self) -> List[Skladnik]:
+        """
+        Znajduje wszystkie przeterminowane składniki.
+
+        Returns:
+            Lista przeterminowanych składników
+            (od najwcześniejszej daty ważności).
+        """
+        return self.znajdz_wygasajace_przed(datetime.now())
+
+    def znajdz_wygasajace_przed(self, termin: datetime) -> List[Skladnik]:
+        """
+        Znajduje składniki z datą ważności wcześniejszą niż termin.
+
+        Args:
+            termin: Graniczna data (wyłącznie).
+
+        Returns:
+            Lista składników posortowana według daty ważności.
+        """
+        koniec = bisect_left(self._indeks_waznosci, (termin,))
+        return [self.skladniki[nazwa]
+                for _, nazwa in self._indeks_waznosci[:koniec]]
+
+    def spisz_przeterminowane(
+            self, teraz: Optional[datetime] = None) -> Dict[str, float]:
+        """
+        Spisuje przeterminowane partie wszystkich składników.
+
+        Indeks dat ważności przechowuje najwcześniejszą datę partii
+        każdego składnika, więc przeglądane są tylko składniki,
+        które mają przeterminowane partie.
+
+        Args:
+            teraz: Chwila odniesienia (domyślnie bieżący czas).
+
+        Returns:
+            Słownik {nazwa_skladnika: spisana_ilosc}.
+        """
+        if teraz is None:
+            teraz = datetime.now()
+
+        spisane = {}
+        with partia_zdarzen(self.szyna):
+            for skladnik in self.znajdz_wygasajace_przed(teraz):
+                ilosc = skladnik.spisz_przeterminowane(teraz)
+                if ilosc:
+                    spisane[skladnik.nazwa] = ilosc
+        return spisane
+
+    def znajdz_wygasajace(self, dni: float) -> List[Skladnik]:
+        """
+        Znajduje nieprzeterminowane składniki tracące ważność w ciągu N dni.
+
+        Args:
+            dni: Liczba dni od teraz.
+
+        Returns:
+            Lista składników posortowana według daty ważności.
+
+        Raises:
+            ValueError: Gdy liczba dni jest ujemna.
+        """
+        if dni < 0:
+            raise ValueError("Liczba dni nie może być ujemna")
+
+        teraz = datetime.now()
+        termin = teraz + timedelta(days=dni)
+        poczatek = bisect_left(self._indeks_waznosci, (teraz,))
+        koniec = bisect_left(self._indeks_waznosci, (termin,))
+        return [self.skladniki[nazwa]
+                for _, nazwa in self._indeks_waznosci[poczatek:koniec]]
+
+    def oblicz_wartosc_magazynu(self) -> float:
+        """
+        Oblicza całkowitą wartość magazynu.
+
+        Wartość jest utrzymywana na bieżąco przy zmianach ilości i cen,
+        więc odczyt nie przegląda składników.
+
+        Returns:
+            Całkowita wartość wszystkich składników w magazynie.
+        """
+        return round(self._wartosc_magazynu, 2)
+
+    def wartosc_kategorii(self) -> Dict[str, float]:
+        """
+        Zwraca wartość magazynu w podziale na kategorie składników.
+
+        Składniki bez kategorii są uwzględniane tylko w wartości całkowitej.
+
+        Returns:
+            Słownik {kategoria: wartosc}.
+        """
+        return {kategoria: round(wartosc, 2)
+                for kategoria, wartosc in self._wartosc_kategorii.items()}
+
+    def uzgodnij_wartosc_magazynu(self) -> float:
+        """
+        Porównuje sumy bieżące z pełnym przeliczeniem i je koryguje.
+
+        Metoda diagnostyczna: przelicza wartość każdego składnika od nowa
+        i zastępuje nią sumy bieżące (usuwając np. dryf zaokrągleń).
+
+        Returns:
+            Rozbieżność (pełne przeliczenie minus suma bieżąca)
+            sprzed korekty.
+        """
+        wartosci = {nazwa: skladnik.wartosc_zapasu()
+                    for nazwa, skladnik in self.skladniki.items()}
+        kategorie: Dict[str, float] = {}
+        for nazwa, wartosc in wartosci.items():
+            kategoria = self.skladniki[nazwa].kategoria
+            if kategoria:
+                kategorie[kategoria] = kategorie.get(kategoria, 0.0) + wartosc
+
+        suma = sum(wartosci.values())
+        rozbieznosc = round(suma - self._wartosc_magazynu, 2)
+        self._wartosci_skladnikow = wartosci
+        self._wartosc_kategorii = kategorie
+        self._wartosc_magazynu = suma
+        return rozbieznosc
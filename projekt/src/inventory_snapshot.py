@@ -0,0 +1,469 @@
+"""
+Moduł z binarną migawką stanu magazynu.
+Zawiera klasę zapisującą składniki, partie, historie ruchów i przepisy
+w plikach o rekordach stałej długości oraz wczytującą je leniwie
+przez mapowanie plików w pamięci.
+"""
+
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+import json
+import mmap
+import os
+import struct
+
+from .inventory_control import Partia, Skladnik, ZarzadzanieSkladnikami
+from .stock_ledger import EPOKA, MIKROSEKUNDA, RejestrRuchow
+
+MAGIA = b"MAGAZYN1"
+BRAK_DATY = -(2 ** 63)
+USUNIETY = 0xFFFFFFFF
+
+# magia, liczba rekordów, liczba ruchów, czas ostatniego ruchu,
+# czy ruchy są uporządkowane chronologicznie
+_NAGLOWEK = struct.Struct("<8sIIqB7x")
+# nazwa, jednostka, dostawca, kategoria, lokalizacja (kody tekstów),
+# ilość, minimalna ilość, cena, data ważności, pierwsza partia,
+# liczba partii, liczba zapisanych ruchów
+_REKORD = struct.Struct("<5I3dq3I")
+# Ruchy są zapisywane blokami: liczba ruchów n, a po niej kolumny
+# stałej szerokości (czas, numer rekordu składnika, kod operacji,
+# ilość, kod referencji) po n wartości każda
+_KOLUMNY_RUCHOW = ("q", "i", "i", "d", "i")
+# ilość, data ważności, kod identyfikatora dostawy
+_PARTIA = struct.Struct("<dqI")
+_DLUGOSC = struct.Struct("<I")
+
+PLIK_SKLADNIKOW = "skladniki.bin"
+PLIK_TEKSTOW = "teksty.bin"
+PLIK_RUCHOW = "ruchy.bin"
+PLIK_PARTII = "partie.bin"
+PLIK_PRZEPISOW = "przepisy.json"
+
+
+def _na_mikrosekundy(czas: Optional[datetime]) -> int:
+    """Zamienia datę (lub None) na liczbę mikrosekund od epoki."""
+    if czas is None:
+        return BRAK_DATY
+    return (czas - EPOKA) // MIKROSEKUNDA
+
+
+def _z_mikrosekund(wartosc: int) -> Optional[datetime]:
+    """Zamienia liczbę mikrosekund od epoki na datę (lub None)."""
+    if wartosc == BRAK_DATY:
+        return None
+    return EPOKA + timedelta(microseconds=wartosc)
+
+
+class MigawkaMagazynu:
+    """
+    Binarna migawka stanu magazynu w katalogu na dysku.
+
+    Składniki są rekordami stałej długości w pliku skladniki.bin,
+    ruchy z rejestru - blokami kolumn stałej szerokości w ruchy.bin,
+    a partie - rekordami w partie.bin.
+    Teksty (nazwy, jednostki, operacje, referencje) są internowane
+    w dopisywanej tablicy teksty.bin. Otwarcie migawki mapuje pliki
+    w pamięci i czyta tylko nagłówek; składnik powstaje dopiero przy
+    pierwszym odwołaniu do niego.
+
+    Zapis jest przyrostowy: nadpisywane są tylko rekordy składników,
+    które się zmieniły, nowe ruchy i teksty są dopisywane na końcu
+    plików, a zmienione partie dopisywane jako nowy blok.
+
+    Atrybuty:
+        katalog (str): Katalog z plikami migawki.
+    """
+
+    def __init__(self, katalog: str):
+        """
+        Otwiera migawkę (tworzy pustą, gdy katalog jej nie zawiera).
+
+        Args:
+            katalog: Katalog z plikami migawki.
+
+        Raises:
+            ValueError: Gdy plik składników nie jest plikiem migawki.
+        """
+        self.katalog = katalog
+        os.makedirs(katalog, exist_ok=True)
+        if not os.path.exists(self._sciezka(PLIK_SKLADNIKOW)):
+            self._utworz()
+
+        self._mapy: Dict[str, object] = {}
+        self._teksty: Optional[List[str]] = None
+        self._kody_tekstow: Optional[Dict[str, int]] = None
+        self._indeks: Optional[Dict[str, int]] = None
+        self._rejestr: Optional[RejestrRuchow] = None
+        self._skladniki: Dict[str, Skladnik] = {}
+        self._zarzadzanie: Optional[ZarzadzanieSkladnikami] = None
+        self._otworz_mapy()
+
+    def _sciezka(self, plik: str) -> str:
+        """Zwraca ścieżkę pliku migawki."""
+        return os.path.join(self.katalog, plik)
+
+    def _utworz(self) -> None:
+        """Tworzy puste pliki migawki."""
+        with open(self._sciezka(PLIK_SKLADNIKOW), "wb") as plik:
+            plik.write(_NAGLOWEK.pack(MAGIA, 0, 0, BRAK_DATY, 1))
+        with open(self._sciezka(PLIK_TEKSTOW), "wb") as plik:
+            plik.write(_DLUGOSC.pack(0))  # tekst 0 to pusty napis
+        for nazwa in (PLIK_RUCHOW, PLIK_PARTII):
+            open(self._sciezka(nazwa), "wb").close()
+        with open(self._sciezka(PLIK_PRZEPISOW), "w",
+                  encoding="utf-8") as plik:
+            plik.write("{}")
+
+    def _otworz_mapy(self) -> None:
+        """Mapuje pliki binarne w pamięci i czyta nagłówek."""
+        for nazwa in (PLIK_SKLADNIKOW, PLIK_TEKSTOW, PLIK_RUCHOW,
+                      PLIK_PARTII):
+            with open(self._sciezka(nazwa), "rb") as plik:
+                if os.fstat(plik.fileno()).st_size:
+                    self._mapy[nazwa] = mmap.mmap(
+                        plik.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self._mapy[nazwa] = b""
+
+            if nazwa == PLIK_SKLADNIKOW:
+                mapa = self._mapy[nazwa]
+                if len(mapa) < _NAGLOWEK.size \
+                        or mapa[:len(MAGIA)] != MAGIA:
+                    self.zamknij()
+                    raise ValueError(f"Katalog {self.katalog} nie zawiera "
+                                     f"prawidłowej migawki magazynu")
+                (_, self._liczba_rekordow, self._liczba_ruchow,
+                 self._ostatni_czas, chronologiczny) = \
+                    _NAGLOWEK.unpack_from(mapa)
+                self._chronologiczny = bool(chronologiczny)
+
+    def zamknij(self) -> None:
+        """Zamyka mapowania plików."""
+        for mapa in self._mapy.values():
+            if isinstance(mapa, mmap.mmap):
+                mapa.close()
+        self._mapy = {}
+
+    def __enter__(self) -> "MigawkaMagazynu":
+        """Zwraca migawkę do użycia w bloku with."""
+        return self
+
+    def __exit__(self, *wyjatek) -> None:
+        """Zamyka migawkę po wyjściu z bloku with."""
+        self.zamknij()
+
+    def _rekord(self, numer: int) -> Tuple:
+        """Odczytuje rekord składnika o podanym numerze."""
+        return _REKORD.unpack_from(self._mapy[PLIK_SKLADNIKOW],
+                                   _NAGLOWEK.size + numer * _REKORD.size)
+
+    def _rekordy(self) -> Iterator[Tuple]:
+        """Iteruje po wszystkich rekordach składników."""
+        mapa = self._mapy[PLIK_SKLADNIKOW]
+        koniec = _NAGLOWEK.size + self._liczba_rekordow * _REKORD.size
+        return _REKORD.iter_unpack(mapa[_NAGLOWEK.size:koniec])
+
+    def _wczytaj_teksty(self) -> List[str]:
+        """Dekoduje tablicę tekstów (raz, przy pierwszej potrzebie)."""
+        if self._teksty is None:
+            dane = self._mapy[PLIK_TEKSTOW]
+            teksty = []
+            pozycja = 0
+            while pozycja < len(dane):
+                (dlugosc,) = _DLUGOSC.unpack_from(dane, pozycja)
+                pozycja += _DLUGOSC.size
+                teksty.append(
+                    bytes(dane[pozycja:pozycja + dlugosc]).decode("utf-8"))
+                pozycja += dlugosc
+            self._teksty = teksty
+            self._kody_tekstow = {tekst: kod
+                                  for kod, tekst in enumerate(teksty)}
+        return self._teksty
+
+    def _indeks_nazw(self) -> Dict[str, int]:
+        """Zwraca słownik {nazwa_skladnika: numer_rekordu}."""
+        if self._indeks is None:
+            teksty = self._wczytaj_teksty()
+            self._indeks = {teksty[rekord[0]]: numer
+                            for numer, rekord in enumerate(self._rekordy())
+                            if rekord[0] != USUNIETY}
+        return self._indeks
+
+    def _rejestr_ruchow(self) -> RejestrRuchow:
+        """
+        Zwraca rejestr ruchów migawki.
+
+        Kolumny ruchów są wczytywane z pliku dopiero przy pierwszym
+        odczycie historii lub zapisie ruchu, nie przy odtworzeniu składnika.
+        """
+        if self._rejestr is None:
+            self._rejestr = RejestrRuchow.leniwy(self._wczytaj_ruchy)
+        return self._rejestr
+
+    def _wczytaj_ruchy(self) -> RejestrRuchow:
+        """Wczytuje kolumny rejestru ruchów z pliku."""
+        dane = self._mapy[PLIK_RUCHOW]
+        kolumny = [array(typ) for typ in _KOLUMNY_RUCHOW]
+        pozycja = 0
+        while pozycja < len(dane):
+            (liczba,) = _DLUGOSC.unpack_from(dane, pozycja)
+            pozycja += _DLUGOSC.size
+            for kolumna in kolumny:
+                koniec = pozycja + liczba * kolumna.itemsize
+                kolumna.frombytes(dane[pozycja:koniec])
+                pozycja = koniec
+        return RejestrRuchow.z_kolumn(
+            *kolumny, self._wczytaj_teksty(), self._liczba_rekordow,
+            self._chronologiczny)
+
+    def __len__(self) -> int:
+        """Zwraca liczbę składników w migawce."""
+        return len(self._indeks_nazw())
+
+    def __contains__(self, nazwa: object) -> bool:
+        """Sprawdza, czy migawka zawiera składnik o podanej nazwie."""
+        return nazwa in self._indeks_nazw()
+
+    def nazwy(self) -> List[str]:
+        """
+        Zwraca nazwy składników w kolejności rekordów.
+
+        Returns:
+            Lista nazw składników.
+        """
+        return list(self._indeks_nazw())
+
+    def __getitem__(self, nazwa: str) -> Skladnik:
+        """
+        Zwraca składnik, tworząc go przy pierwszym odwołaniu.
+
+        Args:
+            nazwa: Nazwa składnika.
+
+        Returns:
+            Składnik odtworzony z rekordu.
+
+        Raises:
+            KeyError: Gdy migawka nie zawiera składnika.
+        """
+        skladnik = self._skladniki.get(nazwa)
+        if skladnik is not None:
+            return skladnik
+
+        numer = self._indeks_nazw().get(nazwa)
+        if numer is None:
+            raise KeyError(f"Składnik {nazwa} nie istnieje")
+
+        teksty = self._wczytaj_teksty()
+        (_, jednostka, dostawca, kategoria, lokalizacja, ilosc, min_ilosc,
+         cena, data, pierwsza, liczba, _) = self._rekord(numer)
+        dane = self._mapy[PLIK_PARTII]
+        partie = [
+            Partia(ilosc_partii, _z_mikrosekund(data_partii),
+                   teksty[dostawa])
+            for ilosc_partii, data_partii, dostawa in _PARTIA.iter_unpack(
+                dane[pierwsza * _PARTIA.size:
+                     (pierwsza + liczba) * _PARTIA.size])
+        ]
+        skladnik = Skladnik.odtworz(
+            nazwa, teksty[jednostka], ilosc, min_ilosc, cena,
+            _z_mikrosekund(data), teksty[dostawca], teksty[kategoria],
+            teksty[lokalizacja], partie, self._rejestr_ruchow(), numer)
+        self._skladniki[nazwa] = skladnik
+        return skladnik
+
+    def przepisy(self) -> Dict[str, Dict]:
+        """
+        Wczytuje zapisane przepisy.
+
+        Returns:
+            Słownik przepisów w formacie ZarzadzanieSkladnikami.przepisy.
+        """
+        with open(self._sciezka(PLIK_PRZEPISOW), encoding="utf-8") as plik:
+            przepisy = json.load(plik)
+        return {
+            nazwa_dania: {
+                skladnik: tuple(ilosc) if isinstance(ilosc, list) else ilosc
+                for skladnik, ilosc in przepis.items()
+            }
+            for nazwa_dania, przepis in przepisy.items()
+        }
+
+    def zaladuj(self) -> ZarzadzanieSkladnikami:
+        """
+        Tworzy system zarządzania składnikami ze stanu migawki.
+
+        Składniki są współdzielone z dostępem przez migawka[nazwa],
+        a kolejne wywołania (do następnego zapisu) zwracają ten sam
+        obiekt.
+
+        Returns:
+            System zarządzania składnikami z przepisami.
+        """
+        if self._zarzadzanie is None:
+            zarzadzanie = ZarzadzanieSkladnikami(
+                rejestr=self._rejestr_ruchow())
+            for nazwa in self._indeks_nazw():
+                zarzadzanie.dodaj_skladnik(self[nazwa])
+            zarzadzanie.dodaj_przepisy(self.przepisy())
+            self._zarzadzanie = zarzadzanie
+        return self._zarzadzanie
+
+    def _kod_tekstu(self, tekst: str, nowe: List[str]) -> int:
+        """Zwraca kod tekstu, dopisując go do nowe przy pierwszym użyciu."""
+        kod = self._kody_tekstow.get(tekst)
+        if kod is None:
+            kod = len(self._teksty)
+            self._teksty.append(tekst)
+            self._kody_tekstow[tekst] = kod
+            nowe.append(tekst)
+        return kod
+
+    def zapisz(self, zarzadzanie: ZarzadzanieSkladnikami) -> int:
+        """
+        Zapisuje przyrostowo stan systemu do migawki.
+
+        Ruchy składnika są zapisywane od pierwszego niezapisanego wpisu
+        jego historii. Składnik, którego historia jest krótsza niż
+        zapisana (np. usunięty i dodany ponownie pod tą samą nazwą),
+        dostaje nowy rekord. Rekordy składników usuniętych z systemu
+        są oznaczane jako usunięte.
+
+        Args:
+            zarzadzanie: System zarządzania składnikami.
+
+        Returns:
+            Liczba nadpisanych lub dopisanych rekordów składników.
+        """
+        self._wczytaj_teksty()
+        indeks = self._indeks_nazw()
+        try:
+            zmiany = self._przygotuj_zapis(zarzadzanie, indeks)
+        except Exception:
+            # Teksty i indeks mogły zostać częściowo zmienione w pamięci
+            self._teksty = self._kody_tekstow = self._indeks = None
+            raise
+        return zmiany
+
+    def _przygotuj_zapis(self, zarzadzanie: ZarzadzanieSkladnikami,
+                         indeks: Dict[str, int]) -> int:
+        """Wyznacza zmiany względem migawki i zapisuje je na dysk."""
+        stare_partie = self._mapy[PLIK_PARTII]
+        liczba_partii = len(stare_partie) // _PARTIA.size
+        liczba_rekordow = self._liczba_rekordow
+        nowe_teksty: List[str] = []
+        nowe_partie = bytearray()
+        ruchy: List[Tuple] = []
+        zmiany: Dict[int, bytes] = {}
+
+        for nazwa, numer in list(indeks.items()):
+            if nazwa not in zarzadzanie.skladniki:
+                zmiany[numer] = self._rekord_usuniety(numer)
+                del indeks[nazwa]
+
+        for nazwa, skladnik in zarzadzanie.skladniki.items():
+            numer = indeks.get(nazwa)
+            stary = None if numer is None else self._rekord(numer)
+            wiersze = skladnik.rejestr.wiersze(skladnik.kod)
+            if stary is not None and len(wiersze) < stary[11]:
+                zmiany[numer] = self._rekord_usuniety(numer)
+                stary = None
+            if stary is None:
+                numer = liczba_rekordow
+                liczba_rekordow += 1
+                indeks[nazwa] = numer
+
+            partie = b"".join(
+                _PARTIA.pack(partia.ilosc,
+                             _na_mikrosekundy(partia.data_waznosci),
+                             self._kod_tekstu(partia.dostawa_id,
+                                              nowe_teksty))
+                for partia in skladnik.partie)
+            if stary is not None and partie == stare_partie[
+                    stary[9] * _PARTIA.size:
+                    (stary[9] + stary[10]) * _PARTIA.size]:
+                pierwsza = stary[9]
+            else:
+                pierwsza = liczba_partii + len(nowe_partie) // _PARTIA.size
+                nowe_partie += partie
+
+            rejestr = skladnik.rejestr
+            zapisane = 0 if stary is None else stary[11]
+            for wiersz in wiersze[zapisane:]:
+                ruchy.append((
+                    rejestr.czasy[wiersz], numer,
+                    self._kod_tekstu(rejestr.operacja(wiersz), nowe_teksty),
+                    rejestr.ilosci[wiersz],
+                    self._kod_tekstu(rejestr.referencja(wiersz),
+                                     nowe_teksty)))
+
+            rekord = _REKORD.pack(
+                self._kod_tekstu(nazwa, nowe_teksty),
+                self._kod_tekstu(skladnik.jednostka, nowe_teksty),
+                self._kod_tekstu(skladnik.dostawca, nowe_teksty),
+                self._kod_tekstu(skladnik.kategoria, nowe_teksty),
+                self._kod_tekstu(skladnik.lokalizacja, nowe_teksty),
+                skladnik.ilosc_na_stanie, skladnik.min_ilosc,
+                skladnik.cena_jednostkowa,
+                _na_mikrosekundy(skladnik.data_waznosci_skladnika),
+                pierwsza, len(partie) // _PARTIA.size, len(wiersze))
+            if stary is None or rekord != _REKORD.pack(*stary):
+                zmiany[numer] = rekord
+
+        ruchy.sort(key=lambda ruch: ruch[0])
+        if ruchy:
+            if ruchy[0][0] < self._ostatni_czas:
+                self._chronologiczny = False
+            self._ostatni_czas = max(self._ostatni_czas, ruchy[-1][0])
+        self._liczba_rekordow = liczba_rekordow
+        self._liczba_ruchow += len(ruchy)
+
+        self._zapisz_pliki(zmiany, nowe_teksty, nowe_partie, ruchy,
+                           zarzadzanie.przepisy)
+        return len(zmiany)
+
+    def _rekord_usuniety(self, numer: int) -> bytes:
+        """Zwraca rekord z oznaczeniem składnika jako usuniętego."""
+        return _REKORD.pack(USUNIETY, *self._rekord(numer)[1:])
+
+    def _zapisz_pliki(self, zmiany: Dict[int, bytes], nowe_teksty: List[str],
+                      nowe_partie: bytearray, ruchy: List[Tuple],
+                      przepisy: Dict[str, Dict]) -> None:
+        """Zapisuje zmiany na dysk i odświeża mapowania."""
+        self.zamknij()
+
+        with open(self._sciezka(PLIK_TEKSTOW), "ab") as plik:
+            for tekst in nowe_teksty:
+                bajty = tekst.encode("utf-8")
+                plik.write(_DLUGOSC.pack(len(bajty)) + bajty)
+        with open(self._sciezka(PLIK_PARTII), "ab") as plik:
+            plik.write(nowe_partie)
+        if ruchy:
+            with open(self._sciezka(PLIK_RUCHOW), "ab") as plik:
+                plik.write(_DLUGOSC.pack(len(ruchy)))
+                for typ, kolumna in zip(_KOLUMNY_RUCHOW, zip(*ruchy)):
+                    plik.write(array(typ, kolumna).tobytes())
+        with open(self._sciezka(PLIK_SKLADNIKOW), "r+b") as plik:
+            for numer in sorted(zmiany):
+                plik.seek(_NAGLOWEK.size + numer * _REKORD.size)
+                plik.write(zmiany[numer])
+            plik.seek(0)
+            plik.write(_NAGLOWEK.pack(
+                MAGIA, self._liczba_rekordow, self._liczba_ruchow,
+                self._ostatni_czas, self._chronologiczny))
+
+        tresc = json.dumps(przepisy, ensure_ascii=False)
+        with open(self._sciezka(PLIK_PRZEPISOW), encoding="utf-8") as plik:
+            zmienione = plik.read() != tresc
+        if zmienione:
+            with open(self._sciezka(PLIK_PRZEPISOW), "w",
+                      encoding="utf-8") as plik:
+                plik.write(tresc)
+
+        # Obiekty utworzone wcześniej odpowiadają poprzedniemu stanowi
+        self._rejestr = None
+        self._skladniki = {}
+        self._zarzadzanie = None
+        self._otworz_mapy()
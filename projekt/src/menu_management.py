@@ -1,266 +1,1157 @@
-"""
-Moduł zarządzający menu restauracji.
-Zawiera klasy do obsługi dań, kategorii oraz całego menu.
-
-Kod aplikacji z modułu menu_management.py wygenerwoany przy użyciu Claude.ai
-model Claude Sonnet 3.7
-"""
-
-from typing import List, Optional, Dict, Set
-from datetime import datetime
-
-
-class Danie:
-    """
-    Klasa reprezentująca pojedyncze danie w menu restauracji.
-
-    Atrybuty:
-        nazwa (str): Unikalna nazwa dania.
-        cena (float): Cena dania w PLN.
-        kategoria (str): Kategoria dania (np. przystawka, zupa, danie główne).
-        czas_przygotowania (int): Przybliżony czas przygotowania w minutach.
-        dostepne (bool): Czy danie jest obecnie dostępne.
-        skladniki (List[str]): Lista głównych składników dania.
-        kalorie (Optional[int]): Liczba kalorii lub None jeśli nieznana.
-        data_dodania (datetime): Data dodania dania do menu.
-    """
-
-    def __init__(self, nazwa: str, cena: float,
-                 kategoria: str, czas_przygotowania: int = 30,
-                 skladniki: Optional[List[str]] = None,
-                 kalorie: Optional[int] = None):
-        """
-        Inicjalizuje nowe danie w menu.
-
-        Args:
-            nazwa: Unikalna nazwa dania.
-            cena: Cena dania w PLN (>0).
-            kategoria: Kategoria dania.
-            czas_przygotowania: Czas przygotowania w minutach.
-            skladniki: Lista głównych składników dania.
-            kalorie: Liczba kalorii lub None jeśli nieznana.
-
-        Raises:
-            ValueError: Gdy cena jest ujemna lub równa zero.
-        """
-        if cena <= 0:
-            raise ValueError("Cena dania musi być większa od zera")
-
-        self.nazwa = nazwa
-        self.cena = cena
-        self.kategoria = kategoria
-        self.czas_przygotowania = czas_przygotowania
-        self.dostepne = True
-        self.skladniki = skladniki or []
-        self.kalorie = kalorie
-        self.data_dodania = datetime.now()
-
-    def zmien_cene(self, nowa_cena: float) -> None:
-        """
-        Zmienia cenę dania.
-
-        Args:
-            nowa_cena: Nowa cena dania (>0).
-
-        Raises:
-            ValueError: Gdy nowa cena jest ujemna lub równa zero.
-        """
-        if nowa_cena <= 0:
-            raise ValueError("Cena musi być większa od zera")
-        self.cena = nowa_cena
-
-    def ustaw_dostepnosc(self, dostepne: bool) -> None:
-        """
-        Ustawia dostępność dania w menu.
-
-        Args:
-            dostepne: Czy danie ma być dostępne.
-        """
-        self.dostepne = dostepne
-
-    def dodaj_skladnik(self, skladnik: str) -> None:
-        """
-        Dodaje składnik do dania.
-
-        Args:
-            skladnik: Nazwa składnika do dodania.
-
-        Raises:
-            ValueError: Gdy składnik już istnieje w daniu.
-        """
-        if skladnik in self.skladniki:
-            raise ValueError(f"Składnik {skladnik} już jest częścią dania")
-        self.skladniki.append(skladnik)
-
-    def usun_skladnik(self, skladnik: str) -> None:
-        """
-        Usuwa składnik z dania.
-
-        Args:
-            skladnik: Nazwa składnika do usunięcia.
-
-        Raises:
-            ValueError: Gdy składnik nie istnieje w daniu.
-        """
-        if skladnik not in self.skladniki:
-            raise ValueError(f"Składnik {skladnik} nie jest częścią dania")
-        self.skladniki.remove(skladnik)
-
-
-class Menu:
-    """
-    Klasa reprezentująca całe menu restauracji.
-
-    Atrybuty:
-        dania (Dict[str, Danie]): Słownik dań (nazwa: obiekt dania).
-        kategorie (Set[str]): Zbiór wszystkich kategorii w menu.
-        dania_dnia (List[Danie]): Lista dań dnia.
-        max_dania_dnia (int): Maksymalna liczba dań dnia.
-        data_aktualizacji (datetime): Data ostatniej aktualizacji menu.
-    """
-
-    def __init__(self, max_dania_dnia: int = 3):
-        """
-        Inicjalizuje nowe puste menu.
-
-        Args:
-            max_dania_dnia: Maksymalna liczba dań dnia.
-
-        Raises:
-            ValueError: Gdy max_dania_dnia jest mniejsze od 1.
-        """
-        if max_dania_dnia < 1:
-            raise ValueError("Maksymalna liczba dań"
-                             " dnia musi być większa od 0")
-
-        self.dania: Dict[str, Danie] = {}
-        self.kategorie: Set[str] = set()
-        self.dania_dnia: List[Danie] = []
-        self.max_dania_dnia = max_dania_dnia
-        self.data_aktualizacji = datetime.now()
-
-    def dodaj_danie(self, danie: Danie) -> None:
-        """
-        Dodaje danie do menu.
-
-        Args:
-            danie: Obiekt dania do dodania.
-
-        Raises:
-            ValueError: Gdy danie o takiej nazwie już istnieje w menu.
-        """
-        if danie.nazwa in self.dania:
-            raise ValueError(f"Danie o nazwie {danie.nazwa} "
-                             f"już istnieje w menu")
-        self.dania[danie.nazwa] = danie
-        self.kategorie.add(danie.kategoria)
-        self.data_aktualizacji = datetime.now()
-
-    def usun_danie(self, nazwa: str) -> None:
-        """
-        Usuwa danie z menu.
-
-        Args:
-            nazwa: Nazwa dania do usunięcia.
-
-        Raises:
-            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
-        """
-        if nazwa not in self.dania:
-            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
-
-        # Usuń z dań dnia jeśli było
-        if self.dania[nazwa] in self.dania_dnia:
-            self.dania_dnia.remove(self.dania[nazwa])
-
-        kategoria_usuwanego = self.dania[nazwa].kategoria
-        del self.dania[nazwa]
-
-        # Sprawdź czy to była ostatnia kategoria
-        if not any(d.kategoria == kategoria_usuwanego
-                   for d in self.dania.values()):
-            self.kategorie.remove(kategoria_usuwanego)
-
-        self.data_aktualizacji = datetime.now()
-
-    def znajdz_dania_po_kategorii(self, kategoria: str) -> List[Danie]:
-        """
-        Znajduje wszystkie dania należące do danej kategorii.
-
-        Args:
-            kategoria: Kategoria dań do znalezienia.
-
-        Returns:
-            Lista dań należących do danej kategorii.
-        """
-        return [danie for danie in self.dania.values()
-                if danie.kategoria == kategoria]
-
-    def znajdz_dania_w_cenie(self, min_cena: float,
-                             max_cena: float) -> List[Danie]:
-        """
-        Znajduje wszystkie dostępne dania w podanym przedziale cenowym.
-
-        Args:
-            min_cena: Minimalna cena dania.
-            max_cena: Maksymalna cena dania.
-
-        Returns:
-            Lista dostępnych dań w podanym przedziale cenowym.
-
-        Raises:
-            ValueError: Gdy min_cena jest większa od max_cena.
-        """
-        if min_cena > max_cena:
-            raise ValueError("Minimalna cena "
-                             "nie może być większa od maksymalnej")
-
-        return [danie for danie in self.dania.values()
-                if min_cena <= danie.cena <= max_cena and danie.dostepne]
-
-    def dodaj_danie_dnia(self, nazwa: str) -> None:
-        """
-        Dodaje danie do listy dań dnia.
-
-        Args:
-            nazwa: Nazwa dania do dodania.
-
-        Raises:
-            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
-            ValueError: Gdy danie jest już na liście dań dnia
-            lub lista jest pełna.
-        """
-        if nazwa not in self.dania:
-            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
-
-        danie = self.dania[nazwa]
-
-        if danie in self.dania_dnia:
-            raise ValueError(f"Danie {nazwa} jest już na liście dań dnia")
-
-        if len(self.dania_dnia) >= self.max_dania_dnia:
-            raise ValueError(f"Lista dań dnia jest pełna "
-                             f"(max: {self.max_dania_dnia})")
-
-        self.dania_dnia.append(danie)
-
-    def usun_danie_dnia(self, nazwa: str) -> None:
-        """
-        Usuwa danie z listy dań dnia.
-
-        Args:
-            nazwa: Nazwa dania do usunięcia.
-
-        Raises:
-            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
-            ValueError: Gdy danie nie jest na liście dań dnia.
-        """
-        if nazwa not in self.dania:
-            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
-
-        danie = self.dania[nazwa]
-
-        if danie not in self.dania_dnia:
-            raise ValueError(f"Danie {nazwa} nie jest na liście dań dnia")
-
-        self.dania_dnia.remove(danie)
+"""
+Moduł zarządzający menu restauracji.
+Zawiera klasy do obsługi dań, kategorii oraz całego menu.
+
+Kod aplikacji z modułu menu_management.py wygenerwoany przy użyciu Claude.ai
+model Claude Sonnet 3.7
+"""
+
+import heapq
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import (Any, Callable, Iterable, Iterator, List, NamedTuple,
+                    Optional, Dict, Set, Tuple)
+from datetime import datetime, timedelta
+
+from .events import (POLE_DODANO, POLE_USUNIETO, TYP_DANIE, SzynaZdarzen,
+                     Zdarzenie)
+from .stock_ledger import EPOKA, MIKROSEKUNDA
+
+# Litery bez rozkładu Unicode na literę bazową i znak diakrytyczny
+ZNAKI_BEZ_ROZKLADU = str.maketrans({"ł": "l", "ø": "o", "đ": "d"})
+
+# Spakowany rekord dania: (nazwa, cena, kategoria, czas_przygotowania,
+# dostepne, skladniki, kalorie, data_dodania w µs od epoki)
+RekordDania = Tuple[str, float, str, int, bool, List[str], Optional[int],
+                    int]
+
+# Ile razy sprawdzenie warunku dla dania jest droższe od pobrania numeru
+# dania z indeksu (przy wyborze między przecięciem a filtrowaniem)
+KOSZT_WARUNKU = 8
+
+# Pola, według których można sortować wyniki Menu.zapytanie
+POLA_SORTOWANIA = ("nazwa", "cena", "kalorie", "czas_przygotowania",
+                   "data_dodania")
+
+
+def normalizuj_tekst(tekst: str) -> str:
+    """
+    Normalizuje nazwę do wyszukiwania bez względu na wielkość liter
+    i polskie znaki.
+
+    Args:
+        tekst: Tekst do znormalizowania, np. "Łosoś wędzony".
+
+    Returns:
+        Tekst małymi literami bez znaków diakrytycznych i zbędnych
+        spacji, np. "losos wedzony".
+    """
+    tekst = " ".join(tekst.lower().split()).translate(ZNAKI_BEZ_ROZKLADU)
+    return "".join(znak for znak in unicodedata.normalize("NFD", tekst)
+                   if not unicodedata.combining(znak))
+
+
+class Danie:
+    """
+    Klasa reprezentująca pojedyncze danie w menu restauracji.
+
+    Atrybuty:
+        nazwa (str): Unikalna nazwa dania.
+        cena (float): Cena dania w PLN.
+        kategoria (str): Kategoria dania (np. przystawka, zupa, danie główne).
+        czas_przygotowania (int): Przybliżony czas przygotowania w minutach.
+        dostepne (bool): Czy danie jest obecnie dostępne.
+        skladniki (List[str]): Lista głównych składników dania.
+        kalorie (Optional[int]): Liczba kalorii lub None jeśli nieznana.
+        data_dodania (datetime): Data dodania dania do menu.
+    """
+
+    def __init__(self, nazwa: str, cena: float,
+                 kategoria: str, czas_przygotowania: int = 30,
+                 skladniki: Optional[List[str]] = None,
+                 kalorie: Optional[int] = None):
+        """
+        Inicjalizuje nowe danie w menu.
+
+        Args:
+            nazwa: Unikalna nazwa dania.
+            cena: Cena dania w PLN (>0).
+            kategoria: Kategoria dania.
+            czas_przygotowania: Czas przygotowania w minutach.
+            skladniki: Lista głównych składników dania.
+            kalorie: Liczba kalorii lub None jeśli nieznana.
+
+        Raises:
+            ValueError: Gdy cena jest ujemna lub równa zero.
+        """
+        if cena <= 0:
+            raise ValueError("Cena dania musi być większa od zera")
+
+        self._obserwatorzy: List[Callable[["Danie", str, Any], None]] = []
+        self.nazwa = nazwa
+        self.cena = cena
+        self.kategoria = kategoria
+        self.czas_przygotowania = czas_przygotowania
+        self.dostepne = True
+        self.skladniki = skladniki or []
+        self.kalorie = kalorie
+        self.data_dodania = datetime.now()
+
+    @classmethod
+    def z_rekordu(cls, rekord: RekordDania) -> "Danie":
+        """
+        Odtwarza danie ze spakowanego rekordu bez walidacji.
+
+        Args:
+            rekord: Rekord dania (RekordDania).
+
+        Returns:
+            Odtworzone danie z zachowaną datą dodania.
+        """
+        nazwa, cena, kategoria, czas_przygotowania, dostepne, skladniki, \
+            kalorie, data_dodania = rekord
+        danie = cls.__new__(cls)
+        danie.__dict__.update(
+            _obserwatorzy=[],
+            nazwa=nazwa,
+            _cena=cena,
+            _kategoria=kategoria,
+            czas_przygotowania=czas_przygotowania,
+            _dostepne=dostepne,
+            skladniki=list(skladniki),
+            _kalorie=kalorie,
+            data_dodania=EPOKA + timedelta(microseconds=data_dodania),
+        )
+        return danie
+
+    def rekord(self) -> RekordDania:
+        """
+        Pakuje danie do rekordu.
+
+        Returns:
+            Rekord dania (RekordDania).
+        """
+        return (self.nazwa, self.cena, self.kategoria,
+                self.czas_przygotowania, self.dostepne, self.skladniki,
+                self.kalorie, (self.data_dodania - EPOKA) // MIKROSEKUNDA)
+
+    @property
+    def dostepne(self) -> bool:
+        """Czy danie jest obecnie dostępne."""
+        return self._dostepne
+
+    @dostepne.setter
+    def dostepne(self, wartosc: bool) -> None:
+        stara = self.__dict__.get("_dostepne")
+        if stara == wartosc and "_dostepne" in self.__dict__:
+            return
+        self._dostepne = wartosc
+        self._powiadom("dostepne", stara)
+
+    @property
+    def kalorie(self) -> Optional[int]:
+        """Liczba kalorii lub None jeśli nieznana."""
+        return self._kalorie
+
+    @kalorie.setter
+    def kalorie(self, wartosc: Optional[int]) -> None:
+        stara = self.__dict__.get("_kalorie")
+        if stara == wartosc and "_kalorie" in self.__dict__:
+            return
+        self._kalorie = wartosc
+        self._powiadom("kalorie", stara)
+
+    @property
+    def kategoria(self) -> str:
+        """Kategoria dania."""
+        return self._kategoria
+
+    @kategoria.setter
+    def kategoria(self, wartosc: str) -> None:
+        stara = self.__dict__.get("_kategoria")
+        if stara == wartosc and "_kategoria" in self.__dict__:
+            return
+        self._kategoria = wartosc
+        self._powiadom("kategoria", stara)
+
+    @property
+    def cena(self) -> float:
+        """Cena dania w PLN."""
+        return self._cena
+
+    @cena.setter
+    def cena(self, wartosc: float) -> None:
+        stara = self.__dict__.get("_cena")
+        if stara == wartosc and "_cena" in self.__dict__:
+            return
+        self._cena = wartosc
+        self._powiadom("cena", stara)
+
+    def dodaj_obserwatora(
+            self, obserwator: Callable[["Danie", str, Any], None]) -> None:
+        """
+        Rejestruje funkcję wywoływaną po zmianie dania.
+
+        Args:
+            obserwator: Funkcja wywoływana jako
+            obserwator(danie, pole, stara_wartosc).
+        """
+        self._obserwatorzy.append(obserwator)
+
+    def usun_obserwatora(
+            self, obserwator: Callable[["Danie", str, Any], None]) -> None:
+        """
+        Wyrejestrowuje funkcję obserwatora.
+
+        Args:
+            obserwator: Wcześniej zarejestrowana funkcja.
+
+        Raises:
+            ValueError: Gdy funkcja nie była zarejestrowana.
+        """
+        self._obserwatorzy.remove(obserwator)
+
+    def _powiadom(self, pole: str, stara_wartosc: Any) -> None:
+        """Powiadamia obserwatorów o zmianie pola."""
+        for obserwator in self._obserwatorzy:
+            obserwator(self, pole, stara_wartosc)
+
+    def zmien_cene(self, nowa_cena: float) -> None:
+        """
+        Zmienia cenę dania.
+
+        Args:
+            nowa_cena: Nowa cena dania (>0).
+
+        Raises:
+            ValueError: Gdy nowa cena jest ujemna lub równa zero.
+        """
+        if nowa_cena <= 0:
+            raise ValueError("Cena musi być większa od zera")
+        self.cena = nowa_cena
+
+    def ustaw_dostepnosc(self, dostepne: bool) -> None:
+        """
+        Ustawia dostępność dania w menu.
+
+        Args:
+            dostepne: Czy danie ma być dostępne.
+        """
+        self.dostepne = dostepne
+
+    def dodaj_skladnik(self, skladnik: str) -> None:
+        """
+        Dodaje składnik do dania.
+
+        Args:
+            skladnik: Nazwa składnika do dodania.
+
+        Raises:
+            ValueError: Gdy składnik już istnieje w daniu.
+        """
+        if skladnik in self.skladniki:
+            raise ValueError(f"Składnik {skladnik} już jest częścią dania")
+        stare = list(self.skladniki)
+        self.skladniki.append(skladnik)
+        self._powiadom("skladniki", stare)
+
+    def usun_skladnik(self, skladnik: str) -> None:
+        """
+        Usuwa składnik z dania.
+
+        Args:
+            skladnik: Nazwa składnika do usunięcia.
+
+        Raises:
+            ValueError: Gdy składnik nie istnieje w daniu.
+        """
+        if skladnik not in self.skladniki:
+            raise ValueError(f"Składnik {skladnik} nie jest częścią dania")
+        stare = list(self.skladniki)
+        self.skladniki.remove(skladnik)
+        self._powiadom("skladniki", stare)
+
+
+class _Normalizacje(dict):
+    """Pamięć podręczna {tekst: normalizuj_tekst(tekst)}."""
+
+    def __missing__(self, tekst: str) -> str:
+        """Normalizuje tekst i zapamiętuje wynik."""
+        wynik = self[tekst] = normalizuj_tekst(tekst)
+        return wynik
+
+
+class WidokDan(Mapping):
+    """
+    Widok dań menu jako słownika {nazwa: Danie}.
+
+    Dania są przechowywane w menu pod numerami; widok odwzorowuje nazwy
+    na numery. W menu wczytanym z pliku obiekty Danie są tworzone
+    dopiero przy pierwszym odczycie. Zmiany wykonuje się metodami Menu.
+    """
+
+    def __init__(self, numery: Dict[str, int], dania: Dict[int, Danie]):
+        """
+        Inicjalizuje widok dań.
+
+        Args:
+            numery: Słownik {nazwa_dania: numer} w kolejności menu.
+            dania: Słownik {numer: Danie}.
+        """
+        self._numery = numery
+        self._dania = dania
+
+    def __getitem__(self, nazwa: str) -> Danie:
+        """Zwraca danie o podanej nazwie."""
+        return self._dania[self._numery[nazwa]]
+
+    def __contains__(self, nazwa: object) -> bool:
+        """Sprawdza, czy danie jest w menu."""
+        return nazwa in self._numery
+
+    def __iter__(self) -> Iterator[str]:
+        """Iteruje po nazwach dań w kolejności menu."""
+        return iter(self._numery)
+
+    def __len__(self) -> int:
+        """Zwraca liczbę dań."""
+        return len(self._numery)
+
+    def __repr__(self) -> str:
+        """Zwraca reprezentację widoku jako słownika."""
+        return repr(dict(self))
+
+
+class _LeniweDania(dict):
+    """
+    Słownik {numer: Danie} tworzący dania ze spakowanych rekordów
+    przy pierwszym odczycie.
+    """
+
+    def __init__(self, rekordy: List[Optional[RekordDania]],
+                 obserwator: Callable[[Danie, str, Any], None]):
+        """
+        Inicjalizuje słownik bez utworzonych dań.
+
+        Args:
+            rekordy: Rekordy dań indeksowane numerem dania.
+            obserwator: Obserwator rejestrowany w tworzonych daniach.
+        """
+        super().__init__()
+        self._rekordy = rekordy
+        self._obserwator = obserwator
+
+    def __missing__(self, numer: int) -> Danie:
+        """Tworzy danie z rekordu i zapamiętuje je."""
+        if numer >= len(self._rekordy) or self._rekordy[numer] is None:
+            raise KeyError(numer)
+        danie = Danie.z_rekordu(self._rekordy[numer])
+        danie.dodaj_obserwatora(self._obserwator)
+        self._rekordy[numer] = None
+        self[numer] = danie
+        return danie
+
+    def rekord(self, numer: int) -> Optional[RekordDania]:
+        """Zwraca rekord dania, które nie zostało jeszcze utworzone."""
+        if numer < len(self._rekordy):
+            return self._rekordy[numer]
+        return None
+
+
+class _KrokZapytania(NamedTuple):
+    """
+    Krok planu zapytania do menu.
+
+    Atrybuty:
+        szacunek: Szacowana liczba dań spełniających kryterium.
+        nazwa: Nazwa kryterium.
+        numery: Funkcja zwracająca numery dań z indeksu kryterium.
+        warunek: Warunek sprawdzany dla pojedynczego dania.
+        zbior: Gotowy zbiór numerów dań (zamiast numery i warunek).
+        wyklucza: Czy numery ze zbioru są wykluczane z wyniku.
+    """
+    szacunek: int
+    nazwa: str
+    numery: Optional[Callable[[], Iterable[int]]] = None
+    warunek: Optional[Callable[[Danie], bool]] = None
+    zbior: Optional[Set[int]] = None
+    wyklucza: bool = False
+
+
+class Menu:
+    """
+    Klasa reprezentująca całe menu restauracji.
+
+    Menu utrzymuje posortowany indeks cen dań, aktualizowany przy
+    dodawaniu i usuwaniu dań oraz (przez obserwatora dania) przy zmianie
+    ceny, dzięki czemu wyszukiwanie w przedziale cenowym nie przegląda
+    wszystkich dań.
+
+    Podobnie utrzymywany jest indeks odwrócony składników: każdy
+    znormalizowany składnik (bez polskich znaków) ma posortowaną listę
+    numerów dań, które go zawierają. Zapytania o składniki przecinają
+    te listy zamiast sprawdzać składniki każdego dania. Indeksy kalorii
+    i niedostępnych dań pozwalają metodzie zapytanie zaczynać od
+    najbardziej selektywnego kryterium.
+
+    Jeśli podano szynę zdarzeń, menu publikuje na nią zdarzenia typu
+    TYP_DANIE: dodanie i usunięcie dania, zmiany ceny, kategorii,
+    dostępności, kalorii i składników dań, zmiany listy dań dnia
+    ("danie_dnia") i kolejności dań w kategorii ("pozycja").
+
+    Po wywołaniu sledz_dostepnosc dostępność dań z przepisami wynika
+    ze stanów magazynu i jest zmieniana tylko dla dań, których
+    wykonalność się zmieniła.
+
+    Atrybuty:
+        dania (WidokDan): Słownik dań (nazwa: obiekt dania) tylko
+            do odczytu.
+        kategorie (Set[str]): Zbiór wszystkich kategorii w menu
+            (wyznaczany z indeksu kategorii).
+        dania_dnia (List[Danie]): Lista dań dnia.
+        max_dania_dnia (int): Maksymalna liczba dań dnia.
+        data_aktualizacji (datetime): Data ostatniej aktualizacji menu.
+        szyna (Optional[SzynaZdarzen]): Szyna zdarzeń o zmianach menu.
+    """
+
+    def __init__(self, max_dania_dnia: int = 3,
+                 szyna: Optional[SzynaZdarzen] = None):
+        """
+        Inicjalizuje nowe puste menu.
+
+        Args:
+            max_dania_dnia: Maksymalna liczba dań dnia.
+            szyna: Szyna zdarzeń, na którą publikowane są zmiany.
+
+        Raises:
+            ValueError: Gdy max_dania_dnia jest mniejsze od 1.
+        """
+        if max_dania_dnia < 1:
+            raise ValueError("Maksymalna liczba dań"
+                             " dnia musi być większa od 0")
+
+        # kategoria: {nazwa_dania: None, ...} (uporządkowany zbiór nazw)
+        self._dania_kategorii: Dict[str, Dict[str, None]] = {}
+        # Posortowany indeks (cena, numer_dania)
+        self._indeks_cen: List[Tuple[float, int]] = []
+        # Posortowany indeks (kalorie, numer_dania) dań ze znanymi
+        # kaloriami i numery dań niedostępnych
+        self._indeks_kalorii: List[Tuple[int, int]] = []
+        self._niedostepne: Set[int] = set()
+        # Numery dań (rosnące w kolejności dodania), indeks odwrócony
+        # składnik -> posortowane numery dań i posortowane składniki
+        self._numery_dan: Dict[str, int] = {}
+        self._dania_numerow: Dict[int, Danie] = {}
+        self.dania = WidokDan(self._numery_dan, self._dania_numerow)
+        self._nastepny_numer = 0
+        self._terminy_dan: Dict[int, Set[str]] = {}
+        self._indeks_skladnikow: Dict[str, array] = {}
+        self._terminy: List[str] = []
+        self.dania_dnia: List[Danie] = []
+        self.max_dania_dnia = max_dania_dnia
+        self.data_aktualizacji = datetime.now()
+        self.szyna = szyna
+        # Magazyn, z którego wyznaczana jest dostępność dań, i nazwy dań
+        # oznaczonych przez niego jako niedostępne
+        self._magazyn = None
+        self._niedostepne_z_magazynu: Set[str] = set()
+
+    @classmethod
+    def z_rekordow(cls, rekordy: Iterable[RekordDania],
+                   max_dania_dnia: int = 3,
+                   dania_dnia: Iterable[str] = (),
+                   szyna: Optional[SzynaZdarzen] = None) -> "Menu":
+        """
+        Tworzy menu ze spakowanych rekordów dań (np. wczytanych z pliku).
+
+        Indeksy są budowane w jednym przebiegu po rekordach, a obiekty
+        Danie powstają dopiero przy pierwszym odczycie dania.
+
+        Args:
+            rekordy: Rekordy dań w kolejności menu (RekordDania).
+            max_dania_dnia: Maksymalna liczba dań dnia.
+            dania_dnia: Nazwy dań dnia.
+            szyna: Szyna zdarzeń, na którą publikowane są późniejsze
+            zmiany (wczytanie nie publikuje zdarzeń).
+
+        Returns:
+            Nowe menu.
+
+        Raises:
+            ValueError: Gdy nazwy dań się powtarzają lub max_dania_dnia
+            jest mniejsze od 1.
+            KeyError: Gdy danie dnia nie istnieje w menu.
+        """
+        menu = cls(max_dania_dnia)
+        rekordy = list(rekordy)
+        numery_dan = menu._numery_dan
+        dania_kategorii = menu._dania_kategorii
+        terminy_dan = menu._terminy_dan
+        listy: Dict[str, List[int]] = defaultdict(list)
+        normalizacje = _Normalizacje()
+        ceny = []
+        kalorie = []
+
+        for numer, rekord in enumerate(rekordy):
+            nazwa, cena, kategoria, _, dostepne, skladniki, \
+                kalorie_dania, _ = rekord
+            if nazwa in numery_dan:
+                raise ValueError(f"Danie o nazwie {nazwa} "
+                                 f"już istnieje w menu")
+            numery_dan[nazwa] = numer
+            dania_kategorii.setdefault(kategoria, {})[nazwa] = None
+            ceny.append((cena, numer))
+            if kalorie_dania is not None:
+                kalorie.append((kalorie_dania, numer))
+            if not dostepne:
+                menu._niedostepne.add(numer)
+
+            terminy = set(map(normalizacje.__getitem__, skladniki))
+            for termin in terminy:
+                listy[termin].append(numer)
+            terminy_dan[numer] = terminy
+
+        ceny.sort()
+        kalorie.sort()
+        menu._indeks_cen = ceny
+        menu._indeks_kalorii = kalorie
+        menu._indeks_skladnikow = {termin: array("I", lista)
+                                   for termin, lista in listy.items()}
+        menu._terminy = sorted(listy)
+        menu._nastepny_numer = len(rekordy)
+        menu._dania_numerow = _LeniweDania(rekordy, menu._na_zmiane_dania)
+        menu.dania = WidokDan(numery_dan, menu._dania_numerow)
+        for nazwa in dania_dnia:
+            menu.dodaj_danie_dnia(nazwa)
+        menu.szyna = szyna
+        return menu
+
+    def rekordy(self) -> Iterator[RekordDania]:
+        """
+        Zwraca rekordy dań w kolejności menu.
+
+        Dania wczytane z pliku i jeszcze nieodczytane nie są tworzone.
+
+        Returns:
+            Iterator rekordów dań (RekordDania).
+        """
+        dania_numerow = self._dania_numerow
+        leniwe = isinstance(dania_numerow, _LeniweDania)
+        for numer in self._numery_dan.values():
+            rekord = dania_numerow.rekord(numer) if leniwe else None
+            if rekord is None:
+                rekord = dania_numerow[numer].rekord()
+            yield rekord
+
+    def dodaj_danie(self, danie: Danie) -> None:
+        """
+        Dodaje danie do menu.
+
+        Args:
+            danie: Obiekt dania do dodania.
+
+        Raises:
+            ValueError: Gdy danie o takiej nazwie już istnieje w menu.
+        """
+        if danie.nazwa in self.dania:
+            raise ValueError(f"Danie o nazwie {danie.nazwa} "
+                             f"już istnieje w menu")
+        self._dania_kategorii.setdefault(
+            danie.kategoria, {})[danie.nazwa] = None
+        numer = self._nastepny_numer
+        self._nastepny_numer += 1
+        self._numery_dan[danie.nazwa] = numer
+        self._dania_numerow[numer] = danie
+        insort(self._indeks_cen, (danie.cena, numer))
+        self._terminy_dan[numer] = set()
+        self._indeksuj_skladniki(danie)
+        if self._magazyn is not None and danie.nazwa in self._magazyn.przepisy:
+            danie.ustaw_dostepnosc(self._magazyn.max_porcje(danie.nazwa) > 0)
+            if not danie.dostepne:
+                self._niedostepne_z_magazynu.add(danie.nazwa)
+        if danie.kalorie is not None:
+            insort(self._indeks_kalorii, (danie.kalorie, numer))
+        if not danie.dostepne:
+            self._niedostepne.add(numer)
+        danie.dodaj_obserwatora(self._na_zmiane_dania)
+        self.data_aktualizacji = datetime.now()
+        self._publikuj(danie.nazwa, POLE_DODANO, None, danie, danie)
+
+    def usun_danie(self, nazwa: str) -> None:
+        """
+        Usuwa danie z menu.
+
+        Args:
+            nazwa: Nazwa dania do usunięcia.
+
+        Raises:
+            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
+        """
+        if nazwa not in self.dania:
+            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
+
+        # Usuń z dań dnia jeśli było
+        if self.dania[nazwa] in self.dania_dnia:
+            self.usun_danie_dnia(nazwa)
+
+        danie = self.dania[nazwa]
+        kategoria_usuwanego = danie.kategoria
+        danie.usun_obserwatora(self._na_zmiane_dania)
+        numer = self._numery_dan.pop(nazwa)
+        self._usun_z_indeksu(self._indeks_cen, (danie.cena, numer))
+        self._usun_z_indeksu(self._indeks_kalorii, (danie.kalorie, numer))
+        self._niedostepne.discard(numer)
+        self._niedostepne_z_magazynu.discard(nazwa)
+        for termin in self._terminy_dan.pop(numer):
+            self._usun_z_listy(termin, numer)
+        del self._dania_numerow[numer]
+
+        # Sprawdź czy to była ostatnia kategoria
+        czlonkowie = self._dania_kategorii[kategoria_usuwanego]
+        del czlonkowie[nazwa]
+        if not czlonkowie:
+            del self._dania_kategorii[kategoria_usuwanego]
+
+        self.data_aktualizacji = datetime.now()
+        self._publikuj(nazwa, POLE_USUNIETO, danie, None, danie)
+
+    @property
+    def kategorie(self) -> Set[str]:
+        """Zbiór wszystkich kategorii w menu."""
+        return set(self._dania_kategorii)
+
+    def przesun_danie(self, nazwa: str, pozycja: int) -> None:
+        """
+        Zmienia pozycję dania w kolejności wyświetlania jego kategorii.
+
+        Args:
+            nazwa: Nazwa dania.
+            pozycja: Nowa pozycja dania w kategorii (od 0).
+
+        Raises:
+            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
+            ValueError: Gdy pozycja wykracza poza kategorię.
+        """
+        if nazwa not in self.dania:
+            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
+
+        czlonkowie = self._dania_kategorii[self.dania[nazwa].kategoria]
+        if not 0 <= pozycja < len(czlonkowie):
+            raise ValueError(f"Pozycja {pozycja} wykracza poza kategorię "
+                             f"(dań: {len(czlonkowie)})")
+
+        kolejnosc = [n for n in czlonkowie if n != nazwa]
+        stara_pozycja = list(czlonkowie).index(nazwa)
+        kolejnosc.insert(pozycja, nazwa)
+        # Zmiana kolejności w miejscu, bez przebudowy indeksu kategorii
+        czlonkowie.clear()
+        czlonkowie.update(dict.fromkeys(kolejnosc))
+        self.data_aktualizacji = datetime.now()
+        self._publikuj(nazwa, "pozycja", stara_pozycja, pozycja,
+                       self.dania[nazwa])
+
+    def sledz_dostepnosc(self, magazyn) -> None:
+        """
+        Wyznacza dostępność dań ze stanów magazynu i aktualizuje ją
+        przy zmianach stanów.
+
+        Danie z przepisem w magazynie jest dostępne, gdy można
+        przygotować przynajmniej jedną porcję. Magazyn powiadamia menu
+        tylko o daniach używających zmienionego składnika, których
+        wykonalność się zmieniła, więc pozostałe dania nie są
+        sprawdzane. Dania bez przepisu zachowują ręcznie ustawioną
+        dostępność, a ręczna zmiana dania z przepisem obowiązuje do
+        następnej zmiany jego wykonalności. Po usunięciu przepisu danie
+        oznaczone jako niedostępne z powodu braku składników wraca
+        do dostępnych.
+
+        Args:
+            magazyn: System zarządzania składnikami
+            (ZarzadzanieSkladnikami).
+
+        Raises:
+            ValueError: Gdy menu już śledzi dostępność.
+        """
+        if self._magazyn is not None:
+            raise ValueError("Menu już śledzi dostępność dań w magazynie")
+
+        self._magazyn = magazyn
+        magazyn.dodaj_obserwatora_dostepnosci(self._na_zmiane_wykonalnosci)
+        for nazwa, porcje in magazyn.max_porcje_menu().items():
+            self._na_zmiane_wykonalnosci(nazwa, porcje > 0)
+
+    def przestan_sledzic_dostepnosc(self) -> None:
+        """
+        Kończy wyznaczanie dostępności dań ze stanów magazynu.
+
+        Dania zachowują ostatnio ustawioną dostępność.
+
+        Raises:
+            ValueError: Gdy menu nie śledzi dostępności.
+        """
+        if self._magazyn is None:
+            raise ValueError("Menu nie śledzi dostępności dań w magazynie")
+
+        self._magazyn.usun_obserwatora_dostepnosci(
+            self._na_zmiane_wykonalnosci)
+        self._magazyn = None
+        self._niedostepne_z_magazynu.clear()
+
+    def _na_zmiane_wykonalnosci(self, nazwa: str,
+                                dostepne: Optional[bool]) -> None:
+        """
+        Ustawia dostępność dania po zmianie jego wykonalności.
+
+        Wartość None oznacza usunięcie przepisu: danie wyłączone przez
+        magazyn wraca do dostępnych, a ręcznie ustawiona dostępność
+        pozostaje bez zmian.
+        """
+        if dostepne is None:
+            if nazwa not in self._niedostepne_z_magazynu:
+                return
+            dostepne = True
+        numer = self._numery_dan.get(nazwa)
+        # Danie wczytane z pliku jest tworzone tylko, gdy zmienia się
+        # jego dostępność
+        if numer is None or (numer not in self._niedostepne) == dostepne:
+            return
+        self._dania_numerow[numer].ustaw_dostepnosc(dostepne)
+        if not dostepne:
+            self._niedostepne_z_magazynu.add(nazwa)
+
+    def _na_zmiane_dania(self, danie: Danie, pole: str,
+                         stara_wartosc: Any) -> None:
+        """Przenosi zmianę pola dania do indeksów menu i na szynę."""
+        numer = self._numery_dan[danie.nazwa]
+        if pole == "cena":
+            self._usun_z_indeksu(self._indeks_cen, (stara_wartosc, numer))
+            insort(self._indeks_cen, (danie.cena, numer))
+        elif pole == "kalorie":
+            self._usun_z_indeksu(self._indeks_kalorii, (stara_wartosc, numer))
+            if danie.kalorie is not None:
+                insort(self._indeks_kalorii, (danie.kalorie, numer))
+        elif pole == "dostepne":
+            # Zmiana ręczna; _na_zmiane_wykonalnosci oznacza dania
+            # wyłączone przez magazyn po jej zapisaniu
+            self._niedostepne_z_magazynu.discard(danie.nazwa)
+            if danie.dostepne:
+                self._niedostepne.discard(numer)
+            else:
+                self._niedostepne.add(numer)
+        elif pole == "skladniki":
+            self._indeksuj_skladniki(danie)
+        elif pole == "kategoria":
+            czlonkowie = self._dania_kategorii[stara_wartosc]
+            del czlonkowie[danie.nazwa]
+            if not czlonkowie:
+                del self._dania_kategorii[stara_wartosc]
+            self._dania_kategorii.setdefault(
+                danie.kategoria, {})[danie.nazwa] = None
+        self._publikuj(danie.nazwa, pole, stara_wartosc,
+                       getattr(danie, pole), danie)
+
+    def _publikuj(self, nazwa: str, pole: str, stara_wartosc: Any,
+                  nowa_wartosc: Any, danie: Danie) -> None:
+        """Publikuje zdarzenie o daniu na szynę, jeśli ją podano."""
+        if self.szyna is not None:
+            self.szyna.publikuj(Zdarzenie(TYP_DANIE, nazwa, pole,
+                                          stara_wartosc, nowa_wartosc, danie))
+
+    def _indeksuj_skladniki(self, danie: Danie) -> None:
+        """
+        Aktualizuje indeks odwrócony dla składników jednego dania.
+
+        Zmieniane są tylko listy składników dodanych lub usuniętych
+        od poprzedniej aktualizacji.
+        """
+        numer = self._numery_dan[danie.nazwa]
+        stare = self._terminy_dan[numer]
+        nowe = {normalizuj_tekst(skladnik) for skladnik in danie.skladniki}
+        for termin in stare - nowe:
+            self._usun_z_listy(termin, numer)
+        for termin in nowe - stare:
+            lista = self._indeks_skladnikow.get(termin)
+            if lista is None:
+                lista = self._indeks_skladnikow[termin] = array("I")
+                insort(self._terminy, termin)
+            insort(lista, numer)
+        self._terminy_dan[numer] = nowe
+
+    def _usun_z_listy(self, termin: str, numer: int) -> None:
+        """Usuwa numer dania z listy składnika (i pustą listę z indeksu)."""
+        lista = self._indeks_skladnikow[termin]
+        del lista[bisect_left(lista, numer)]
+        if not lista:
+            del self._indeks_skladnikow[termin]
+            del self._terminy[bisect_left(self._terminy, termin)]
+
+    @staticmethod
+    def _usun_z_indeksu(indeks: List[Tuple[Any, int]],
+                        wpis: Tuple[Any, int]) -> None:
+        """Usuwa wpis dania z posortowanego indeksu (cen lub kalorii)."""
+        if wpis[0] is None:
+            return
+        pozycja = bisect_left(indeks, wpis)
+        if pozycja < len(indeks) and indeks[pozycja] == wpis:
+            del indeks[pozycja]
+
+    def znajdz_dania_po_kategorii(self, kategoria: str) -> List[Danie]:
+        """
+        Znajduje wszystkie dania należące do danej kategorii.
+
+        Args:
+            kategoria: Kategoria dań do znalezienia.
+
+        Returns:
+            Lista dań należących do danej kategorii w kolejności
+            wyświetlania (domyślnie kolejności dodania).
+        """
+        return [self.dania[nazwa]
+                for nazwa in self._dania_kategorii.get(kategoria, {})]
+
+    def znajdz_dania_w_cenie(self, min_cena: float,
+                             max_cena: float) -> List[Danie]:
+        """
+        Znajduje wszystkie dostępne dania w podanym przedziale cenowym.
+
+        Args:
+            min_cena: Minimalna cena dania.
+            max_cena: Maksymalna cena dania.
+
+        Returns:
+            Lista dostępnych dań w podanym przedziale cenowym,
+            uporządkowana rosnąco według ceny.
+
+        Raises:
+            ValueError: Gdy min_cena jest większa od max_cena.
+        """
+        if min_cena > max_cena:
+            raise ValueError("Minimalna cena "
+                             "nie może być większa od maksymalnej")
+
+        indeks = self._indeks_cen
+        wynik = []
+        for pozycja in range(bisect_left(indeks, (min_cena,)), len(indeks)):
+            cena, numer = indeks[pozycja]
+            if cena > max_cena:
+                break
+            danie = self._dania_numerow[numer]
+            if danie.dostepne:
+                wynik.append(danie)
+        return wynik
+
+    def znajdz_skladniki(self, prefiks: str) -> List[str]:
+        """
+        Znajduje składniki dań zaczynające się od podanego tekstu.
+
+        Args:
+            prefiks: Początek nazwy składnika (wielkość liter i polskie
+            znaki nie mają znaczenia).
+
+        Returns:
+            Posortowana lista znormalizowanych nazw składników.
+        """
+        prefiks = normalizuj_tekst(prefiks)
+        terminy = self._terminy
+        wynik = []
+        for pozycja in range(bisect_left(terminy, prefiks), len(terminy)):
+            if not terminy[pozycja].startswith(prefiks):
+                break
+            wynik.append(terminy[pozycja])
+        return wynik
+
+    def znajdz_dania_po_skladnikach(self, zawiera: Iterable[str] = (),
+                                    bez: Iterable[str] = (),
+                                    prefiksy: bool = True) -> List[Danie]:
+        """
+        Znajduje dania zawierające wszystkie podane składniki i żadnego
+        z wykluczonych.
+
+        Nazwy są porównywane bez względu na wielkość liter i polskie
+        znaki. Domyślnie nazwa pasuje do każdego składnika, który od niej
+        się zaczyna, np. "orzech" do "orzechy włoskie".
+
+        Args:
+            zawiera: Składniki, które danie musi zawierać.
+            bez: Składniki, których danie nie może zawierać.
+            prefiksy: Czy dopasowywać składniki po początku nazwy
+            (False oznacza dokładne dopasowanie).
+
+        Returns:
+            Lista dań w kolejności dodania do menu.
+        """
+        listy = sorted((self._lista_dan(nazwa, prefiksy)
+                        for nazwa in zawiera), key=len)
+        if listy:
+            wynik = listy[0]
+            for lista in listy[1:]:
+                if not wynik:
+                    break
+                wynik = self._przeciecie(wynik, lista)
+        else:
+            wynik = list(self._numery_dan.values())
+
+        wykluczone: Set[int] = set()
+        for nazwa in bez:
+            wykluczone.update(self._lista_dan(nazwa, prefiksy))
+        return [self._dania_numerow[numer] for numer in wynik
+                if numer not in wykluczone]
+
+    def _lista_dan(self, nazwa: str, prefiksy: bool) -> List[int]:
+        """Zwraca posortowane numery dań zawierających składnik."""
+        if not prefiksy:
+            return list(self._indeks_skladnikow.get(normalizuj_tekst(nazwa),
+                                                    ()))
+        terminy = self.znajdz_skladniki(nazwa)
+        if len(terminy) == 1:
+            return list(self._indeks_skladnikow[terminy[0]])
+        numery: Set[int] = set()
+        for termin in terminy:
+            numery.update(self._indeks_skladnikow[termin])
+        return sorted(numery)
+
+    @staticmethod
+    def _przeciecie(krotsza: List[int], dluzsza: List[int]) -> List[int]:
+        """
+        Przecina dwie posortowane listy numerów.
+
+        Każdy element krótszej listy jest wyszukiwany binarnie w dłuższej,
+        od pozycji poprzedniego trafienia.
+        """
+        wynik = []
+        poczatek = 0
+        for numer in krotsza:
+            poczatek = bisect_left(dluzsza, numer, poczatek)
+            if poczatek == len(dluzsza):
+                break
+            if dluzsza[poczatek] == numer:
+                wynik.append(numer)
+        return wynik
+
+    def zapytanie(self, kategoria: Optional[str] = None,
+                  min_cena: Optional[float] = None,
+                  max_cena: Optional[float] = None,
+                  max_kalorie: Optional[int] = None,
+                  dostepne: Optional[bool] = None,
+                  zawiera: Iterable[str] = (),
+                  bez: Iterable[str] = (),
+                  sortuj: Optional[str] = None,
+                  malejaco: bool = False,
+                  strona: int = 1,
+                  na_strone: Optional[int] = None) -> List[Danie]:
+        """
+        Wyszukuje dania spełniające wszystkie podane kryteria.
+
+        Dla każdego kryterium szacowana jest z indeksu liczba pasujących
+        dań. Kandydaci są pobierani z najbardziej selektywnego indeksu,
+        a następnie przecinani z pozostałymi kryteriami od najbardziej
+        selektywnego: zbiorem numerów z indeksu, gdy jest tańszy do
+        pobrania niż sprawdzenie kandydatów (KOSZT_WARUNKU), a w
+        przeciwnym razie warunkiem sprawdzanym dla każdego kandydata.
+        Dostępność i wykluczone składniki są odejmowane na końcu.
+
+        Args:
+            kategoria: Kategoria dania.
+            min_cena: Minimalna cena dania.
+            max_cena: Maksymalna cena dania.
+            max_kalorie: Maksymalna liczba kalorii (pomija dania
+            o nieznanej liczbie kalorii).
+            dostepne: True/False dla dań dostępnych/niedostępnych,
+            None dla wszystkich.
+            zawiera: Składniki, które danie musi zawierać (dopasowanie
+            po początku nazwy, jak w znajdz_dania_po_skladnikach).
+            bez: Składniki, których danie nie może zawierać.
+            sortuj: Pole sortowania z POLA_SORTOWANIA lub None dla
+            kolejności dodania do menu.
+            malejaco: Czy sortować malejąco.
+            strona: Numer strony wyników (od 1).
+            na_strone: Liczba dań na stronie lub None dla wszystkich.
+
+        Returns:
+            Lista dań z wybranej strony wyników.
+
+        Raises:
+            ValueError: Gdy min_cena jest większa od max_cena, pole
+            sortowania jest nieznane lub parametry stron są mniejsze
+            od 1.
+        """
+        if min_cena is not None and max_cena is not None \
+                and min_cena > max_cena:
+            raise ValueError("Minimalna cena "
+                             "nie może być większa od maksymalnej")
+        if sortuj is not None and sortuj not in POLA_SORTOWANIA:
+            raise ValueError(f"Nieznane pole sortowania: {sortuj}")
+        if strona < 1 or (na_strone is not None and na_strone < 1):
+            raise ValueError("Numer strony i liczba dań na stronie "
+                             "muszą być większe od zera")
+
+        plan = self._zaplanuj(kategoria, min_cena, max_cena, max_kalorie,
+                              dostepne, zawiera, bez)
+        dania_numerow = self._dania_numerow
+        if plan and not plan[0].wyklucza:
+            pierwszy = plan.pop(0)
+            kandydaci = set(pierwszy.zbior if pierwszy.zbior is not None
+                            else pierwszy.numery())
+        else:
+            kandydaci = set(self._numery_dan.values())
+
+        for krok in plan:
+            if not kandydaci:
+                break
+            if krok.wyklucza:
+                kandydaci.difference_update(krok.zbior)
+            elif krok.zbior is not None:
+                kandydaci.intersection_update(krok.zbior)
+            elif krok.szacunek <= KOSZT_WARUNKU * len(kandydaci):
+                kandydaci.intersection_update(krok.numery())
+            else:
+                warunek = krok.warunek
+                kandydaci = {numer for numer in kandydaci
+                             if warunek(dania_numerow[numer])}
+
+        poczatek = (strona - 1) * na_strone if na_strone else 0
+        koniec = poczatek + na_strone if na_strone else len(kandydaci)
+
+        def klucz(numer: int) -> Tuple:
+            danie = dania_numerow[numer]
+            if sortuj == "kalorie":
+                # Dania o nieznanej liczbie kalorii na końcu także przy
+                # sortowaniu malejącym (odwracającym cały klucz)
+                nieznane = danie.kalorie is None
+                return (nieznane != malejaco, danie.kalorie or 0, numer)
+            return (getattr(danie, sortuj), numer)
+
+        klucz_sortowania = None if sortuj is None else klucz
+        if koniec < len(kandydaci):
+            wybor = heapq.nlargest if malejaco else heapq.nsmallest
+            numery = wybor(koniec, kandydaci, key=klucz_sortowania)
+        else:
+            numery = sorted(kandydaci, key=klucz_sortowania,
+                            reverse=malejaco)
+        return [dania_numerow[numer] for numer in numery[poczatek:koniec]]
+
+    def _zaplanuj(self, kategoria, min_cena, max_cena, max_kalorie,
+                  dostepne, zawiera, bez) -> List["_KrokZapytania"]:
+        """
+        Tworzy plan zapytania uporządkowany według selektywności.
+
+        Returns:
+            Kroki planu od najbardziej selektywnego. Kroki wykluczające
+            (dostępność, wykluczone składniki) są na końcu.
+        """
+        numery_dan = self._numery_dan
+        plan = []
+
+        if kategoria is not None:
+            czlonkowie = self._dania_kategorii.get(kategoria, {})
+            plan.append(_KrokZapytania(
+                len(czlonkowie), "kategoria",
+                lambda: [numery_dan[nazwa] for nazwa in czlonkowie],
+                lambda danie: danie.kategoria == kategoria))
+
+        if min_cena is not None or max_cena is not None:
+            indeks = self._indeks_cen
+            dolna = 0 if min_cena is None else \
+                bisect_left(indeks, (min_cena,))
+            gorna = len(indeks) if max_cena is None else \
+                bisect_right(indeks, max_cena, key=lambda wpis: wpis[0])
+            niska = -float("inf") if min_cena is None else min_cena
+            wysoka = float("inf") if max_cena is None else max_cena
+            plan.append(_KrokZapytania(
+                max(gorna - dolna, 0), "cena",
+                lambda: [numer for _, numer in indeks[dolna:gorna]],
+                lambda danie: niska <= danie.cena <= wysoka))
+
+        if max_kalorie is not None:
+            indeks_kalorii = self._indeks_kalorii
+            gorna_kalorii = bisect_right(indeks_kalorii, max_kalorie,
+                                         key=lambda wpis: wpis[0])
+            plan.append(_KrokZapytania(
+                gorna_kalorii, "kalorie",
+                lambda: [numer for _, numer
+                         in indeks_kalorii[:gorna_kalorii]],
+                lambda danie: danie.kalorie is not None
+                and danie.kalorie <= max_kalorie))
+
+        if dostepne is False:
+            plan.append(_KrokZapytania(
+                len(self._niedostepne), "dostepne",
+                zbior=self._niedostepne))
+
+        zawiera = list(zawiera)
+        if zawiera:
+            listy = sorted((self._lista_dan(nazwa, True)
+                            for nazwa in zawiera), key=len)
+            pasujace = listy[0]
+            for lista in listy[1:]:
+                pasujace = self._przeciecie(pasujace, lista)
+            plan.append(_KrokZapytania(len(pasujace), "zawiera",
+                                       zbior=set(pasujace)))
+
+        plan.sort(key=lambda krok: krok.szacunek)
+
+        if dostepne:
+            plan.append(_KrokZapytania(
+                len(numery_dan) - len(self._niedostepne), "dostepne",
+                zbior=self._niedostepne, wyklucza=True))
+        bez = list(bez)
+        if bez:
+            wykluczone: Set[int] = set()
+            for nazwa in bez:
+                wykluczone.update(self._lista_dan(nazwa, True))
+            plan.append(_KrokZapytania(
+                len(numery_dan) - len(wykluczone), "bez",
+                zbior=wykluczone, wyklucza=True))
+        return plan
+
+    def dodaj_danie_dnia(self, nazwa: str) -> None:
+        """
+        Dodaje danie do listy dań dnia.
+
+        Args:
+            nazwa: Nazwa dania do dodania.
+
+        Raises:
+            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
+            ValueError: Gdy danie jest już na liście dań dnia
+            lub lista jest pełna.
+        """
+        if nazwa not in self.dania:
+            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
+
+        danie = self.dania[nazwa]
+
+        if danie in self.dania_dnia:
+            raise ValueError(f"Danie {nazwa} jest już na liście dań dnia")
+
+        if len(self.dania_dnia) >= self.max_dania_dnia:
+            raise ValueError(f"Lista dań dnia jest pełna "
+                             f"(max: {self.max_dania_dnia})")
+
+        self.dania_dnia.append(danie)
+        self._publikuj(nazwa, "danie_dnia", False, True, danie)
+
+    def usun_danie_dnia(self, nazwa: str) -> None:
+        """
+        Usuwa danie z listy dań dnia.
+
+        Args:
+            nazwa: Nazwa dania do usunięcia.
+
+        Raises:
+            KeyError: Gdy danie o podanej nazwie nie istnieje w menu.
+            ValueError: Gdy danie nie jest na liście dań dnia.
+        """
+        if nazwa not in self.dania:
+            raise KeyError(f"Danie o nazwie {nazwa} nie istnieje w menu")
+
+        danie = self.dania[nazwa]
+
+        if danie not in self.dania_dnia:
+            raise ValueError(f"Danie {nazwa} nie jest na liście dań dnia")
+
+        self.dania_dnia.remove(danie)
+        self._publikuj(nazwa, "danie_dnia", True, False, danie)
@@ -0,0 +1,195 @@
+"""
+Moduł z zapisem i wczytywaniem całego menu.
+Zawiera funkcje zapisujące menu w formacie JSON lines oraz w zwartej
+postaci binarnej i wczytujące je z leniwym tworzeniem obiektów Danie.
+"""
+
+from array import array
+from typing import Dict, List, Optional
+import json
+import struct
+
+from .events import SzynaZdarzen
+from .menu_management import Menu, RekordDania
+
+MAGIA = b"MENU0001"
+FORMAT_JSONL = "menu-jsonl"
+WERSJA = 1
+BRAK_KALORII = -(2 ** 31)
+
+# magia, liczba dań, liczba pozycji składników, maksymalna liczba dań
+# dnia, liczba dań dnia, długość bloku tekstów w bajtach
+_NAGLOWEK = struct.Struct("<8sIIIII")
+# Po nagłówku: blok tekstów (UTF-8 rozdzielone znakiem NUL), a po nim
+# kolumny: nazwa, kategoria (kody tekstów), cena, czas przygotowania,
+# dostępność, kalorie, data dodania (µs), liczba składników; dalej kody
+# tekstów wszystkich składników i nazw dań dnia
+_KOLUMNY = ("I", "I", "d", "i", "B", "i", "q", "I")
+_SEPARATOR = "\0"
+
+
+def zapisz_jsonl(menu: Menu, sciezka: str) -> None:
+    """
+    Zapisuje menu w formacie JSON lines.
+
+    Pierwszy wiersz to nagłówek z ustawieniami menu, a każdy kolejny
+    to rekord jednego dania zapisany jako tablica JSON.
+
+    Args:
+        menu: Menu do zapisania.
+        sciezka: Ścieżka pliku.
+    """
+    naglowek = {
+        "format": FORMAT_JSONL,
+        "wersja": WERSJA,
+        "max_dania_dnia": menu.max_dania_dnia,
+        "dania_dnia": [danie.nazwa for danie in menu.dania_dnia],
+    }
+    with open(sciezka, "w", encoding="utf-8") as plik:
+        plik.write(json.dumps(naglowek, ensure_ascii=False))
+        plik.write("\n")
+        for rekord in menu.rekordy():
+            plik.write(json.dumps(rekord, ensure_ascii=False))
+            plik.write("\n")
+
+
+def wczytaj_jsonl(sciezka: str,
+                  szyna: Optional[SzynaZdarzen] = None) -> Menu:
+    """
+    Wczytuje menu zapisane w formacie JSON lines.
+
+    Args:
+        sciezka: Ścieżka pliku.
+        szyna: Szyna zdarzeń, na którą menu publikuje późniejsze zmiany.
+
+    Returns:
+        Menu z daniami tworzonymi przy pierwszym odczycie.
+
+    Raises:
+        ValueError: Gdy plik nie jest zapisanym menu.
+    """
+    with open(sciezka, "r", encoding="utf-8") as plik:
+        try:
+            naglowek = json.loads(plik.readline())
+        except json.JSONDecodeError:
+            naglowek = None
+        if not isinstance(naglowek, dict) \
+                or naglowek.get("format") != FORMAT_JSONL:
+            raise ValueError(f"Plik {sciezka} nie jest zapisanym menu")
+        if naglowek.get("wersja") != WERSJA:
+            raise ValueError(f"Nieobsługiwana wersja pliku menu: "
+                             f"{naglowek.get('wersja')}")
+        rekordy = [tuple(json.loads(wiersz)) for wiersz in plik
+                   if wiersz.strip()]
+    return Menu.z_rekordow(rekordy, naglowek["max_dania_dnia"],
+                           naglowek["dania_dnia"], szyna)
+
+
+def zapisz_binarnie(menu: Menu, sciezka: str) -> None:
+    """
+    Zapisuje menu w zwartej postaci binarnej.
+
+    Teksty (nazwy, kategorie, składniki) są zapisywane raz w bloku
+    tekstów, a dania jako kolumny liczb stałej szerokości.
+
+    Args:
+        menu: Menu do zapisania.
+        sciezka: Ścieżka pliku.
+
+    Raises:
+        ValueError: Gdy któryś tekst zawiera znak NUL.
+    """
+    kody: Dict[str, int] = {}
+    teksty: List[str] = []
+
+    def kod(tekst: str) -> int:
+        wynik = kody.get(tekst)
+        if wynik is None:
+            if _SEPARATOR in tekst:
+                raise ValueError(f"Tekst {tekst!r} zawiera znak NUL")
+            wynik = kody[tekst] = len(teksty)
+            teksty.append(tekst)
+        return wynik
+
+    kolumny = [array(typ) for typ in _KOLUMNY]
+    skladniki = array("I")
+    for nazwa, cena, kategoria, czas_przygotowania, dostepne, \
+            skladniki_dania, kalorie, data_dodania in menu.rekordy():
+        wartosci = (kod(nazwa), kod(kategoria), cena, czas_przygotowania,
+                    dostepne, BRAK_KALORII if kalorie is None else kalorie,
+                    data_dodania, len(skladniki_dania))
+        for kolumna, wartosc in zip(kolumny, wartosci):
+            kolumna.append(wartosc)
+        skladniki.extend(kod(skladnik) for skladnik in skladniki_dania)
+    dania_dnia = array("I", (kod(danie.nazwa)
+                             for danie in menu.dania_dnia))
+
+    blok_tekstow = _SEPARATOR.join(teksty).encode("utf-8")
+    with open(sciezka, "wb") as plik:
+        plik.write(_NAGLOWEK.pack(MAGIA, len(kolumny[0]), len(skladniki),
+                                  menu.max_dania_dnia, len(dania_dnia),
+                                  len(blok_tekstow)))
+        plik.write(blok_tekstow)
+        for kolumna in kolumny:
+            plik.write(kolumna.tobytes())
+        plik.write(skladniki.tobytes())
+        plik.write(dania_dnia.tobytes())
+
+
+def wczytaj_binarnie(sciezka: str,
+                     szyna: Optional[SzynaZdarzen] = None) -> Menu:
+    """
+    Wczytuje menu zapisane w postaci binarnej.
+
+    Kolumny są odczytywane w całości, a obiekty Danie powstają dopiero
+    przy pierwszym odczycie dania.
+
+    Args:
+        sciezka: Ścieżka pliku.
+        szyna: Szyna zdarzeń, na którą menu publikuje późniejsze zmiany.
+
+    Returns:
+        Menu z daniami tworzonymi przy pierwszym odczycie.
+
+    Raises:
+        ValueError: Gdy plik nie jest zapisanym menu.
+    """
+    with open(sciezka, "rb") as plik:
+        dane = memoryview(plik.read())
+
+    if len(dane) < _NAGLOWEK.size:
+        raise ValueError(f"Plik {sciezka} nie jest zapisanym menu")
+    magia, liczba_dan, liczba_pozycji, max_dania_dnia, liczba_dan_dnia, \
+        dlugosc_tekstow = _NAGLOWEK.unpack_from(dane)
+    if magia != MAGIA:
+        raise ValueError(f"Plik {sciezka} nie jest zapisanym menu")
+
+    pozycja = _NAGLOWEK.size
+    teksty = str(dane[pozycja:pozycja + dlugosc_tekstow], "utf-8") \
+        .split(_SEPARATOR)
+    pozycja += dlugosc_tekstow
+
+    def czytaj(typ: str, liczba: int) -> array:
+        nonlocal pozycja
+        kolumna = array(typ)
+        koniec = pozycja + liczba * kolumna.itemsize
+        kolumna.frombytes(dane[pozycja:koniec])
+        pozycja = koniec
+        return kolumna
+
+    nazwy, kategorie, ceny, czasy, dostepne, kalorie, daty, liczby = \
+        (czytaj(typ, liczba_dan) for typ in _KOLUMNY)
+    skladniki = [teksty[kod] for kod in czytaj("I", liczba_pozycji)]
+    dania_dnia = [teksty[kod] for kod in czytaj("I", liczba_dan_dnia)]
+
+    rekordy: List[RekordDania] = []
+    poczatek = 0
+    for numer in range(liczba_dan):
+        koniec = poczatek + liczby[numer]
+        rekordy.append((
+            teksty[nazwy[numer]], ceny[numer], teksty[kategorie[numer]],
+            czasy[numer], bool(dostepne[numer]), skladniki[poczatek:koniec],
+            None if kalorie[numer] == BRAK_KALORII else kalorie[numer],
+            daty[numer]))
+        poczatek = koniec
+    return Menu.z_rekordow(rekordy, max_dania_dnia, dania_dnia, szyna)
@@ -0,0 +1,175 @@
+"""
+Moduł z gotowymi widokami menu dla kiosków i strony internetowej.
+Zawiera pamięć podręczną widoków menu pogrupowanego według kategorii
+(JSON w bajtach i zwykły tekst) unieważnianą zdarzeniami z szyny menu.
+"""
+
+from typing import Any, Dict, List, Optional
+import json
+
+from .events import TYP_DANIE, Zdarzenie
+from .menu_management import Danie, Menu
+
+
+class WidokiMenu:
+    """
+    Pamięć podręczna wyrenderowanych widoków menu.
+
+    Widok każdej kategorii jest renderowany przy pierwszym odczycie
+    i zapamiętywany jako gotowe bajty JSON oraz tekst. Zdarzenia o daniu
+    (zmiana ceny, dostępności, składników, dodanie, usunięcie itp.)
+    unieważniają tylko widok jego kategorii, więc widoki niezmienionych
+    kategorii są zwracane bez żadnej pracy. Widok całego menu jest
+    składany z zapamiętanych widoków kategorii.
+
+    Atrybuty:
+        menu (Menu): Menu, którego widoki są przechowywane.
+    """
+
+    def __init__(self, menu: Menu):
+        """
+        Tworzy pamięć widoków i subskrybuje zdarzenia menu.
+
+        Args:
+            menu: Menu z szyną zdarzeń.
+
+        Raises:
+            ValueError: Gdy menu nie ma szyny zdarzeń.
+        """
+        if menu.szyna is None:
+            raise ValueError("Menu musi mieć szynę zdarzeń, "
+                             "aby unieważniać widoki")
+
+        self.menu = menu
+        # kategoria: gotowy widok
+        self._json_kategorii: Dict[str, bytes] = {}
+        self._tekst_kategorii: Dict[str, str] = {}
+        self._json_menu: Optional[bytes] = None
+        self._tekst_menu: Optional[str] = None
+        menu.szyna.subskrybuj(self._na_zdarzenia, typy=[TYP_DANIE])
+
+    def odlacz(self) -> None:
+        """
+        Kończy subskrypcję zdarzeń menu i czyści zapamiętane widoki.
+
+        Raises:
+            ValueError: Gdy widoki były już odłączone.
+        """
+        self.menu.szyna.anuluj_subskrypcje(self._na_zdarzenia)
+        self._uniewaznij_wszystko()
+
+    def json_kategorii(self, kategoria: str) -> bytes:
+        """
+        Zwraca widok kategorii w postaci JSON (UTF-8).
+
+        Args:
+            kategoria: Nazwa kategorii.
+
+        Returns:
+            Obiekt JSON {"kategoria": ..., "dania": [...]} w bajtach.
+
+        Raises:
+            KeyError: Gdy kategoria nie istnieje w menu.
+        """
+        widok = self._json_kategorii.get(kategoria)
+        if widok is None:
+            widok = json.dumps(
+                {"kategoria": kategoria, "dania": self._opisy(kategoria)},
+                ensure_ascii=False).encode("utf-8")
+            self._json_kategorii[kategoria] = widok
+        return widok
+
+    def tekst_kategorii(self, kategoria: str) -> str:
+        """
+        Zwraca widok kategorii jako zwykły tekst.
+
+        Args:
+            kategoria: Nazwa kategorii.
+
+        Returns:
+            Nazwa kategorii i wiersze dań z cenami i dostępnością.
+
+        Raises:
+            KeyError: Gdy kategoria nie istnieje w menu.
+        """
+        widok = self._tekst_kategorii.get(kategoria)
+        if widok is None:
+            wiersze = [kategoria]
+            for opis in self._opisy(kategoria):
+                wiersz = f"  {opis['nazwa']} - {opis['cena']:.2f} zł"
+                if opis["danie_dnia"]:
+                    wiersz += " [danie dnia]"
+                if not opis["dostepne"]:
+                    wiersz += " (niedostępne)"
+                wiersze.append(wiersz)
+            widok = "\n".join(wiersze) + "\n"
+            self._tekst_kategorii[kategoria] = widok
+        return widok
+
+    def json_menu(self) -> bytes:
+        """
+        Zwraca widok całego menu w postaci JSON (UTF-8).
+
+        Returns:
+            Obiekt JSON {"kategorie": [...]} z widokami kategorii
+            w kolejności alfabetycznej, w bajtach.
+        """
+        if self._json_menu is None:
+            self._json_menu = b'{"kategorie": [' + b", ".join(
+                self.json_kategorii(kategoria)
+                for kategoria in sorted(self.menu.kategorie)) + b"]}"
+        return self._json_menu
+
+    def tekst_menu(self) -> str:
+        """
+        Zwraca widok całego menu jako zwykły tekst.
+
+        Returns:
+            Widoki kategorii w kolejności alfabetycznej oddzielone
+            pustym wierszem.
+        """
+        if self._tekst_menu is None:
+            self._tekst_menu = "\n".join(
+                self.tekst_kategorii(kategoria)
+                for kategoria in sorted(self.menu.kategorie))
+        return self._tekst_menu
+
+    def _opisy(self, kategoria: str) -> List[Dict[str, Any]]:
+        """Zwraca opisy dań kategorii w kolejności wyświetlania."""
+        if kategoria not in self.menu.kategorie:
+            raise KeyError(f"Kategoria {kategoria} nie istnieje w menu")
+
+        dania_dnia = {danie.nazwa for danie in self.menu.dania_dnia}
+        return [self._opis(danie, danie.nazwa in dania_dnia)
+                for danie in self.menu.znajdz_dania_po_kategorii(kategoria)]
+
+    @staticmethod
+    def _opis(danie: Danie, danie_dnia: bool) -> Dict[str, Any]:
+        """Zwraca pola dania pokazywane w widokach."""
+        return {
+            "nazwa": danie.nazwa,
+            "cena": danie.cena,
+            "dostepne": danie.dostepne,
+            "kalorie": danie.kalorie,
+            "skladniki": list(danie.skladniki),
+            "danie_dnia": danie_dnia,
+        }
+
+    def _na_zdarzenia(self, zdarzenia: List[Zdarzenie]) -> None:
+        """Unieważnia widoki kategorii zmienionych dań."""
+        for zdarzenie in zdarzenia:
+            kategorie = [zdarzenie.zrodlo.kategoria]
+            if zdarzenie.pole == "kategoria":
+                kategorie.append(zdarzenie.stara_wartosc)
+            for kategoria in kategorie:
+                self._json_kategorii.pop(kategoria, None)
+                self._tekst_kategorii.pop(kategoria, None)
+        self._json_menu = None
+        self._tekst_menu = None
+
+    def _uniewaznij_wszystko(self) -> None:
+        """Usuwa wszystkie zapamiętane widoki."""
+        self._json_kategorii.clear()
+        self._tekst_kategorii.clear()
+        self._json_menu = None
+        self._tekst_menu = None
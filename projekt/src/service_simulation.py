@@ -0,0 +1,379 @@
+"""
+Moduł symulacji pracy restauracji do planowania zapasów.
+Zawiera politykę zaopatrzenia, zegar symulacji oraz symulator
+Monte Carlo uruchamiający wiele replikacji tygodni pracy w puli procesów.
+"""
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, TypedDict
+import math
+import os
+import random
+
+from .inventory_control import Skladnik, ZarzadzanieSkladnikami
+from .menu_management import Danie, Menu
+from .stock_ledger import RejestrRuchow
+
+# Opis magazynu i menu przekazywany do procesów: składniki
+# (nazwa, jednostka, ilość, min_ilość, cena), przepisy spłaszczone do
+# składników, dania (nazwa, cena, kategoria) i średni dzienny popyt na dania
+OpisSymulacji = Tuple[Tuple[Tuple[str, str, float, float, float], ...],
+                      Dict[str, Dict], Tuple[Tuple[str, float, str], ...],
+                      Dict[str, float]]
+
+
+class WynikSymulacjiDict(TypedDict):
+    """Definicja typu dla słownika wyników symulacji."""
+    replikacje: int
+    prawdopodobienstwo_braku: Dict[str, float]
+    srednie_straty: Dict[str, float]
+    srednio_obsluzone: float
+    srednio_utracone: float
+
+
+class PolitykaZaopatrzenia:
+    """
+    Klasa opisująca politykę zaopatrzenia testowaną w symulacji.
+
+    Co co_ile_dni dni zamawiane są składniki poniżej minimalnej ilości,
+    w ilości uzupełniającej stan do poziomu docelowego. Zamówienie
+    dociera po dni_realizacji dniach, a dostarczone partie tracą
+    ważność po liczbie dni podanej w dni_przydatnosci.
+
+    Atrybuty:
+        min_ilosc (Dict[str, float]): Minimalne ilości zastępujące
+            ustawienia składników.
+        poziom_docelowy (Dict[str, float]): Poziom uzupełnienia stanu
+            (domyślnie dwukrotność minimalnej ilości).
+        co_ile_dni (int): Odstęp między zamówieniami w dniach.
+        dni_realizacji (int): Czas dostawy w dniach.
+        dni_przydatnosci (Dict[str, int]): Przydatność dostarczonych
+            partii w dniach (brak wpisu - bez daty ważności).
+    """
+
+    def __init__(self, min_ilosc: Optional[Dict[str, float]] = None,
+                 poziom_docelowy: Optional[Dict[str, float]] = None,
+                 co_ile_dni: int = 1, dni_realizacji: int = 1,
+                 dni_przydatnosci: Optional[Dict[str, int]] = None):
+        """
+        Inicjalizuje politykę zaopatrzenia.
+
+        Args:
+            min_ilosc: Minimalne ilości składników.
+            poziom_docelowy: Poziomy uzupełnienia stanów.
+            co_ile_dni: Odstęp między zamówieniami w dniach.
+            dni_realizacji: Czas dostawy w dniach.
+            dni_przydatnosci: Przydatność partii w dniach.
+
+        Raises:
+            ValueError: Gdy odstęp zamówień jest mniejszy od 1
+            lub czas dostawy jest krótszy niż dzień.
+        """
+        if co_ile_dni < 1:
+            raise ValueError("Odstęp zamówień musi być większy od zera")
+        if dni_realizacji < 1:
+            raise ValueError("Czas dostawy musi wynosić co najmniej dzień")
+
+        self.min_ilosc = min_ilosc or {}
+        self.poziom_docelowy = poziom_docelowy or {}
+        self.co_ile_dni = co_ile_dni
+        self.dni_realizacji = dni_realizacji
+        self.dni_przydatnosci = dni_przydatnosci or {}
+
+
+class ZegarSymulacji:
+    """
+    Sztuczny zegar symulacji przesuwany jawnie przez symulator.
+
+    Atrybuty:
+        teraz (datetime): Bieżący czas symulacji.
+    """
+
+    def __init__(self, start: datetime):
+        """
+        Inicjalizuje zegar.
+
+        Args:
+            start: Czas początkowy.
+        """
+        self.teraz = start
+
+    def przesun(self, o: timedelta) -> datetime:
+        """
+        Przesuwa zegar do przodu.
+
+        Args:
+            o: Przesunięcie.
+
+        Returns:
+            Nowy czas symulacji.
+        """
+        self.teraz += o
+        return self.teraz
+
+
+def _losuj_poissona(losowosc: random.Random, srednia: float) -> int:
+    """Losuje liczbę zdarzeń z rozkładu Poissona (metoda Knutha)."""
+    if srednia <= 0:
+        return 0
+    if srednia > 500:
+        return max(0, round(losowosc.gauss(srednia, math.sqrt(srednia))))
+    granica = math.exp(-srednia)
+    liczba = 0
+    iloczyn = losowosc.random()
+    while iloczyn > granica:
+        liczba += 1
+        iloczyn *= losowosc.random()
+    return liczba
+
+
+def _replikacja(opis: OpisSymulacji, polityka: PolitykaZaopatrzenia,
+                dni: int, start: datetime, ziarno: int
+                ) -> Tuple[bytes, array, int, int]:
+    """
+    Wykonuje jedną replikację symulacji.
+
+    Returns:
+        Krotka (flagi braku per składnik, straty per składnik,
+        liczba obsłużonych zamówień, liczba utraconych zamówień).
+    """
+    skladniki, przepisy, dania, popyt = opis
+    losowosc = random.Random(ziarno)
+    zegar = ZegarSymulacji(start)
+    rejestr = RejestrRuchow()
+
+    zarzadzanie = ZarzadzanieSkladnikami(rejestr=rejestr)
+    for nazwa, jednostka, ilosc, min_ilosc, cena in skladniki:
+        zarzadzanie.dodaj_skladnik(Skladnik(
+            nazwa, jednostka, ilosc,
+            polityka.min_ilosc.get(nazwa, min_ilosc), cena,
+            rejestr=rejestr))
+    for nazwa_dania, przepis in przepisy.items():
+        zarzadzanie.dodaj_przepis(nazwa_dania, przepis)
+    menu = Menu()
+    for nazwa_dania, cena, kategoria in dania:
+        menu.dodaj_danie(Danie(nazwa_dania, cena, kategoria))
+
+    numery = {nazwa: numer for numer, (nazwa, *_) in enumerate(skladniki)}
+    braki = bytearray(len(skladniki))
+    straty = array("d", bytes(8 * len(skladniki)))
+    obsluzone = utracone = 0
+    w_drodze: Dict[int, Dict[str, Tuple]] = {}
+
+    for dzien in range(dni):
+        # Początek dnia: spisanie przeterminowanych i przyjęcie dostaw
+        for nazwa, ilosc in zarzadzanie.spisz_przeterminowane(
+                zegar.teraz).items():
+            straty[numery[nazwa]] += ilosc
+        if dzien in w_drodze:
+            zarzadzanie.zarejestruj_dostawe(
+                "Symulacja", w_drodze.pop(dzien), czas_dostawy=zegar.teraz)
+        for danie in menu.dania.values():
+            danie.ustaw_dostepnosc(True)
+
+        zamowienia = [nazwa_dania for nazwa_dania, srednia in popyt.items()
+                      for _ in range(_losuj_poissona(losowosc, srednia))]
+        losowosc.shuffle(zamowienia)
+        krok = timedelta(hours=12) / max(1, len(zamowienia))
+        for nazwa_dania in zamowienia:
+            czas = zegar.przesun(krok)
+            danie = menu.dania[nazwa_dania]
+            if danie.dostepne and zarzadzanie.max_porcje(nazwa_dania) > 0:
+                zarzadzanie.przygotuj_danie(nazwa_dania, czas=czas)
+                obsluzone += 1
+                continue
+            utracone += 1
+            if danie.dostepne:
+                danie.ustaw_dostepnosc(False)
+                for nazwa, potrzebna in zarzadzanie.zapotrzebowanie_dania(
+                        nazwa_dania).items():
+                    if zarzadzanie.skladniki[nazwa].ilosc_na_stanie \
+                            < potrzebna:
+                        braki[numery[nazwa]] = 1
+
+        # Koniec dnia: zamówienie według polityki
+        if dzien % polityka.co_ile_dni == 0:
+            dzien_dostawy = dzien + polityka.dni_realizacji
+            zamowienie = _zamowienie(zarzadzanie, polityka, w_drodze,
+                                     start + timedelta(days=dzien_dostawy))
+            if zamowienie:
+                w_drodze.setdefault(dzien_dostawy, {}).update(zamowienie)
+        zegar.teraz = start + timedelta(days=dzien + 1)
+
+    return bytes(braki), straty, obsluzone, utracone
+
+
+def _zamowienie(zarzadzanie: ZarzadzanieSkladnikami,
+                polityka: PolitykaZaopatrzenia,
+                w_drodze: Dict[int, Dict[str, Tuple]],
+                data_dostawy: datetime) -> Dict[str, Tuple]:
+    """
+    Wyznacza pozycje zamówienia dla składników poniżej minimum.
+
+    Ilości w drodze są doliczane do stanu, więc składnik nie jest
+    zamawiany ponownie przed nadejściem poprzedniej dostawy.
+    """
+    zamowione: Dict[str, float] = {}
+    for pozycje in w_drodze.values():
+        for nazwa, (ilosc, *_) in pozycje.items():
+            zamowione[nazwa] = zamowione.get(nazwa, 0.0) + ilosc
+
+    zamowienie = {}
+    for skladnik in zarzadzanie.lista_do_zamowienia():
+        stan = skladnik.ilosc_na_stanie + zamowione.get(skladnik.nazwa, 0)
+        if stan >= skladnik.min_ilosc:
+            continue
+        poziom = polityka.poziom_docelowy.get(skladnik.nazwa,
+                                              2 * skladnik.min_ilosc)
+        ilosc = poziom - stan
+        if ilosc <= 0:
+            continue
+        dni_przydatnosci = polityka.dni_przydatnosci.get(skladnik.nazwa)
+        if dni_przydatnosci is None:
+            zamowienie[skladnik.nazwa] = (ilosc, 0)
+        else:
+            zamowienie[skladnik.nazwa] = (
+                ilosc, 0, data_dostawy + timedelta(days=dni_przydatnosci))
+    return zamowienie
+
+
+def _seria_replikacji(opis: OpisSymulacji, polityka: PolitykaZaopatrzenia,
+                      dni: int, start: datetime,
+                      ziarna: List[int]) -> List[Tuple]:
+    """Wykonuje serię replikacji w jednym procesie."""
+    return [_replikacja(opis, polityka, dni, start, ziarno)
+            for ziarno in ziarna]
+
+
+class SymulacjaSerwisu:
+    """
+    Symulator Monte Carlo pracy restauracji.
+
+    Stan magazynu i menu jest zamieniany na zwarty opis (krotki
+    i słowniki prostych wartości), który trafia do procesów roboczych.
+    Każda replikacja odtwarza z niego własny ZarzadzanieSkladnikami
+    i Menu z osobnym rejestrem ruchów, prowadzi je przez kolejne dni
+    zamówień i dostaw na sztucznym zegarze z własnym ziarnem losowości,
+    a zwraca jedynie tablice braków i strat.
+
+    Atrybuty:
+        popyt (Dict[str, float]): Średnia dzienna liczba zamówień dań.
+        dni (int): Długość replikacji w dniach.
+        start (datetime): Początek symulowanego okresu.
+    """
+
+    def __init__(self, zarzadzanie: ZarzadzanieSkladnikami, menu: Menu,
+                 popyt: Dict[str, float], dni: int = 7,
+                 start: datetime = datetime(2025, 1, 6)):
+        """
+        Inicjalizuje symulator.
+
+        Args:
+            zarzadzanie: System zarządzania składnikami (stan początkowy).
+            menu: Menu restauracji.
+            popyt: Średnia dzienna liczba zamówień dań.
+            dni: Długość replikacji w dniach.
+            start: Początek symulowanego okresu.
+
+        Raises:
+            ValueError: Gdy liczba dni jest mniejsza od 1.
+            KeyError: Gdy danie z popytu nie ma przepisu lub nie ma
+            go w menu.
+        """
+        if dni < 1:
+            raise ValueError("Liczba dni musi być większa od zera")
+        for nazwa_dania in popyt:
+            if nazwa_dania not in zarzadzanie.przepisy:
+                raise KeyError(f"Brak przepisu dla dania {nazwa_dania}")
+            if nazwa_dania not in menu.dania:
+                raise KeyError(f"Danie o nazwie {nazwa_dania} "
+                               f"nie istnieje w menu")
+
+        self.popyt = dict(popyt)
+        self.dni = dni
+        self.start = start
+        self._nazwy = list(zarzadzanie.skladniki)
+        self._opis: OpisSymulacji = (
+            tuple((s.nazwa, s.jednostka, s.ilosc_na_stanie, s.min_ilosc,
+                   s.cena_jednostkowa)
+                  for s in zarzadzanie.skladniki.values()),
+            {nazwa_dania: zarzadzanie.zapotrzebowanie_dania(nazwa_dania)
+             for nazwa_dania in self.popyt},
+            tuple((nazwa_dania, menu.dania[nazwa_dania].cena,
+                   menu.dania[nazwa_dania].kategoria)
+                  for nazwa_dania in self.popyt),
+            self.popyt,
+        )
+
+    def uruchom(self, polityka: PolitykaZaopatrzenia,
+                replikacje: int = 1000, ziarno: int = 0,
+                procesy: Optional[int] = None) -> WynikSymulacjiDict:
+        """
+        Uruchamia replikacje symulacji i agreguje wyniki.
+
+        Replikacja i używa ziarna ziarno + i, więc wynik nie zależy
+        od liczby procesów.
+
+        Args:
+            polityka: Testowana polityka zaopatrzenia.
+            replikacje: Liczba replikacji.
+            ziarno: Ziarno pierwszej replikacji.
+            procesy: Liczba procesów roboczych (None - liczba procesorów,
+            1 - bez puli procesów).
+
+        Returns:
+            Słownik z prawdopodobieństwem braku każdego składnika
+            (odsetek replikacji z brakiem), średnimi stratami
+            (ilość spisana jako przeterminowana) oraz średnimi liczbami
+            obsłużonych i utraconych zamówień.
+
+        Raises:
+            ValueError: Gdy liczba replikacji jest mniejsza od 1.
+        """
+        if replikacje < 1:
+            raise ValueError("Liczba replikacji musi być większa od zera")
+
+        ziarna = list(range(ziarno, ziarno + replikacje))
+        if procesy == 1:
+            return self._agreguj(_seria_replikacji(
+                self._opis, polityka, self.dni, self.start, ziarna))
+
+        # Kilka serii na proces wyrównuje obciążenie procesów
+        procesy = procesy or os.cpu_count() or 1
+        dlugosc = max(1, math.ceil(replikacje / (4 * procesy)))
+        with ProcessPoolExecutor(procesy) as pula:
+            zadania = [
+                pula.submit(_seria_replikacji, self._opis, polityka,
+                            self.dni, self.start, ziarna[i:i + dlugosc])
+                for i in range(0, replikacje, dlugosc)
+            ]
+            wyniki = [wynik for zadanie in zadania
+                      for wynik in zadanie.result()]
+        return self._agreguj(wyniki)
+
+    def _agreguj(self, wyniki: List[Tuple]) -> WynikSymulacjiDict:
+        """Łączy wyniki replikacji w słownik wyników."""
+        liczba = len(wyniki)
+        braki = [0] * len(self._nazwy)
+        straty = [0.0] * len(self._nazwy)
+        obsluzone = utracone = 0
+        for flagi, spisane, obsluzone_r, utracone_r in wyniki:
+            for numer, flaga in enumerate(flagi):
+                braki[numer] += flaga
+                straty[numer] += spisane[numer]
+            obsluzone += obsluzone_r
+            utracone += utracone_r
+
+        return {
+            "replikacje": liczba,
+            "prawdopodobienstwo_braku": {
+                nazwa: braki[numer] / liczba
+                for numer, nazwa in enumerate(self._nazwy)},
+            "srednie_straty": {
+                nazwa: round(straty[numer] / liczba, 3)
+                for numer, nazwa in enumerate(self._nazwy)},
+            "srednio_obsluzone": obsluzone / liczba,
+            "srednio_utracone": utracone / liczba,
+        }
@@ -0,0 +1,449 @@
+"""
+Moduł z kolumnowym rejestrem ruchów magazynowych.
+Zawiera wspólny dla wielu składników rejestr przechowujący ruchy
+w tablicach typowanych oraz leniwy widok historii pojedynczego składnika.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import threading
+
+EPOKA = datetime(1970, 1, 1)
+MIKROSEKUNDA = timedelta(microseconds=1)
+
+
+def _na_mikrosekundy(czas: datetime) -> int:
+    """Zamienia datę na liczbę mikrosekund od epoki (bez strefy czasowej)."""
+    return (czas - EPOKA) // MIKROSEKUNDA
+
+
+def _z_mikrosekund(wartosc: int) -> datetime:
+    """Zamienia liczbę mikrosekund od epoki na datę."""
+    return EPOKA + timedelta(microseconds=wartosc)
+
+
+class RejestrRuchow:
+    """
+    Kolumnowy rejestr ruchów magazynowych.
+
+    Każdy ruch zajmuje jeden wiersz w równoległych tablicach typowanych.
+    Nazwy operacji i referencje (np. identyfikator dostawy, cel zużycia)
+    są internowane do kodów liczbowych, więc tekst opisu powstaje dopiero
+    przy odczycie.
+
+    Wiersze są numerowane w kolejności dopisania. Dopóki ruchy są
+    dopisywane chronologicznie, kolumna czasów jest posortowana
+    i zapytania o zakres czasu używają wyszukiwania binarnego wprost
+    na niej. Pierwszy ruch z wcześniejszą datą (np. dostawa wpisana
+    wstecz) tworzy osobny indeks wierszy w kolejności czasu, do którego
+    kolejne ruchy są wstawiane z zachowaniem porządku.
+
+    Atrybuty:
+        czasy (array): Znaczniki czasu w mikrosekundach od epoki.
+        kody_skladnikow (array): Kod składnika dla każdego ruchu.
+        kody_operacji (array): Kod operacji dla każdego ruchu.
+        ilosci (array): Ilość (dodatnia dla przyjęć, ujemna dla wydań).
+        kody_referencji (array): Kod referencji (0 oznacza brak).
+    """
+
+    def __init__(self):
+        """
+        Inicjalizuje pusty rejestr ruchów.
+        """
+        self.czasy = array("q")
+        self.kody_skladnikow = array("i")
+        self.kody_operacji = array("i")
+        self.ilosci = array("d")
+        self.kody_referencji = array("i")
+        self._operacje: List[str] = []
+        self._kody_operacji: Dict[str, int] = {}
+        self._referencje: List[str] = [""]
+        self._kody_referencji: Dict[str, int] = {"": 0}
+        # kod_skladnika -> rosnące numery wierszy tego składnika
+        self._wiersze_skladnikow: List[array] = []
+        # Wiersze i ich czasy w kolejności chronologicznej; None, dopóki
+        # kolejność dopisania jest chronologiczna
+        self._porzadek: Optional[array] = None
+        self._czasy_porzadku: Optional[array] = None
+        # Dopisywanie do równoległych tablic musi być niepodzielne
+        self._blokada = threading.Lock()
+
+    @classmethod
+    def z_kolumn(cls, czasy: array, kody_skladnikow: array,
+                 kody_operacji: array, ilosci: array,
+                 kody_referencji: array, teksty: List[str],
+                 liczba_skladnikow: int,
+                 chronologiczny: bool = True) -> "RejestrRuchow":
+        """
+        Tworzy rejestr z gotowych kolumn (np. wczytanych z pliku).
+
+        Kody operacji i referencji wskazują pozycje w jednej tablicy
+        tekstów, której pierwszy element musi być pustym napisem.
+
+        Args:
+            czasy: Znaczniki czasu w mikrosekundach od epoki.
+            kody_skladnikow: Kody składników (0 .. liczba_skladnikow-1).
+            kody_operacji: Kody operacji (indeksy w teksty).
+            ilosci: Ilości ruchów.
+            kody_referencji: Kody referencji (indeksy w teksty).
+            teksty: Tablica tekstów operacji i referencji.
+            liczba_skladnikow: Liczba kodów składników do zarezerwowania.
+            chronologiczny: Czy wiersze są uporządkowane według czasu.
+
+        Returns:
+            Nowy rejestr ruchów.
+        """
+        rejestr = cls()
+        rejestr.czasy = czasy
+        rejestr.kody_skladnikow = kody_skladnikow
+        rejestr.kody_operacji = kody_operacji
+        rejestr.ilosci = ilosci
+        rejestr.kody_referencji = kody_referencji
+        rejestr._operacje = list(teksty)
+        rejestr._referencje = list(teksty)
+        kody = {tekst: kod for kod, tekst in enumerate(teksty)}
+        rejestr._kody_operacji = kody
+        rejestr._kody_referencji = dict(kody)
+
+        # Sortowanie stabilne grupuje wiersze według składnika,
+        # zachowując ich rosnącą kolejność w grupie
+        liczby = Counter(kody_skladnikow)
+        wiersze = sorted(range(len(kody_skladnikow)),
+                         key=kody_skladnikow.__getitem__)
+        poczatek = 0
+        for kod in range(liczba_skladnikow):
+            koniec = poczatek + liczby[kod]
+            rejestr._wiersze_skladnikow.append(
+                array("I", wiersze[poczatek:koniec]))
+            poczatek = koniec
+
+        if not chronologiczny:
+            porzadek = sorted(range(len(czasy)), key=czasy.__getitem__)
+            rejestr._porzadek = array("I", porzadek)
+            rejestr._czasy_porzadku = array(
+                "q", map(czasy.__getitem__, porzadek))
+        return rejestr
+
+    @classmethod
+    def leniwy(cls, wczytaj: Callable[[], "RejestrRuchow"]) \
+            -> "RejestrRuchow":
+        """
+        Tworzy rejestr wczytywany dopiero przy pierwszym użyciu.
+
+        Kolumny są wczytywane przy pierwszym odwołaniu do nich (odczyt
+        historii, zapytanie, dopisanie ruchu).
+
+        Args:
+            wczytaj: Funkcja zwracająca wczytany rejestr (np. z_kolumn).
+
+        Returns:
+            Rejestr ruchów bez wczytanych kolumn.
+        """
+        rejestr = cls.__new__(cls)
+        rejestr._wczytaj = wczytaj
+        rejestr._blokada_wczytania = threading.Lock()
+        return rejestr
+
+    def __getattr__(self, nazwa: str):
+        """Wczytuje kolumny leniwego rejestru przy pierwszym odwołaniu."""
+        blokada = self.__dict__.get("_blokada_wczytania")
+        if blokada is None:
+            raise AttributeError(nazwa)
+        with blokada:
+            wczytaj = self.__dict__.pop("_wczytaj", None)
+            if wczytaj is not None:
+                self.__dict__.update(wczytaj().__dict__)
+        try:
+            return self.__dict__[nazwa]
+        except KeyError:
+            raise AttributeError(nazwa) from None
+
+    def __len__(self) -> int:
+        """Zwraca liczbę ruchów w rejestrze."""
+        return len(self.czasy)
+
+    @property
+    def chronologiczny(self) -> bool:
+        """Czy ruchy były dopisywane w kolejności chronologicznej."""
+        return self._porzadek is None
+
+    def zarejestruj_skladnik(self) -> int:
+        """
+        Przydziela kod nowemu składnikowi.
+
+        Returns:
+            Kod składnika używany w kolumnie kody_skladnikow.
+        """
+        with self._blokada:
+            self._wiersze_skladnikow.append(array("I"))
+            return len(self._wiersze_skladnikow) - 1
+
+    def kod_operacji(self, operacja: str,
+                     utworz: bool = True) -> Optional[int]:
+        """
+        Zwraca kod operacji, internując ją przy pierwszym użyciu.
+
+        Args:
+            operacja: Nazwa operacji (np. "dostawa", "zużycie").
+            utworz: Czy nadać kod operacji, której nie ma w rejestrze.
+
+        Returns:
+            Kod operacji lub None, gdy operacji nie ma w rejestrze
+            i utworz=False.
+        """
+        kod = self._kody_operacji.get(operacja)
+        if kod is None and utworz:
+            kod = len(self._operacje)
+            self._operacje.append(operacja)
+            self._kody_operacji[operacja] = kod
+        return kod
+
+    def _kod_referencji(self, referencja: str) -> int:
+        """Zwraca kod referencji, internując ją przy pierwszym użyciu."""
+        kod = self._kody_referencji.get(referencja)
+        if kod is None:
+            kod = len(self._referencje)
+            self._referencje.append(referencja)
+            self._kody_referencji[referencja] = kod
+        return kod
+
+    def dopisz(self, kod_skladnika: int, czas: datetime, operacja: str,
+               ilosc: float, referencja: str = "") -> int:
+        """
+        Dopisuje ruch do rejestru.
+
+        Args:
+            kod_skladnika: Kod składnika z zarejestruj_skladnik.
+            czas: Czas ruchu.
+            operacja: Nazwa operacji.
+            ilosc: Ilość ruchu (ujemna dla wydań).
+            referencja: Identyfikator dostawy, cel zużycia itp.
+
+        Ruch z datą wcześniejszą niż ostatni dopisany jest wstawiany
+        do indeksu kolejności chronologicznej (tworzonego przy pierwszym
+        takim ruchu), więc zapytania o zakres czasu nadal działają.
+
+        Returns:
+            Numer dopisanego wiersza.
+        """
+        mikrosekundy = _na_mikrosekundy(czas)
+        with self._blokada:
+            wiersz = len(self.czasy)
+            if self._porzadek is None and self.czasy \
+                    and mikrosekundy < self.czasy[-1]:
+                self._porzadek = array("I", range(wiersz))
+                self._czasy_porzadku = array("q", self.czasy)
+            if self._porzadek is not None:
+                pozycja = bisect_right(self._czasy_porzadku, mikrosekundy)
+                self._czasy_porzadku.insert(pozycja, mikrosekundy)
+                self._porzadek.insert(pozycja, wiersz)
+
+            self.czasy.append(mikrosekundy)
+            self.kody_skladnikow.append(kod_skladnika)
+            self.kody_operacji.append(self.kod_operacji(operacja))
+            self.ilosci.append(ilosc)
+            self.kody_referencji.append(self._kod_referencji(referencja))
+            self._wiersze_skladnikow[kod_skladnika].append(wiersz)
+            return wiersz
+
+    def czas(self, wiersz: int) -> datetime:
+        """Zwraca czas ruchu z podanego wiersza."""
+        return _z_mikrosekund(self.czasy[wiersz])
+
+    def operacja(self, wiersz: int) -> str:
+        """Zwraca nazwę operacji z podanego wiersza."""
+        return self._operacje[self.kody_operacji[wiersz]]
+
+    def referencja(self, wiersz: int) -> str:
+        """Zwraca referencję z podanego wiersza (pusty napis, gdy brak)."""
+        return self._referencje[self.kody_referencji[wiersz]]
+
+    def opis(self, wiersz: int) -> str:
+        """
+        Zwraca opis operacji w formacie historii zmian składnika.
+
+        Args:
+            wiersz: Numer wiersza.
+
+        Returns:
+            Np. "dostawa 1234" albo "zużycie", gdy brak referencji.
+        """
+        operacja = self.operacja(wiersz)
+        referencja = self.referencja(wiersz)
+        return f"{operacja} {referencja}" if referencja else operacja
+
+    def zakres(self, od: Optional[datetime] = None,
+               do: Optional[datetime] = None) -> Tuple[int, int]:
+        """
+        Wyznacza przedział ruchów z czasem w zakresie [od, do].
+
+        Przedział dotyczy pozycji w kolejności chronologicznej: dla
+        rejestru dopisywanego chronologicznie są to numery wierszy,
+        a w przeciwnym razie pozycje w indeksie kolejności czasu.
+        Używane jest wyszukiwanie binarne.
+
+        Args:
+            od: Początek zakresu (włącznie) lub None.
+            do: Koniec zakresu (włącznie) lub None.
+
+        Returns:
+            Krotka (początek, koniec) pozycji (koniec wyłącznie).
+        """
+        czasy = self.czasy if self._porzadek is None \
+            else self._czasy_porzadku
+        poczatek = 0 if od is None else \
+            bisect_left(czasy, _na_mikrosekundy(od))
+        koniec = len(czasy) if do is None else \
+            bisect_right(czasy, _na_mikrosekundy(do))
+        return poczatek, max(poczatek, koniec)
+
+    def wiersze(self, kod_skladnika: Optional[int] = None,
+                od: Optional[datetime] = None,
+                do: Optional[datetime] = None) -> Sequence:
+        """
+        Zwraca numery wierszy spełniających kryteria.
+
+        Args:
+            kod_skladnika: Kod składnika lub None dla wszystkich.
+            od: Początek zakresu czasu (włącznie) lub None.
+            do: Koniec zakresu czasu (włącznie) lub None.
+
+        Returns:
+            Rosnąca sekwencja numerów wierszy.
+        """
+        if od is None and do is None:
+            if kod_skladnika is None:
+                return range(len(self.czasy))
+            return self._wiersze_skladnikow[kod_skladnika]
+
+        poczatek, koniec = self.zakres(od, do)
+        if self._porzadek is None:
+            if kod_skladnika is None:
+                return range(poczatek, koniec)
+            wiersze = self._wiersze_skladnikow[kod_skladnika]
+            return wiersze[bisect_left(wiersze, poczatek):
+                           bisect_left(wiersze, koniec)]
+
+        if kod_skladnika is None:
+            return sorted(self._porzadek[poczatek:koniec])
+        # Przegląd krótszej z list: ruchów składnika lub ruchów z zakresu
+        wiersze = self._wiersze_skladnikow[kod_skladnika]
+        if len(wiersze) < koniec - poczatek:
+            czasy = self.czasy
+            dolna = None if od is None else _na_mikrosekundy(od)
+            gorna = None if do is None else _na_mikrosekundy(do)
+            return [wiersz for wiersz in wiersze
+                    if (dolna is None or czasy[wiersz] >= dolna)
+                    and (gorna is None or czasy[wiersz] <= gorna)]
+        kody = self.kody_skladnikow
+        return sorted(wiersz for wiersz in self._porzadek[poczatek:koniec]
+                      if kody[wiersz] == kod_skladnika)
+
+    def suma(self, kod_skladnika: Optional[int] = None,
+             operacja: Optional[str] = None,
+             od: Optional[datetime] = None,
+             do: Optional[datetime] = None) -> float:
+        """
+        Sumuje ilości ruchów spełniających kryteria.
+
+        Args:
+            kod_skladnika: Kod składnika lub None dla wszystkich.
+            operacja: Nazwa operacji lub None dla wszystkich.
+            od: Początek zakresu czasu (włącznie) lub None.
+            do: Koniec zakresu czasu (włącznie) lub None.
+
+        Returns:
+            Suma ilości.
+        """
+        wiersze = self.wiersze(kod_skladnika, od, do)
+        ilosci = self.ilosci
+        if operacja is None:
+            return sum(ilosci[wiersz] for wiersz in wiersze)
+
+        kod = self._kody_operacji.get(operacja)
+        if kod is None:
+            return 0.0
+        operacje = self.kody_operacji
+        return sum(ilosci[wiersz] for wiersz in wiersze
+                   if operacje[wiersz] == kod)
+
+    def sumy_skladnikow(self, operacja: Optional[str] = None,
+                        od: Optional[datetime] = None,
+                        do: Optional[datetime] = None) -> Dict[int, float]:
+        """
+        Sumuje ilości ruchów osobno dla każdego składnika.
+
+        Args:
+            operacja: Nazwa operacji lub None dla wszystkich.
+            od: Początek zakresu czasu (włącznie) lub None.
+            do: Koniec zakresu czasu (włącznie) lub None.
+
+        Returns:
+            Słownik {kod_skladnika: suma_ilosci}.
+        """
+        kod = None if operacja is None else self._kody_operacji.get(operacja)
+        if operacja is not None and kod is None:
+            return {}
+
+        sumy: Dict[int, float] = {}
+        kody_skladnikow = self.kody_skladnikow
+        operacje = self.kody_operacji
+        ilosci = self.ilosci
+        for wiersz in self.wiersze(None, od, do):
+            if kod is None or operacje[wiersz] == kod:
+                kod_skladnika = kody_skladnikow[wiersz]
+                sumy[kod_skladnika] = \
+                    sumy.get(kod_skladnika, 0.0) + ilosci[wiersz]
+        return sumy
+
+
+class WidokHistorii(Sequence):
+    """
+    Leniwy widok historii zmian jednego składnika.
+
+    Wpisy są dekodowane z rejestru dopiero przy odczycie do postaci
+    krotek (datetime, opis_operacji, ilosc), zgodnych z dawnym formatem
+    listy historia_zmian.
+    """
+
+    def __init__(self, rejestr: RejestrRuchow, kod_skladnika: int):
+        """
+        Inicjalizuje widok historii.
+
+        Args:
+            rejestr: Rejestr ruchów.
+            kod_skladnika: Kod składnika w rejestrze.
+        """
+        self._rejestr = rejestr
+        self._kod = kod_skladnika
+
+    def __len__(self) -> int:
+        """Zwraca liczbę wpisów w historii."""
+        return len(self._rejestr._wiersze_skladnikow[self._kod])
+
+    def __getitem__(self, indeks: Union[int, slice]):
+        """Zwraca wpis (lub listę wpisów) historii."""
+        wiersze = self._rejestr._wiersze_skladnikow[self._kod]
+        if isinstance(indeks, slice):
+            return [self._dekoduj(wiersz) for wiersz in wiersze[indeks]]
+        return self._dekoduj(wiersze[indeks])
+
+    def _dekoduj(self, wiersz: int) -> Tuple[datetime, str, float]:
+        """Dekoduje wiersz rejestru do krotki historii."""
+        rejestr = self._rejestr
+        return rejestr.czas(wiersz), rejestr.opis(wiersz), \
+            rejestr.ilosci[wiersz]
+
+    def __eq__(self, other) -> bool:
+        """Porównuje widok z inną sekwencją wpisów."""
+        if isinstance(other, (WidokHistorii, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Zwraca reprezentację widoku jako listy wpisów."""
+        return repr(list(self))
@@ -0,0 +1,120 @@
+"""
+Testy jednostkowe dla modułu delivery_journal.
+Testuje klasę DziennikDostaw i jej użycie w ZarzadzanieSkladnikami.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from src.delivery_journal import DziennikDostaw
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+
+
+class TestDziennikDostaw(unittest.TestCase):
+    """
+    Testy klasy DziennikDostaw.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.dziennik = DziennikDostaw()
+        self.start = datetime(2025, 3, 1, 8, 0)
+        self.d1 = {"id": "1", "dostawca": "Młyn",
+                   "czas_dostawy": self.start}
+        self.d2 = {"id": "2", "dostawca": "Mleczarnia",
+                   "czas_dostawy": self.start + timedelta(days=1)}
+        self.d3 = {"id": "3", "dostawca": "Młyn",
+                   "czas_dostawy": self.start + timedelta(days=2)}
+        self.dziennik.dopisz(self.d1, {"Mąka": 30.0})
+        self.dziennik.dopisz(self.d2, {"Mleko": 12.5, "Masło": 20.0})
+        self.dziennik.dopisz(self.d3, {"Mąka": 15.0, "Kasza": 5.0})
+
+    def test_init(self):
+        """Test inicjalizacji pustego dziennika."""
+        dziennik = DziennikDostaw()
+        self.assertEqual(len(dziennik), 0)
+        self.assertEqual(dziennik.znajdz(), [])
+        self.assertEqual(dziennik.wydatki_dostawcow(), {})
+
+    def test_znajdz_zakres(self):
+        """Test wyszukiwania dostaw w zakresie czasu."""
+        self.assertEqual(len(self.dziennik), 3)
+        self.assertEqual(
+            self.dziennik.znajdz(od=self.start + timedelta(days=1)),
+            [self.d2, self.d3])
+        self.assertEqual(
+            self.dziennik.znajdz(do=self.start + timedelta(days=1)),
+            [self.d1, self.d2])
+
+    def test_znajdz_dostawca(self):
+        """Test wyszukiwania dostaw jednego dostawcy."""
+        self.assertEqual(self.dziennik.znajdz("Młyn"), [self.d1, self.d3])
+        self.assertEqual(
+            self.dziennik.znajdz("Młyn", od=self.start + timedelta(hours=1)),
+            [self.d3])
+        self.assertEqual(self.dziennik.znajdz("Nieznany"), [])
+
+    def test_dopisz_out_of_order(self):
+        """Test dopisania dostawy z wcześniejszym czasem."""
+        d0 = {"id": "0", "dostawca": "Młyn",
+              "czas_dostawy": self.start - timedelta(days=1)}
+        self.dziennik.dopisz(d0, {"Mąka": 1.0})
+
+        self.assertEqual(self.dziennik.dostawy[-1], d0)
+        self.assertEqual(self.dziennik.znajdz("Młyn"),
+                         [d0, self.d1, self.d3])
+        self.assertEqual(self.dziennik.znajdz(do=self.start), [d0, self.d1])
+
+    def test_wydatki(self):
+        """Test sum wydatków na dostawców i składniki."""
+        self.assertEqual(self.dziennik.wydatki_dostawcow(),
+                         {"Młyn": 50.0, "Mleczarnia": 32.5})
+        self.assertEqual(self.dziennik.wydatki_dostawcy("Młyn"),
+                         {"Mąka": 45.0, "Kasza": 5.0})
+        self.assertEqual(self.dziennik.wydatki_dostawcy("Nieznany"), {})
+
+
+class TestDostawyZarzadzania(unittest.TestCase):
+    """
+    Testy dziennika dostaw w ZarzadzanieSkladnikami.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.zarzadzanie.dodaj_skladnik(Skladnik("Mąka", "kg", 5, 2, 3.50))
+        self.zarzadzanie.dodaj_skladnik(Skladnik("Mleko", "l", 2, 1, 4.00))
+        self.start = datetime(2025, 3, 1, 8, 0)
+
+    def test_zarejestruj_dostawe_journal(self):
+        """Test zapisu dostawy w dzienniku i liście dostaw."""
+        self.zarzadzanie.zarejestruj_dostawe(
+            "Młyn", {"Mąka": (10, 3.00)}, czas_dostawy=self.start)
+        self.zarzadzanie.zarejestruj_dostawe(
+            "Mleczarnia", {"Mleko": (5, 0)},
+            czas_dostawy=self.start + timedelta(days=3))
+
+        self.assertIs(self.zarzadzanie.dostawy,
+                      self.zarzadzanie.dziennik_dostaw.dostawy)
+        self.assertEqual(len(self.zarzadzanie.dostawy), 2)
+        wynik = self.zarzadzanie.znajdz_dostawy(
+            od=self.start + timedelta(days=1))
+        self.assertEqual([d["dostawca"] for d in wynik], ["Mleczarnia"])
+        self.assertEqual(self.zarzadzanie.znajdz_dostawy("Młyn")[0]
+                         ["czas_dostawy"], self.start)
+
+    def test_wydatki(self):
+        """Test wydatków (cena 0 oznacza bieżącą cenę składnika)."""
+        self.zarzadzanie.zarejestruj_dostawe(
+            "Młyn", {"Mąka": (10, 3.00)}, czas_dostawy=self.start)
+        self.zarzadzanie.zarejestruj_dostawe(
+            "Młyn", {"Mąka": (2, 3.25), "Mleko": (5, 0)},
+            czas_dostawy=self.start + timedelta(days=1))
+
+        self.assertEqual(self.zarzadzanie.wydatki_dostawcow(),
+                         {"Młyn": 56.5})
+        self.assertEqual(self.zarzadzanie.wydatki_dostawcy("Młyn"),
+                         {"Mąka": 36.5, "Mleko": 20.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
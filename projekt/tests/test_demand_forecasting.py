@@ -0,0 +1,105 @@
+"""
+Testy jednostkowe dla modułu demand_forecasting.
+Testuje klasę PrognozaPopytu.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from src.demand_forecasting import PrognozaPopytu
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+from src.stock_ledger import RejestrRuchow
+
+
+class TestPrognozaPopytu(unittest.TestCase):
+    """
+    Testy klasy PrognozaPopytu.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.rejestr = RejestrRuchow()
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50, rejestr=self.rejestr)
+        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20,
+                               rejestr=self.rejestr)
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 0.5, "Cukier": 0.2})
+
+        # Dziesięć dni historii: mąka 2 kg dziennie, cukier tylko w dniu 9
+        self.koniec = datetime(2025, 3, 11)
+        poczatek = self.koniec - timedelta(days=10)
+        for dzien in range(10):
+            czas = poczatek + timedelta(days=dzien, hours=12)
+            self.rejestr.dopisz(self.maka.kod, czas, "zużycie", -1.5)
+            self.rejestr.dopisz(self.maka.kod, czas, "zużycie", -0.5)
+            self.rejestr.dopisz(self.maka.kod, czas, "dostawa", 2)
+        self.rejestr.dopisz(self.cukier.kod, poczatek + timedelta(days=9),
+                            "zużycie", -1)
+        self.prognoza = PrognozaPopytu(self.zarzadzanie, dni_historii=10,
+                                       alfa=0.5)
+
+    def test_init_invalid(self):
+        """Test inicjalizacji z nieprawidłowymi parametrami."""
+        with self.assertRaises(ValueError):
+            PrognozaPopytu(self.zarzadzanie, dni_historii=0)
+        with self.assertRaises(ValueError):
+            PrognozaPopytu(self.zarzadzanie, alfa=0)
+
+    def test_szeregi_dzienne(self):
+        """Test budowy dziennych szeregów zużycia."""
+        szeregi = self.prognoza.szeregi_dzienne(self.koniec)
+        self.assertEqual(list(szeregi["Mąka"]), [2.0] * 10)
+        self.assertEqual(list(szeregi["Cukier"]), [0.0] * 9 + [1.0])
+
+    def test_szeregi_bez_zuzycia(self):
+        """Test szeregów bez zmiany rejestru, gdy nie było zużycia."""
+        zarzadzanie = ZarzadzanieSkladnikami()
+        zarzadzanie.dodaj_skladnik(Skladnik("Sól", "kg", 2))
+        rejestr = zarzadzanie.rejestr
+        operacje = list(rejestr._operacje)
+
+        szeregi = PrognozaPopytu(zarzadzanie, dni_historii=3) \
+            .szeregi_dzienne(self.koniec)
+        self.assertEqual(list(szeregi["Sól"]), [0.0] * 3)
+        self.assertEqual(rejestr._operacje, operacje)
+        self.assertIsNone(rejestr.kod_operacji("zużycie", utworz=False))
+
+    def test_prognoza_wygladzanie(self):
+        """Test prognozy wygładzaniem wykładniczym."""
+        prognozy = self.prognoza.prognoza_dzienna(koniec=self.koniec)
+        self.assertAlmostEqual(prognozy["Mąka"], 2.0)
+        self.assertAlmostEqual(prognozy["Cukier"], 0.5)
+
+    def test_prognoza_srednia(self):
+        """Test prognozy średnią ruchomą."""
+        prognozy = self.prognoza.prognoza_dzienna("srednia", okno=4,
+                                                  koniec=self.koniec)
+        self.assertAlmostEqual(prognozy["Mąka"], 2.0)
+        self.assertAlmostEqual(prognozy["Cukier"], 0.25)
+
+    def test_prognoza_invalid_method(self):
+        """Test prognozy nieznaną metodą."""
+        with self.assertRaises(ValueError):
+            self.prognoza.prognoza_dzienna("arima")
+
+    def test_popyt_z_planu(self):
+        """Test przeliczenia planu sprzedaży dań na składniki."""
+        self.assertEqual(self.prognoza.popyt_z_planu({"Ciasto": 4}),
+                         {"Mąka": 2.0, "Cukier": 0.8})
+
+    def test_sugerowane_zamowienia(self):
+        """Test sugerowanych ilości do zamówienia."""
+        sugestie = self.prognoza.sugerowane_zamowienia(
+            dni_pokrycia=3, koniec=self.koniec)
+        # Mąka: 2 * 3 + 2 - 5 = 3; cukier: 0.5 * 3 + 1 - 3 < 0
+        self.assertEqual(sugestie, {"Mąka": 3.0})
+
+        sugestie = self.prognoza.sugerowane_zamowienia(
+            dni_pokrycia=3, plan_dan={"Ciasto": 4}, koniec=self.koniec)
+        # Cukier: (0.5 + 0.8) * 3 + 1 - 3 = 1.9
+        self.assertEqual(sugestie, {"Mąka": 9.0, "Cukier": 1.9})
+
+
+if __name__ == '__main__':
+    unittest.main()
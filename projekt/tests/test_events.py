@@ -0,0 +1,170 @@
+"""
+Testy jednostkowe dla modułu events.
+Testuje szynę zdarzeń oraz zdarzenia publikowane przez menu i magazyn.
+"""
+
+import unittest
+from src.events import (POLE_DODANO, POLE_USUNIETO, TYP_DANIE, TYP_PRZEPIS,
+                        TYP_SKLADNIK, SzynaZdarzen, Zdarzenie)
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+from src.menu_management import Danie, Menu
+
+
+class TestSzynaZdarzen(unittest.TestCase):
+    """
+    Testy dla klasy SzynaZdarzen.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.szyna = SzynaZdarzen()
+        self.odebrane = []
+        self.szyna.subskrybuj(self.odebrane.append)
+
+    def test_publish_outside_batch(self):
+        """Test natychmiastowego dostarczenia poza partią."""
+        zdarzenie = Zdarzenie(TYP_DANIE, "Schabowy", "cena", 25.0, 27.0)
+        self.szyna.publikuj(zdarzenie)
+        self.assertEqual(self.odebrane, [[zdarzenie]])
+
+    def test_batch_coalescing(self):
+        """Test łączenia zdarzeń w partii."""
+        with self.szyna.partia():
+            self.szyna.publikuj(
+                Zdarzenie(TYP_DANIE, "Schabowy", "cena", 25.0, 26.0))
+            self.szyna.publikuj(
+                Zdarzenie(TYP_DANIE, "Żurek", "cena", 14.0, 15.0))
+            self.szyna.publikuj(
+                Zdarzenie(TYP_DANIE, "Schabowy", "cena", 26.0, 27.0))
+            # Zmiana, która się znosi, jest pomijana
+            self.szyna.publikuj(
+                Zdarzenie(TYP_DANIE, "Żurek", "dostepne", True, False))
+            self.szyna.publikuj(
+                Zdarzenie(TYP_DANIE, "Żurek", "dostepne", False, True))
+            self.assertEqual(self.odebrane, [])
+
+        self.assertEqual(len(self.odebrane), 1)
+        self.assertEqual(
+            [(z.nazwa, z.stara_wartosc, z.nowa_wartosc)
+             for z in self.odebrane[0]],
+            [("Schabowy", 25.0, 27.0), ("Żurek", 14.0, 15.0)])
+
+    def test_nested_batches(self):
+        """Test dostarczenia po zakończeniu zewnętrznej partii."""
+        with self.szyna.partia():
+            with self.szyna.partia():
+                self.szyna.publikuj(
+                    Zdarzenie(TYP_SKLADNIK, "Mąka", "ilosc_na_stanie", 1, 2))
+            self.assertEqual(self.odebrane, [])
+        self.assertEqual(len(self.odebrane), 1)
+
+    def test_batch_delivered_on_error(self):
+        """Test dostarczenia zdarzeń partii przerwanej wyjątkiem."""
+        with self.assertRaises(RuntimeError):
+            with self.szyna.partia():
+                self.szyna.publikuj(
+                    Zdarzenie(TYP_SKLADNIK, "Mąka", "ilosc_na_stanie", 1, 2))
+                raise RuntimeError("błąd")
+        self.assertEqual(len(self.odebrane), 1)
+
+    def test_type_filter(self):
+        """Test subskrypcji wybranych typów zdarzeń."""
+        skladniki = []
+        self.szyna.subskrybuj(skladniki.append, typy=[TYP_SKLADNIK])
+        with self.szyna.partia():
+            self.szyna.publikuj(
+                Zdarzenie(TYP_DANIE, "Schabowy", "cena", 25.0, 27.0))
+        self.szyna.publikuj(
+            Zdarzenie(TYP_SKLADNIK, "Mąka", "ilosc_na_stanie", 1, 2))
+
+        self.assertEqual(len(self.odebrane), 2)
+        self.assertEqual([[z.nazwa for z in lista] for lista in skladniki],
+                         [["Mąka"]])
+
+    def test_unsubscribe(self):
+        """Test anulowania subskrypcji."""
+        self.szyna.anuluj_subskrypcje(self.odebrane.append)
+        self.szyna.publikuj(
+            Zdarzenie(TYP_DANIE, "Schabowy", "cena", 25.0, 27.0))
+        self.assertEqual(self.odebrane, [])
+        with self.assertRaises(ValueError):
+            self.szyna.anuluj_subskrypcje(self.odebrane.append)
+
+
+class TestZdarzeniaModulow(unittest.TestCase):
+    """
+    Testy zdarzeń publikowanych przez menu i magazyn.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.szyna = SzynaZdarzen()
+        self.odebrane = []
+        self.szyna.subskrybuj(self.odebrane.append)
+
+    def test_menu_events(self):
+        """Test zdarzeń menu i dań."""
+        menu = Menu(szyna=self.szyna)
+        danie = Danie("Schabowy", 25.99, "danie główne")
+        menu.dodaj_danie(danie)
+        danie.zmien_cene(27.99)
+        danie.dodaj_skladnik("Schab")
+        menu.dodaj_danie_dnia("Schabowy")
+        menu.usun_danie("Schabowy")
+
+        self.assertEqual(
+            [(lista[0].pole, lista[0].stara_wartosc, lista[0].nowa_wartosc)
+             for lista in self.odebrane],
+            [(POLE_DODANO, None, danie), ("cena", 25.99, 27.99),
+             ("skladniki", [], ["Schab"]), ("danie_dnia", False, True),
+             ("danie_dnia", True, False), (POLE_USUNIETO, danie, None)])
+        self.assertTrue(all(lista[0].typ == TYP_DANIE
+                            for lista in self.odebrane))
+
+        # Usunięte danie nie publikuje już zmian
+        danie.zmien_cene(30.00)
+        self.assertEqual(len(self.odebrane), 6)
+
+    def test_delivery_single_notification(self):
+        """Test jednego powiadomienia dla dużej dostawy."""
+        magazyn = ZarzadzanieSkladnikami(szyna=self.szyna)
+        for numer in range(500):
+            magazyn.dodaj_skladnik(Skladnik(f"Składnik {numer}", "kg",
+                                            cena_jednostkowa=2.0))
+        self.odebrane.clear()
+
+        magazyn.zarejestruj_dostawe(
+            "Hurtownia", {f"Składnik {numer}": (10, 3.0)
+                          for numer in range(500)})
+
+        self.assertEqual(len(self.odebrane), 1)
+        zdarzenia = self.odebrane[0]
+        self.assertEqual(len(zdarzenia), 1000)
+        self.assertEqual(
+            {(z.pole, z.stara_wartosc, z.nowa_wartosc) for z in zdarzenia},
+            {("ilosc_na_stanie", 0, 10), ("cena_jednostkowa", 2.0, 3.0)})
+
+    def test_inventory_events(self):
+        """Test zdarzeń składników i przepisów."""
+        magazyn = ZarzadzanieSkladnikami(szyna=self.szyna)
+        maka = Skladnik("Mąka", "kg", 10)
+        magazyn.dodaj_skladnik(maka)
+        magazyn.dodaj_przepis("Pierogi", {"Mąka": 0.2})
+        magazyn.przygotuj_dania({"Pierogi": 5})
+        magazyn.aktualizuj_przepis("Pierogi", {"Mąka": 0.25})
+        magazyn.usun_przepis("Pierogi")
+
+        self.assertEqual(
+            [(z.typ, z.nazwa, z.pole) for lista in self.odebrane
+             for z in lista],
+            [(TYP_SKLADNIK, "Mąka", POLE_DODANO),
+             (TYP_PRZEPIS, "Pierogi", POLE_DODANO),
+             (TYP_SKLADNIK, "Mąka", "ilosc_na_stanie"),
+             (TYP_PRZEPIS, "Pierogi", "skladniki"),
+             (TYP_PRZEPIS, "Pierogi", POLE_USUNIETO)])
+        self.assertEqual(self.odebrane[2][0].nowa_wartosc, 9)
+        self.assertIs(self.odebrane[2][0].zrodlo, maka)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,541 +1,1580 @@
-"""
-Testy jednostkowe dla modułu inventory_control.
-Testuje klasy Skladnik i ZarzadzanieSkladnikami.
-
-Częściowo wygenerowano przy użyciu Claude.ai
-model Claude 3.7 Sonnet
-"""
-
-import unittest
-from datetime import datetime, timedelta
-from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
-
-
-class TestSkladnikInit(unittest.TestCase):
-    """
-    Testy inicjalizacji klasy Skladnik.
-    """
-
-    def test_init_with_required_params(self):
-        """Test inicjalizacji z wymaganymi parametrami."""
-        skladnik = Skladnik("Mąka", "kg")
-        self.assertEqual(skladnik.nazwa, "Mąka")
-        self.assertEqual(skladnik.jednostka, "kg")
-        self.assertEqual(skladnik.ilosc_na_stanie, 0)  # wartość domyślna
-        self.assertEqual(skladnik.min_ilosc, 10)  # wartość domyślna
-        self.assertEqual(skladnik.cena_jednostkowa, 0)  # wartość domyślna
-        self.assertIsNone(skladnik.data_waznosci)  # wartość domyślna
-        self.assertEqual(skladnik.dostawca, "")  # wartość domyślna
-        self.assertEqual(skladnik.kategoria, "")  # wartość domyślna
-        self.assertEqual(skladnik.lokalizacja, "")  # wartość domyślna
-
-    def test_init_with_all_params(self):
-        """Test inicjalizacji ze wszystkimi parametrami."""
-        data_waznosci = datetime.now() + timedelta(days=30)
-        skladnik = Skladnik(
-            "Mąka", "kg", 5, 2, 3.50,
-            data_waznosci, "Firma X", "Suche", "Półka A"
-        )
-        self.assertEqual(skladnik.nazwa, "Mąka")
-        self.assertEqual(skladnik.jednostka, "kg")
-        self.assertEqual(skladnik.ilosc_na_stanie, 5)
-        self.assertEqual(skladnik.min_ilosc, 2)
-        self.assertEqual(skladnik.cena_jednostkowa, 3.50)
-        self.assertEqual(skladnik.data_waznosci, data_waznosci)
-        self.assertEqual(skladnik.dostawca, "Firma X")
-        self.assertEqual(skladnik.kategoria, "Suche")
-        self.assertEqual(skladnik.lokalizacja, "Półka A")
-
-    def test_init_negative_amount(self):
-        """Test inicjalizacji z ujemną ilością."""
-        with self.assertRaises(ValueError):
-            Skladnik("Mąka", "kg", -5)
-
-    def test_init_negative_min_amount(self):
-        """Test inicjalizacji z ujemną minimalną ilością."""
-        with self.assertRaises(ValueError):
-            Skladnik("Mąka", "kg", 5, -2)
-
-    def test_init_negative_price(self):
-        """Test inicjalizacji z ujemną ceną."""
-        with self.assertRaises(ValueError):
-            Skladnik("Mąka", "kg", 5, 2, -3.50)
-
-    def test_historia_zmian_initial(self):
-        """Test inicjalizacji historii zmian."""
-        skladnik = Skladnik("Mąka", "kg", 5)
-        self.assertEqual(len(skladnik.historia_zmian), 1)
-        self.assertEqual(skladnik.historia_zmian[0][1], "początkowy stan")
-        self.assertEqual(skladnik.historia_zmian[0][2], 5)
-
-    def test_historia_zmian_empty(self):
-        """Test inicjalizacji historii zmian dla początkowej ilości zero."""
-        skladnik = Skladnik("Mąka", "kg")
-        self.assertEqual(len(skladnik.historia_zmian), 0)
-
-
-class TestSkladnikMetody(unittest.TestCase):
-    """
-    Testy metod klasy Skladnik.
-    """
-
-    def setUp(self):
-        """Przygotowanie danych do testów."""
-        self.skladnik = Skladnik("Mąka", "kg", 5, 2, 3.50)
-
-    def test_dodaj_zapas(self):
-        """Test dodawania zapasu."""
-        self.skladnik.dodaj_zapas(3)
-        self.assertEqual(self.skladnik.ilosc_na_stanie, 8)
-        self.assertEqual(len(self.skladnik.historia_zmian), 2)
-        self.assertEqual(self.skladnik.historia_zmian[1][1], "dostawa")
-        self.assertEqual(self.skladnik.historia_zmian[1][2], 3)
-
-    def test_dodaj_zapas_with_id(self):
-        """Test dodawania zapasu z identyfikatorem dostawy."""
-        self.skladnik.dodaj_zapas(3, "1234")
-        self.assertEqual(self.skladnik.ilosc_na_stanie, 8)
-        self.assertEqual(len(self.skladnik.historia_zmian), 2)
-        self.assertEqual(self.skladnik.historia_zmian[1][1], "dostawa 1234")
-        self.assertEqual(self.skladnik.historia_zmian[1][2], 3)
-
-    def test_dodaj_zapas_negative(self):
-        """Test dodawania ujemnego zapasu."""
-        with self.assertRaises(ValueError):
-            self.skladnik.dodaj_zapas(-3)
-
-    def test_dodaj_zapas_zero(self):
-        """Test dodawania zerowego zapasu."""
-        with self.assertRaises(ValueError):
-            self.skladnik.dodaj_zapas(0)
-
-    def test_zuzyj(self):
-        """Test zużywania składnika."""
-        self.skladnik.zuzyj(2)
-        self.assertEqual(self.skladnik.ilosc_na_stanie, 3)
-        self.assertEqual(len(self.skladnik.historia_zmian), 2)
-        self.assertEqual(self.skladnik.historia_zmian[1][1], "zużycie")
-        self.assertEqual(self.skladnik.historia_zmian[1][2], -2)
-
-    def test_zuzyj_with_cel(self):
-        """Test zużywania składnika z celem."""
-        self.skladnik.zuzyj(2, "Ciasto")
-        self.assertEqual(self.skladnik.ilosc_na_stanie, 3)
-        self.assertEqual(len(self.skladnik.historia_zmian), 2)
-        self.assertEqual(self.skladnik.historia_zmian[1][1], "zużycie Ciasto")
-        self.assertEqual(self.skladnik.historia_zmian[1][2], -2)
-
-    def test_zuzyj_negative(self):
-        """Test zużywania ujemnej ilości."""
-        with self.assertRaises(ValueError):
-            self.skladnik.zuzyj(-2)
-
-    def test_zuzyj_zero(self):
-        """Test zużywania zerowej ilości."""
-        with self.assertRaises(ValueError):
-            self.skladnik.zuzyj(0)
-
-    def test_zuzyj_too_much(self):
-        """Test zużywania większej ilości niż jest na stanie."""
-        with self.assertRaises(ValueError):
-            self.skladnik.zuzyj(10)
-
-    def test_zmien_cene(self):
-        """Test zmiany ceny."""
-        self.skladnik.zmien_cene(4.50)
-        self.assertEqual(self.skladnik.cena_jednostkowa, 4.50)
-
-    def test_zmien_cene_negative(self):
-        """Test zmiany ceny na ujemną."""
-        with self.assertRaises(ValueError):
-            self.skladnik.zmien_cene(-4.50)
-
-    def test_ustaw_date_waznosci(self):
-        """Test ustawiania daty ważności."""
-        data_waznosci = datetime.now() + timedelta(days=30)
-        self.skladnik.ustaw_date_waznosci(data_waznosci)
-        self.assertEqual(self.skladnik.data_waznosci, data_waznosci)
-
-    def test_ustaw_date_waznosci_past(self):
-        """Test ustawiania daty ważności w przeszłości."""
-        data_waznosci = datetime.now() - timedelta(days=1)
-        with self.assertRaises(ValueError):
-            self.skladnik.ustaw_date_waznosci(data_waznosci)
-
-    def test_czy_wymaga_zamowienia_true(self):
-        """Test sprawdzania czy składnik wymaga zamówienia - prawda."""
-        self.skladnik.ilosc_na_stanie = 1
-        self.assertTrue(self.skladnik.czy_wymaga_zamowienia())
-
-    def test_czy_wymaga_zamowienia_false(self):
-        """Test sprawdzania czy składnik wymaga zamówienia - fałsz."""
-        self.skladnik.ilosc_na_stanie = 5
-        self.assertFalse(self.skladnik.czy_wymaga_zamowienia())
-
-    def test_czy_przeterminowany_true(self):
-        """Test sprawdzania czy składnik jest przeterminowany - prawda."""
-        # Ustawiamy datę ważności na przeszłość (do testów)
-        self.skladnik.data_waznosci = datetime.now() - timedelta(days=1)
-        self.assertTrue(self.skladnik.czy_przeterminowany())
-
-    def test_czy_przeterminowany_false(self):
-        """Test sprawdzania czy składnik jest przeterminowany - fałsz."""
-        self.skladnik.data_waznosci = datetime.now() + timedelta(days=1)
-        self.assertFalse(self.skladnik.czy_przeterminowany())
-
-    def test_czy_przeterminowany_none(self):
-        """Test sprawdzania czy składnik jest przeterminowany; brak daty"""
-        self.assertFalse(self.skladnik.czy_przeterminowany())
-
-    def test_wartosc_zapasu(self):
-        """Test obliczania wartości zapasu."""
-        # 5 * 3.50
-        self.assertAlmostEqual(self.skladnik.wartosc_zapasu(), 17.50)
-
-
-class TestZarzadzanieSkladnikamiInit(unittest.TestCase):
-    """
-    Testy inicjalizacji klasy ZarzadzanieSkladnikami.
-    """
-
-    def test_init(self):
-        """Test inicjalizacji."""
-        zarzadzanie = ZarzadzanieSkladnikami()
-        self.assertEqual(zarzadzanie.skladniki, {})
-        self.assertEqual(zarzadzanie.przepisy, {})
-        self.assertEqual(zarzadzanie.dostawy, [])
-        self.assertEqual(zarzadzanie.kategorie_skladnikow, set())
-        self.assertEqual(zarzadzanie.dostawcy, set())
-
-
-class TestZarzadzanieSkladnikamiMetody(unittest.TestCase):
-    """
-    Testy metod klasy ZarzadzanieSkladnikami.
-    """
-
-    def setUp(self):
-        """Przygotowanie danych do testów."""
-        self.zarzadzanie = ZarzadzanieSkladnikami()
-
-        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50, None,
-                             "Dostawca X", "Suche")
-        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20, None,
-                               "Dostawca Y", "Suche")
-        self.maslo = Skladnik("Masło", "kg", 2, 0.5, 18.50, None,
-                              "Dostawca X", "Nabiał")
-
-        self.przepis_ciasto = {
-            "Mąka": 0.5,
-            "Cukier": 0.3,
-            "Masło": 0.2
-        }
-
-    def test_dodaj_skladnik_single(self):
-        """Test dodawania pojedynczego składnika."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.assertIn("Mąka", self.zarzadzanie.skladniki)
-        # Sprawidzamy, czy kategoria została dodana
-        self.assertIn("Suche", self.zarzadzanie.kategorie_skladnikow)
-        # Sprawdzamy, czy dostawca został dodany
-        self.assertIn("Dostawca X", self.zarzadzanie.dostawcy)
-
-    def test_dodaj_skladnik_duplicate(self):
-        """Test dodawania duplikatu składnika."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        with self.assertRaises(ValueError):
-            self.zarzadzanie.dodaj_skladnik(self.maka)
-
-    def test_dodaj_skladnik_multiple(self):
-        """Test dodawania wielu składników."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.assertEqual(len(self.zarzadzanie.skladniki), 2)
-        self.assertEqual(len(self.zarzadzanie.kategorie_skladnikow), 1)
-        self.assertEqual(len(self.zarzadzanie.dostawcy), 2)
-
-    def test_usun_skladnik(self):
-        """Test usuwania składnika."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.usun_skladnik("Mąka")
-        self.assertNotIn("Mąka", self.zarzadzanie.skladniki)
-        self.assertNotIn("Suche", self.zarzadzanie.kategorie_skladnikow)
-        self.assertNotIn("Dostawca X", self.zarzadzanie.dostawcy)
-
-    def test_usun_skladnik_non_existing(self):
-        """Test usuwania nieistniejącego składnika."""
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.usun_skladnik("Nieistniejący")
-
-    def test_usun_skladnik_used_in_recipe(self):
-        """Test usuwania składnika używanego w przepisie."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        with self.assertRaises(ValueError):
-            self.zarzadzanie.usun_skladnik("Mąka")
-
-    def test_usun_skladnik_not_last_in_category(self):
-        """Test usuwania składnika, który nie jest
-        ostatnim składnikiem w swojej kategorii."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-
-        # Upewniamy się, że wszystkie składniki zostały dodane prawidłowo
-        self.assertEqual(len(self.zarzadzanie.skladniki), 3)
-        # "Suche" i "Nabiał"
-        self.assertEqual(len(self.zarzadzanie.kategorie_skladnikow), 2)
-        # "Dostawca X" i "Dostawca Y"
-        self.assertEqual(len(self.zarzadzanie.dostawcy), 2)
-
-        # Usuwamy mąkę - kategorię "Suche" wciąż reprezentuje cukier,
-        # a "Dostawca X" wciąż dostarcza masło
-        self.zarzadzanie.usun_skladnik("Mąka")
-
-        self.assertNotIn("Mąka", self.zarzadzanie.skladniki)
-        # Kategoria pozostaje (cukier)
-        self.assertIn("Suche", self.zarzadzanie.kategorie_skladnikow)
-        # Dostawca pozostaje (masło)
-        self.assertIn("Dostawca X", self.zarzadzanie.dostawcy)
-        # Dostawca Y również pozostaje (cukier)
-        self.assertIn("Dostawca Y", self.zarzadzanie.dostawcy)
-
-        # Usuwamy cukier - teraz kategoria "Suche" znika,
-        # ale "Dostawca Y" też znika
-        # bo tylko cukier był od tego dostawcy
-        self.zarzadzanie.usun_skladnik("Cukier")
-
-        # Już nie ma składników w kategorii "Suche"
-        self.assertNotIn("Suche", self.zarzadzanie.kategorie_skladnikow)
-        # Dostawca Y już nie ma żadnych produktów
-        self.assertNotIn("Dostawca Y", self.zarzadzanie.dostawcy)
-        # Dostawca X wciąż dostarcza masło
-        self.assertIn("Dostawca X", self.zarzadzanie.dostawcy)
-        # Kategoria "Nabiał" pozostaje (masło)
-        self.assertIn("Nabiał", self.zarzadzanie.kategorie_skladnikow)
-
-    def test_dodaj_przepis(self):
-        """Test dodawania przepisu."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        self.assertIn("Ciasto", self.zarzadzanie.przepisy)
-        self.assertEqual(self.zarzadzanie.przepisy["Ciasto"],
-                         self.przepis_ciasto)
-
-    def test_dodaj_przepis_empty(self):
-        """Test dodawania pustego przepisu."""
-        with self.assertRaises(ValueError):
-            self.zarzadzanie.dodaj_przepis("Pusty przepis", {})
-
-    def test_dodaj_przepis_non_existing_skladnik(self):
-        """Test dodawania przepisu z nieistniejącym składnikiem."""
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.dodaj_przepis("Ciasto", {"Nieistniejący": 1})
-
-    def test_dodaj_przepis_duplicate(self):
-        """Test dodawania duplikatu przepisu."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        with self.assertRaises(ValueError):
-            self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
-
-    def test_aktualizuj_przepis(self):
-        """Test aktualizacji przepisu."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        nowy_przepis = {"Mąka": 0.6, "Cukier": 0.4}
-        self.zarzadzanie.aktualizuj_przepis("Ciasto", nowy_przepis)
-
-        self.assertEqual(self.zarzadzanie.przepisy["Ciasto"], nowy_przepis)
-
-    def test_aktualizuj_przepis_non_existing(self):
-        """Test aktualizacji nieistniejącego przepisu."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.aktualizuj_przepis("Nieistniejący", {"Mąka": 1})
-
-    def test_aktualizuj_przepis_empty(self):
-        """Test aktualizacji przepisu na pusty."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
-
-        with self.assertRaises(ValueError):
-            self.zarzadzanie.aktualizuj_przepis("Ciasto", {})
-
-    def test_aktualizuj_przepis_non_existing_skladnik(self):
-        """Test aktualizacji przepisu z nieistniejącym składnikiem."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
-
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.aktualizuj_przepis("Ciasto", {"Nieistniejący": 1})
-
-    def test_usun_przepis(self):
-        """Test usuwania przepisu."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
-
-        self.zarzadzanie.usun_przepis("Ciasto")
-
-        self.assertNotIn("Ciasto", self.zarzadzanie.przepisy)
-
-    def test_usun_przepis_non_existing(self):
-        """Test usuwania nieistniejącego przepisu."""
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.usun_przepis("Nieistniejący")
-
-    def test_sprawdz_mozliwosc_przygotowania_true(self):
-        """Test sprawdzania możliwości przygotowania - prawda."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        self.assertTrue(self.zarzadzanie.sprawdz_mozliwosc_przygotowania
-                        ("Ciasto"))
-
-    def test_sprawdz_mozliwosc_przygotowania_false(self):
-        """Test sprawdzania możliwości przygotowania - fałsz."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        # Można zrobić maksymalnie 10 porcji (5kg mąki po 0.5kg na porcję)
-        self.assertFalse(self.zarzadzanie.sprawdz_mozliwosc_przygotowania
-                         ("Ciasto", 11))
-
-    def test_sprawdz_mozliwosc_przygotowania_non_existing(self):
-        """Test możliwości przygotowania nieistniejącego przepisu."""
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.sprawdz_mozliwosc_przygotowania("Nieistniejący")
-
-    def test_przygotuj_danie(self):
-        """Test przygotowania dania."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        self.zarzadzanie.przygotuj_danie("Ciasto")
-
-        # Sprawdzenie, czy składniki zostały zużyte
-        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
-                         .ilosc_na_stanie, 4.5)  # 5 - 0.5
-        self.assertEqual(self.zarzadzanie.skladniki["Cukier"]
-                         .ilosc_na_stanie, 2.7)  # 3 - 0.3
-        self.assertEqual(self.zarzadzanie.skladniki["Masło"]
-                         .ilosc_na_stanie, 1.8)  # 2 - 0.2
-
-    def test_przygotuj_danie_multiple(self):
-        """Test przygotowania wielu porcji dania."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        self.zarzadzanie.przygotuj_danie("Ciasto", 2)
-
-        # Sprawdzenie, czy składniki zostały zużyte
-        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
-                         .ilosc_na_stanie, 4)  # 5 - 0.5*2
-        self.assertEqual(self.zarzadzanie.skladniki["Cukier"]
-                         .ilosc_na_stanie, 2.4)  # 3 - 0.3*2
-        self.assertEqual(self.zarzadzanie.skladniki["Masło"]
-                         .ilosc_na_stanie, 1.6)  # 2 - 0.2*2
-
-    def test_przygotuj_danie_non_existing(self):
-        """Test przygotowania nieistniejącego dania."""
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.przygotuj_danie("Nieistniejący")
-
-    def test_przygotuj_danie_not_enough(self):
-        """Test przygotowania dania,
-        gdy nie ma wystarczającej ilości składników."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
-
-        with self.assertRaises(ValueError):
-            self.zarzadzanie.przygotuj_danie("Ciasto", 20)
-
-    def test_zarejestruj_dostawe(self):
-        """Test rejestrowania dostawy."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-
-        # Dostawa: 10kg mąki po 3.00zł/kg
-        self.zarzadzanie.zarejestruj_dostawe("Dostawca Z",
-                                             {"Mąka": (10, 3.00)})
-
-        self.assertEqual(len(self.zarzadzanie.dostawy), 1)
-        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
-                         .ilosc_na_stanie, 15)  # 5 + 10
-        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
-                         .cena_jednostkowa, 3.00)
-        self.assertIn("Dostawca Z", self.zarzadzanie.dostawcy)
-
-    def test_zarejestruj_dostawe_non_existing_skladnik(self):
-        """Test rejestrowania dostawy z nieistniejącym składnikiem."""
-        with self.assertRaises(KeyError):
-            self.zarzadzanie.zarejestruj_dostawe("Dostawca Z",
-                                                 {"Nieistniejący": (10, 3.00)})
-
-    def test_lista_do_zamowienia(self):
-        """Test tworzenia listy składników do zamówienia."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-
-        # Używamy składników, aby spadły poniżej minimalnej ilości
-        self.maka.zuzyj(4)  # Zostanie 1 (min 2)
-        self.cukier.zuzyj(1)  # Zostanie 2 (min 1)
-        self.maslo.zuzyj(1.6)  # Zostanie 0.4 (min 0.5)
-
-        lista = self.zarzadzanie.lista_do_zamowienia()
-
-        self.assertEqual(len(lista), 2)  # Mąka i Masło wymagają zamówienia
-        self.assertIn(self.maka, lista)
-        self.assertIn(self.maslo, lista)
-
-    def test_znajdz_przeterminowane(self):
-        """Test znajdowania przeterminowanych składników."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-
-        przeterminowany = Skladnik("Jogurt", "szt", 5, 2, 1.50)
-        przeterminowany.data_waznosci = datetime.now() - timedelta(days=1)
-        self.zarzadzanie.dodaj_skladnik(przeterminowany)
-
-        przeterminowane = self.zarzadzanie.znajdz_przeterminowane()
-
-        self.assertEqual(len(przeterminowane), 1)
-        self.assertIn(przeterminowany, przeterminowane)
-
-    def test_oblicz_wartosc_magazynu(self):
-        """Test obliczania wartości magazynu."""
-        self.zarzadzanie.dodaj_skladnik(self.maka)
-        self.zarzadzanie.dodaj_skladnik(self.cukier)
-        self.zarzadzanie.dodaj_skladnik(self.maslo)
-
-        # 5kg * 3.50 + 3kg * 4.20 + 2kg * 18.50 = 17.50 + 12.60 + 37.00 = 67.10
-        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
-                               67.10)
-
-
-if __name__ == '__main__':
-    unittest.main()
+"""
+Testy jednostkowe dla modułu inventory_control.
+Testuje klasy Skladnik i ZarzadzanieSkladnikami.
+
+Częściowo wygenerowano przy użyciu Claude.ai
+model Claude 3.7 Sonnet
+"""
+
+import threading
+import unittest
+from datetime import datetime, timedelta
+from src.menu_management import Danie, Menu
+from src.inventory_control import (Partia, Skladnik, ZarzadzanieSkladnikami,
+                                   przelicz_jednostke)
+from src.stock_ledger import RejestrRuchow
+
+
+class TestSkladnikInit(unittest.TestCase):
+    """
+    Testy inicjalizacji klasy Skladnik.
+    """
+
+    def test_init_with_required_params(self):
+        """Test inicjalizacji z wymaganymi parametrami."""
+        skladnik = Skladnik("Mąka", "kg")
+        self.assertEqual(skladnik.nazwa, "Mąka")
+        self.assertEqual(skladnik.jednostka, "kg")
+        self.assertEqual(skladnik.ilosc_na_stanie, 0)  # wartość domyślna
+        self.assertEqual(skladnik.min_ilosc, 10)  # wartość domyślna
+        self.assertEqual(skladnik.cena_jednostkowa, 0)  # wartość domyślna
+        self.assertIsNone(skladnik.data_waznosci)  # wartość domyślna
+        self.assertEqual(skladnik.dostawca, "")  # wartość domyślna
+        self.assertEqual(skladnik.kategoria, "")  # wartość domyślna
+        self.assertEqual(skladnik.lokalizacja, "")  # wartość domyślna
+
+    def test_init_with_all_params(self):
+        """Test inicjalizacji ze wszystkimi parametrami."""
+        data_waznosci = datetime.now() + timedelta(days=30)
+        skladnik = Skladnik(
+            "Mąka", "kg", 5, 2, 3.50,
+            data_waznosci, "Firma X", "Suche", "Półka A"
+        )
+        self.assertEqual(skladnik.nazwa, "Mąka")
+        self.assertEqual(skladnik.jednostka, "kg")
+        self.assertEqual(skladnik.ilosc_na_stanie, 5)
+        self.assertEqual(skladnik.min_ilosc, 2)
+        self.assertEqual(skladnik.cena_jednostkowa, 3.50)
+        self.assertEqual(skladnik.data_waznosci, data_waznosci)
+        self.assertEqual(skladnik.dostawca, "Firma X")
+        self.assertEqual(skladnik.kategoria, "Suche")
+        self.assertEqual(skladnik.lokalizacja, "Półka A")
+
+    def test_init_negative_amount(self):
+        """Test inicjalizacji z ujemną ilością."""
+        with self.assertRaises(ValueError):
+            Skladnik("Mąka", "kg", -5)
+
+    def test_init_negative_min_amount(self):
+        """Test inicjalizacji z ujemną minimalną ilością."""
+        with self.assertRaises(ValueError):
+            Skladnik("Mąka", "kg", 5, -2)
+
+    def test_init_negative_price(self):
+        """Test inicjalizacji z ujemną ceną."""
+        with self.assertRaises(ValueError):
+            Skladnik("Mąka", "kg", 5, 2, -3.50)
+
+    def test_historia_zmian_initial(self):
+        """Test inicjalizacji historii zmian."""
+        skladnik = Skladnik("Mąka", "kg", 5)
+        self.assertEqual(len(skladnik.historia_zmian), 1)
+        self.assertEqual(skladnik.historia_zmian[0][1], "początkowy stan")
+        self.assertEqual(skladnik.historia_zmian[0][2], 5)
+
+    def test_historia_zmian_empty(self):
+        """Test inicjalizacji historii zmian dla początkowej ilości zero."""
+        skladnik = Skladnik("Mąka", "kg")
+        self.assertEqual(len(skladnik.historia_zmian), 0)
+
+
+class TestSkladnikMetody(unittest.TestCase):
+    """
+    Testy metod klasy Skladnik.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.skladnik = Skladnik("Mąka", "kg", 5, 2, 3.50)
+
+    def test_dodaj_zapas(self):
+        """Test dodawania zapasu."""
+        self.skladnik.dodaj_zapas(3)
+        self.assertEqual(self.skladnik.ilosc_na_stanie, 8)
+        self.assertEqual(len(self.skladnik.historia_zmian), 2)
+        self.assertEqual(self.skladnik.historia_zmian[1][1], "dostawa")
+        self.assertEqual(self.skladnik.historia_zmian[1][2], 3)
+
+    def test_dodaj_zapas_with_id(self):
+        """Test dodawania zapasu z identyfikatorem dostawy."""
+        self.skladnik.dodaj_zapas(3, "1234")
+        self.assertEqual(self.skladnik.ilosc_na_stanie, 8)
+        self.assertEqual(len(self.skladnik.historia_zmian), 2)
+        self.assertEqual(self.skladnik.historia_zmian[1][1], "dostawa 1234")
+        self.assertEqual(self.skladnik.historia_zmian[1][2], 3)
+
+    def test_dodaj_zapas_negative(self):
+        """Test dodawania ujemnego zapasu."""
+        with self.assertRaises(ValueError):
+            self.skladnik.dodaj_zapas(-3)
+
+    def test_dodaj_zapas_zero(self):
+        """Test dodawania zerowego zapasu."""
+        with self.assertRaises(ValueError):
+            self.skladnik.dodaj_zapas(0)
+
+    def test_zuzyj(self):
+        """Test zużywania składnika."""
+        self.skladnik.zuzyj(2)
+        self.assertEqual(self.skladnik.ilosc_na_stanie, 3)
+        self.assertEqual(len(self.skladnik.historia_zmian), 2)
+        self.assertEqual(self.skladnik.historia_zmian[1][1], "zużycie")
+        self.assertEqual(self.skladnik.historia_zmian[1][2], -2)
+
+    def test_zuzyj_with_cel(self):
+        """Test zużywania składnika z celem."""
+        self.skladnik.zuzyj(2, "Ciasto")
+        self.assertEqual(self.skladnik.ilosc_na_stanie, 3)
+        self.assertEqual(len(self.skladnik.historia_zmian), 2)
+        self.assertEqual(self.skladnik.historia_zmian[1][1], "zużycie Ciasto")
+        self.assertEqual(self.skladnik.historia_zmian[1][2], -2)
+
+    def test_zuzyj_negative(self):
+        """Test zużywania ujemnej ilości."""
+        with self.assertRaises(ValueError):
+            self.skladnik.zuzyj(-2)
+
+    def test_zuzyj_zero(self):
+        """Test zużywania zerowej ilości."""
+        with self.assertRaises(ValueError):
+            self.skladnik.zuzyj(0)
+
+    def test_zuzyj_too_much(self):
+        """Test zużywania większej ilości niż jest na stanie."""
+        with self.assertRaises(ValueError):
+            self.skladnik.zuzyj(10)
+
+    def test_zmien_cene(self):
+        """Test zmiany ceny."""
+        self.skladnik.zmien_cene(4.50)
+        self.assertEqual(self.skladnik.cena_jednostkowa, 4.50)
+
+    def test_zmien_cene_negative(self):
+        """Test zmiany ceny na ujemną."""
+        with self.assertRaises(ValueError):
+            self.skladnik.zmien_cene(-4.50)
+
+    def test_ustaw_date_waznosci(self):
+        """Test ustawiania daty ważności."""
+        data_waznosci = datetime.now() + timedelta(days=30)
+        self.skladnik.ustaw_date_waznosci(data_waznosci)
+        self.assertEqual(self.skladnik.data_waznosci, data_waznosci)
+
+    def test_ustaw_date_waznosci_past(self):
+        """Test ustawiania daty ważności w przeszłości."""
+        data_waznosci = datetime.now() - timedelta(days=1)
+        with self.assertRaises(ValueError):
+            self.skladnik.ustaw_date_waznosci(data_waznosci)
+
+    def test_czy_wymaga_zamowienia_true(self):
+        """Test sprawdzania czy składnik wymaga zamówienia - prawda."""
+        self.skladnik.ilosc_na_stanie = 1
+        self.assertTrue(self.skladnik.czy_wymaga_zamowienia())
+
+    def test_czy_wymaga_zamowienia_false(self):
+        """Test sprawdzania czy składnik wymaga zamówienia - fałsz."""
+        self.skladnik.ilosc_na_stanie = 5
+        self.assertFalse(self.skladnik.czy_wymaga_zamowienia())
+
+    def test_czy_przeterminowany_true(self):
+        """Test sprawdzania czy składnik jest przeterminowany - prawda."""
+        # Ustawiamy datę ważności na przeszłość (do testów)
+        self.skladnik.data_waznosci = datetime.now() - timedelta(days=1)
+        self.assertTrue(self.skladnik.czy_przeterminowany())
+
+    def test_czy_przeterminowany_false(self):
+        """Test sprawdzania czy składnik jest przeterminowany - fałsz."""
+        self.skladnik.data_waznosci = datetime.now() + timedelta(days=1)
+        self.assertFalse(self.skladnik.czy_przeterminowany())
+
+    def test_czy_przeterminowany_none(self):
+        """Test sprawdzania czy składnik jest przeterminowany; brak daty"""
+        self.assertFalse(self.skladnik.czy_przeterminowany())
+
+    def test_wartosc_zapasu(self):
+        """Test obliczania wartości zapasu."""
+        # 5 * 3.50
+        self.assertAlmostEqual(self.skladnik.wartosc_zapasu(), 17.50)
+
+
+class TestSkladnikPartie(unittest.TestCase):
+    """
+    Testy partii składnika i zużycia FEFO.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.teraz = datetime.now()
+        self.mleko = Skladnik("Mleko", "l", 2, 1, 3.00)
+        self.mleko.dodaj_zapas(5, "D2", self.teraz + timedelta(days=6))
+        self.mleko.dodaj_zapas(3, "D1", self.teraz + timedelta(days=2))
+
+    def test_partie_fefo_order(self):
+        """Test kolejności partii według daty ważności."""
+        partie = self.mleko.partie
+        self.assertEqual([p.dostawa_id for p in partie], ["D1", "D2", ""])
+        self.assertIsInstance(partie[0], Partia)
+        self.assertEqual(self.mleko.ilosc_na_stanie, 10)
+
+    def test_data_waznosci_derived(self):
+        """Test daty ważności jako najwcześniejszej daty partii."""
+        self.assertEqual(self.mleko.data_waznosci,
+                         self.teraz + timedelta(days=2))
+
+    def test_zuzyj_fefo(self):
+        """Test zużycia najpierw z partii najwcześniej wygasającej."""
+        self.mleko.zuzyj(4)
+        partie = self.mleko.partie
+        self.assertEqual([p.dostawa_id for p in partie], ["D2", ""])
+        self.assertEqual(partie[0].ilosc, 4)
+        self.assertEqual(self.mleko.data_waznosci,
+                         self.teraz + timedelta(days=6))
+        self.assertEqual(self.mleko.ilosc_na_stanie, 6)
+
+    def test_default_date_for_undated_lots(self):
+        """Test daty składnika dla partii bez własnej daty."""
+        self.mleko.data_waznosci = self.teraz + timedelta(days=1)
+        self.assertEqual([p.dostawa_id for p in self.mleko.partie],
+                         ["", "D1", "D2"])
+
+        self.mleko.zuzyj(3)
+        self.assertEqual(self.mleko.partie[0].dostawa_id, "D1")
+        self.assertEqual(self.mleko.partie[0].ilosc, 2)
+
+    def test_spisz_przeterminowane(self):
+        """Test spisania tylko przeterminowanych partii."""
+        spisano = self.mleko.spisz_przeterminowane(
+            self.teraz + timedelta(days=3))
+
+        self.assertEqual(spisano, 3)
+        self.assertEqual(self.mleko.ilosc_na_stanie, 7)
+        self.assertEqual(self.mleko.historia_zmian[-1][1], "spisanie D1")
+        self.assertEqual(self.mleko.historia_zmian[-1][2], -3)
+        self.assertFalse(self.mleko.czy_przeterminowany())
+
+    def test_set_stock_directly(self):
+        """Test bezpośredniej zmiany ilości na stanie."""
+        self.mleko.ilosc_na_stanie = 4
+        self.assertEqual([(p.dostawa_id, p.ilosc)
+                          for p in self.mleko.partie], [("D2", 2), ("", 2)])
+
+        self.mleko.ilosc_na_stanie = 6
+        self.assertEqual(sum(p.ilosc for p in self.mleko.partie), 6)
+
+
+class TestZarzadzanieSkladnikamiInit(unittest.TestCase):
+    """
+    Testy inicjalizacji klasy ZarzadzanieSkladnikami.
+    """
+
+    def test_init(self):
+        """Test inicjalizacji."""
+        zarzadzanie = ZarzadzanieSkladnikami()
+        self.assertEqual(zarzadzanie.skladniki, {})
+        self.assertEqual(zarzadzanie.przepisy, {})
+        self.assertEqual(zarzadzanie.dostawy, [])
+        self.assertEqual(zarzadzanie.kategorie_skladnikow, set())
+        self.assertEqual(zarzadzanie.dostawcy, set())
+
+    def test_own_ledger(self):
+        """Test osobnego rejestru ruchów każdego systemu."""
+        pierwszy = ZarzadzanieSkladnikami()
+        drugi = ZarzadzanieSkladnikami()
+        self.assertIsNot(pierwszy.rejestr, drugi.rejestr)
+
+        maka = Skladnik("Mąka", "kg", 5)
+        maka.zuzyj(1)
+        pierwszy.dodaj_skladnik(maka)
+        self.assertIs(maka.rejestr, pierwszy.rejestr)
+        self.assertEqual([wpis[1:] for wpis in maka.historia_zmian],
+                         [("początkowy stan", 5), ("zużycie", -1)])
+
+        # Dostawa wpisana wstecz nie wyłącza zapytań o zakres czasu
+        drugi.dodaj_skladnik(Skladnik("Cukier", "kg", 3))
+        drugi.zarejestruj_dostawe("Hurtownia", {"Cukier": (2, 4.0)},
+                                  czas_dostawy=datetime(2020, 1, 1))
+        self.assertTrue(pierwszy.rejestr.chronologiczny)
+        self.assertEqual(
+            len(drugi.rejestr.wiersze(do=datetime(2020, 1, 2))), 1)
+
+    def test_shared_ledger_kept(self):
+        """Test składnika ze wspólnym rejestrem podanym przy tworzeniu."""
+        rejestr = RejestrRuchow()
+        maka = Skladnik("Mąka", "kg", 5, rejestr=rejestr)
+        ZarzadzanieSkladnikami().dodaj_skladnik(maka)
+        self.assertIs(maka.rejestr, rejestr)
+
+
+class TestZarzadzanieSkladnikamiMetody(unittest.TestCase):
+    """
+    Testy metod klasy ZarzadzanieSkladnikami.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50, None,
+                             "Dostawca X", "Suche")
+        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20, None,
+                               "Dostawca Y", "Suche")
+        self.maslo = Skladnik("Masło", "kg", 2, 0.5, 18.50, None,
+                              "Dostawca X", "Nabiał")
+
+        self.przepis_ciasto = {
+            "Mąka": 0.5,
+            "Cukier": 0.3,
+            "Masło": 0.2
+        }
+
+    def test_dodaj_skladnik_single(self):
+        """Test dodawania pojedynczego składnika."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.assertIn("Mąka", self.zarzadzanie.skladniki)
+        # Sprawidzamy, czy kategoria została dodana
+        self.assertIn("Suche", self.zarzadzanie.kategorie_skladnikow)
+        # Sprawdzamy, czy dostawca został dodany
+        self.assertIn("Dostawca X", self.zarzadzanie.dostawcy)
+
+    def test_dodaj_skladnik_duplicate(self):
+        """Test dodawania duplikatu składnika."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.dodaj_skladnik(self.maka)
+
+    def test_dodaj_skladnik_multiple(self):
+        """Test dodawania wielu składników."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.assertEqual(len(self.zarzadzanie.skladniki), 2)
+        self.assertEqual(len(self.zarzadzanie.kategorie_skladnikow), 1)
+        self.assertEqual(len(self.zarzadzanie.dostawcy), 2)
+
+    def test_usun_skladnik(self):
+        """Test usuwania składnika."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.usun_skladnik("Mąka")
+        self.assertNotIn("Mąka", self.zarzadzanie.skladniki)
+        self.assertNotIn("Suche", self.zarzadzanie.kategorie_skladnikow)
+        self.assertNotIn("Dostawca X", self.zarzadzanie.dostawcy)
+
+    def test_usun_skladnik_non_existing(self):
+        """Test usuwania nieistniejącego składnika."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.usun_skladnik("Nieistniejący")
+
+    def test_usun_skladnik_used_in_recipe(self):
+        """Test usuwania składnika używanego w przepisie."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.usun_skladnik("Mąka")
+
+    def test_usun_skladnik_after_recipe_removed(self):
+        """Test usuwania składnika po usunięciu przepisów, które go używają."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_przepis("Pierogi", {"Mąka": 0.3})
+        self.zarzadzanie.dodaj_przepis("Kluski", {"Mąka": 0.2})
+
+        with self.assertRaisesRegex(ValueError, "w przepisie Kluski"):
+            self.zarzadzanie.usun_skladnik("Mąka")
+
+        self.zarzadzanie.usun_przepis("Kluski")
+        self.zarzadzanie.usun_przepis("Pierogi")
+        self.zarzadzanie.usun_skladnik("Mąka")
+        self.assertNotIn("Mąka", self.zarzadzanie.skladniki)
+
+    def test_usun_skladnik_not_last_in_category(self):
+        """Test usuwania składnika, który nie jest
+        ostatnim składnikiem w swojej kategorii."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        # Upewniamy się, że wszystkie składniki zostały dodane prawidłowo
+        self.assertEqual(len(self.zarzadzanie.skladniki), 3)
+        # "Suche" i "Nabiał"
+        self.assertEqual(len(self.zarzadzanie.kategorie_skladnikow), 2)
+        # "Dostawca X" i "Dostawca Y"
+        self.assertEqual(len(self.zarzadzanie.dostawcy), 2)
+
+        # Usuwamy mąkę - kategorię "Suche" wciąż reprezentuje cukier,
+        # a "Dostawca X" wciąż dostarcza masło
+        self.zarzadzanie.usun_skladnik("Mąka")
+
+        self.assertNotIn("Mąka", self.zarzadzanie.skladniki)
+        # Kategoria pozostaje (cukier)
+        self.assertIn("Suche", self.zarzadzanie.kategorie_skladnikow)
+        # Dostawca pozostaje (masło)
+        self.assertIn("Dostawca X", self.zarzadzanie.dostawcy)
+        # Dostawca Y również pozostaje (cukier)
+        self.assertIn("Dostawca Y", self.zarzadzanie.dostawcy)
+
+        # Usuwamy cukier - teraz kategoria "Suche" znika,
+        # ale "Dostawca Y" też znika
+        # bo tylko cukier był od tego dostawcy
+        self.zarzadzanie.usun_skladnik("Cukier")
+
+        # Już nie ma składników w kategorii "Suche"
+        self.assertNotIn("Suche", self.zarzadzanie.kategorie_skladnikow)
+        # Dostawca Y już nie ma żadnych produktów
+        self.assertNotIn("Dostawca Y", self.zarzadzanie.dostawcy)
+        # Dostawca X wciąż dostarcza masło
+        self.assertIn("Dostawca X", self.zarzadzanie.dostawcy)
+        # Kategoria "Nabiał" pozostaje (masło)
+        self.assertIn("Nabiał", self.zarzadzanie.kategorie_skladnikow)
+
+    def test_skladniki_w_kategorii(self):
+        """Test listowania składników z danej kategorii."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        self.assertCountEqual(
+            self.zarzadzanie.skladniki_w_kategorii("Suche"),
+            [self.maka, self.cukier])
+        self.assertEqual(self.zarzadzanie.skladniki_w_kategorii("Mięso"), [])
+
+        self.zarzadzanie.usun_skladnik("Cukier")
+        self.assertEqual(self.zarzadzanie.skladniki_w_kategorii("Suche"),
+                         [self.maka])
+
+    def test_zmiana_kategorii(self):
+        """Test rejestru i wartości kategorii po zmianie kategorii."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        self.maka.kategoria = "Nabiał"
+        self.assertEqual(self.zarzadzanie.skladniki_w_kategorii("Nabiał"),
+                         [self.maslo, self.maka])
+        self.assertNotIn("Suche", self.zarzadzanie.kategorie_skladnikow)
+        # 5kg * 3.50 + 2kg * 18.50 = 17.50 + 37.00
+        self.assertEqual(self.zarzadzanie.wartosc_kategorii(),
+                         {"Nabiał": 54.50})
+
+        self.maslo.kategoria = ""
+        self.assertEqual(self.zarzadzanie.wartosc_kategorii(),
+                         {"Nabiał": 17.50})
+        self.zarzadzanie.usun_skladnik("Mąka")
+        self.assertEqual(self.zarzadzanie.kategorie_skladnikow, set())
+        self.assertEqual(self.zarzadzanie.wartosc_kategorii(), {})
+
+    def test_skladniki_dostawcy(self):
+        """Test listowania składników danego dostawcy."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        self.assertCountEqual(
+            self.zarzadzanie.skladniki_dostawcy("Dostawca X"),
+            [self.maka, self.maslo])
+
+        self.zarzadzanie.usun_skladnik("Mąka")
+        self.zarzadzanie.usun_skladnik("Masło")
+        self.assertEqual(self.zarzadzanie.skladniki_dostawcy("Dostawca X"),
+                         [])
+        self.assertNotIn("Dostawca X", self.zarzadzanie.dostawcy)
+
+    def test_zmiana_dostawcy(self):
+        """Test rejestru dostawców po zmianie dostawcy składnika."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+
+        self.cukier.dostawca = "Dostawca X"
+        self.assertEqual(self.zarzadzanie.skladniki_dostawcy("Dostawca X"),
+                         [self.maka, self.cukier])
+        self.assertNotIn("Dostawca Y", self.zarzadzanie.dostawcy)
+
+        self.maka.dostawca = ""
+        self.assertEqual(self.zarzadzanie.skladniki_dostawcy("Dostawca X"),
+                         [self.cukier])
+        self.zarzadzanie.usun_skladnik("Mąka")
+        self.zarzadzanie.usun_skladnik("Cukier")
+        self.assertEqual(self.zarzadzanie.dostawcy, set())
+
+    def test_dodaj_przepis(self):
+        """Test dodawania przepisu."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        self.assertIn("Ciasto", self.zarzadzanie.przepisy)
+        self.assertEqual(self.zarzadzanie.przepisy["Ciasto"],
+                         self.przepis_ciasto)
+
+    def test_dodaj_przepis_empty(self):
+        """Test dodawania pustego przepisu."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.dodaj_przepis("Pusty przepis", {})
+
+    def test_dodaj_przepis_non_existing_skladnik(self):
+        """Test dodawania przepisu z nieistniejącym składnikiem."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.dodaj_przepis("Ciasto", {"Nieistniejący": 1})
+
+    def test_dodaj_przepis_duplicate(self):
+        """Test dodawania duplikatu przepisu."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
+
+    def test_aktualizuj_przepis(self):
+        """Test aktualizacji przepisu."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        nowy_przepis = {"Mąka": 0.6, "Cukier": 0.4}
+        self.zarzadzanie.aktualizuj_przepis("Ciasto", nowy_przepis)
+
+        self.assertEqual(self.zarzadzanie.przepisy["Ciasto"], nowy_przepis)
+
+    def test_aktualizuj_przepis_non_existing(self):
+        """Test aktualizacji nieistniejącego przepisu."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.aktualizuj_przepis("Nieistniejący", {"Mąka": 1})
+
+    def test_aktualizuj_przepis_empty(self):
+        """Test aktualizacji przepisu na pusty."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
+
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.aktualizuj_przepis("Ciasto", {})
+
+    def test_aktualizuj_przepis_non_existing_skladnik(self):
+        """Test aktualizacji przepisu z nieistniejącym składnikiem."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
+
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.aktualizuj_przepis("Ciasto", {"Nieistniejący": 1})
+
+    def test_usun_przepis(self):
+        """Test usuwania przepisu."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1})
+
+        self.zarzadzanie.usun_przepis("Ciasto")
+
+        self.assertNotIn("Ciasto", self.zarzadzanie.przepisy)
+
+    def test_usun_przepis_non_existing(self):
+        """Test usuwania nieistniejącego przepisu."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.usun_przepis("Nieistniejący")
+
+    def test_sprawdz_mozliwosc_przygotowania_true(self):
+        """Test sprawdzania możliwości przygotowania - prawda."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        self.assertTrue(self.zarzadzanie.sprawdz_mozliwosc_przygotowania
+                        ("Ciasto"))
+
+    def test_sprawdz_mozliwosc_przygotowania_false(self):
+        """Test sprawdzania możliwości przygotowania - fałsz."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        # Można zrobić maksymalnie 10 porcji (5kg mąki po 0.5kg na porcję)
+        self.assertFalse(self.zarzadzanie.sprawdz_mozliwosc_przygotowania
+                         ("Ciasto", 11))
+
+    def test_sprawdz_mozliwosc_przygotowania_non_existing(self):
+        """Test możliwości przygotowania nieistniejącego przepisu."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.sprawdz_mozliwosc_przygotowania("Nieistniejący")
+
+    def test_przygotuj_danie(self):
+        """Test przygotowania dania."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        self.zarzadzanie.przygotuj_danie("Ciasto")
+
+        # Sprawdzenie, czy składniki zostały zużyte
+        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
+                         .ilosc_na_stanie, 4.5)  # 5 - 0.5
+        self.assertEqual(self.zarzadzanie.skladniki["Cukier"]
+                         .ilosc_na_stanie, 2.7)  # 3 - 0.3
+        self.assertEqual(self.zarzadzanie.skladniki["Masło"]
+                         .ilosc_na_stanie, 1.8)  # 2 - 0.2
+
+    def test_przygotuj_danie_multiple(self):
+        """Test przygotowania wielu porcji dania."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        self.zarzadzanie.przygotuj_danie("Ciasto", 2)
+
+        # Sprawdzenie, czy składniki zostały zużyte
+        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
+                         .ilosc_na_stanie, 4)  # 5 - 0.5*2
+        self.assertEqual(self.zarzadzanie.skladniki["Cukier"]
+                         .ilosc_na_stanie, 2.4)  # 3 - 0.3*2
+        self.assertEqual(self.zarzadzanie.skladniki["Masło"]
+                         .ilosc_na_stanie, 1.6)  # 2 - 0.2*2
+
+    def test_przygotuj_danie_non_existing(self):
+        """Test przygotowania nieistniejącego dania."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.przygotuj_danie("Nieistniejący")
+
+    def test_przygotuj_danie_not_enough(self):
+        """Test przygotowania dania,
+        gdy nie ma wystarczającej ilości składników."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", self.przepis_ciasto)
+
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.przygotuj_danie("Ciasto", 20)
+
+    def test_zarejestruj_dostawe(self):
+        """Test rejestrowania dostawy."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+
+        # Dostawa: 10kg mąki po 3.00zł/kg
+        self.zarzadzanie.zarejestruj_dostawe("Dostawca Z",
+                                             {"Mąka": (10, 3.00)})
+
+        self.assertEqual(len(self.zarzadzanie.dostawy), 1)
+        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
+                         .ilosc_na_stanie, 15)  # 5 + 10
+        self.assertEqual(self.zarzadzanie.skladniki["Mąka"]
+                         .cena_jednostkowa, 3.00)
+        self.assertIn("Dostawca Z", self.zarzadzanie.dostawcy)
+
+    def test_zarejestruj_dostawe_non_existing_skladnik(self):
+        """Test rejestrowania dostawy z nieistniejącym składnikiem."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.zarejestruj_dostawe("Dostawca Z",
+                                                 {"Nieistniejący": (10, 3.00)})
+
+    def test_lista_do_zamowienia(self):
+        """Test tworzenia listy składników do zamówienia."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        # Używamy składników, aby spadły poniżej minimalnej ilości
+        self.maka.zuzyj(4)  # Zostanie 1 (min 2)
+        self.cukier.zuzyj(1)  # Zostanie 2 (min 1)
+        self.maslo.zuzyj(1.6)  # Zostanie 0.4 (min 0.5)
+
+        lista = self.zarzadzanie.lista_do_zamowienia()
+
+        self.assertEqual(len(lista), 2)  # Mąka i Masło wymagają zamówienia
+        self.assertIn(self.maka, lista)
+        self.assertIn(self.maslo, lista)
+
+    def test_znajdz_przeterminowane(self):
+        """Test znajdowania przeterminowanych składników."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+
+        przeterminowany = Skladnik("Jogurt", "szt", 5, 2, 1.50)
+        przeterminowany.data_waznosci = datetime.now() - timedelta(days=1)
+        self.zarzadzanie.dodaj_skladnik(przeterminowany)
+
+        przeterminowane = self.zarzadzanie.znajdz_przeterminowane()
+
+        self.assertEqual(len(przeterminowane), 1)
+        self.assertIn(przeterminowany, przeterminowane)
+
+    def test_oblicz_wartosc_magazynu(self):
+        """Test obliczania wartości magazynu."""
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+
+        # 5kg * 3.50 + 3kg * 4.20 + 2kg * 18.50 = 17.50 + 12.60 + 37.00 = 67.10
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               67.10)
+
+
+class TestPrzygotujDania(unittest.TestCase):
+    """
+    Testy przygotowania wielu dań naraz.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        self.maslo = Skladnik("Masło", "kg", 2, 0.5, 18.50)
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.maslo)
+        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 0.5, "Masło": 0.2})
+        self.zarzadzanie.dodaj_przepis("Kruszonka", {"Masło": 0.5})
+
+    def test_przygotuj_dania(self):
+        """Test zużycia zsumowanych składników."""
+        self.zarzadzanie.przygotuj_dania({"Ciasto": 2, "Kruszonka": 1})
+
+        self.assertAlmostEqual(self.maka.ilosc_na_stanie, 4)  # 5 - 0.5*2
+        self.assertAlmostEqual(self.maslo.ilosc_na_stanie, 1.1)  # 2 - 0.9
+
+    def test_przygotuj_dania_single_history_entry(self):
+        """Test jednego wpisu w historii na składnik."""
+        self.zarzadzanie.przygotuj_dania({"Ciasto": 2, "Kruszonka": 1})
+
+        self.assertEqual(len(self.maslo.historia_zmian), 2)
+        self.assertEqual(self.maslo.historia_zmian[1][1],
+                         "zużycie Ciasto, Kruszonka")
+        self.assertAlmostEqual(self.maslo.historia_zmian[1][2], -0.9)
+
+    def test_przygotuj_dania_reference_per_ingredient(self):
+        """Test referencji wpisu z daniami używającymi składnika."""
+        self.zarzadzanie.przygotuj_dania({"Kruszonka": 1, "Ciasto": 2})
+
+        self.assertEqual(self.maka.historia_zmian[1][1], "zużycie Ciasto")
+        self.assertEqual(self.maslo.historia_zmian[1][1],
+                         "zużycie Kruszonka, Ciasto")
+
+    def test_przygotuj_dania_czas(self):
+        """Test podanego czasu zużycia w historii."""
+        czas = datetime(2025, 3, 1, 12, 30)
+        self.zarzadzanie.przygotuj_dania({"Ciasto": 1, "Kruszonka": 1}, czas)
+
+        self.assertEqual(self.maka.historia_zmian[1][0], czas)
+        self.assertEqual(self.maslo.historia_zmian[1][0], czas)
+
+    def test_przygotuj_dania_not_enough_is_atomic(self):
+        """Test, że brak składnika dla sumy dań niczego nie zużywa."""
+        # Osobno każde danie jest wykonalne, razem brakuje masła
+        with self.assertRaisesRegex(ValueError, "Masło"):
+            self.zarzadzanie.przygotuj_dania({"Ciasto": 5, "Kruszonka": 3})
+
+        self.assertEqual(self.maka.ilosc_na_stanie, 5)
+        self.assertEqual(self.maslo.ilosc_na_stanie, 2)
+        self.assertEqual(len(self.maka.historia_zmian), 1)
+
+    def test_przygotuj_dania_non_existing(self):
+        """Test przygotowania zamówienia z nieistniejącym daniem."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.przygotuj_dania({"Ciasto": 1,
+                                              "Nieistniejący": 1})
+        self.assertEqual(self.maka.ilosc_na_stanie, 5)
+
+    def test_przygotuj_dania_invalid_amount(self):
+        """Test przygotowania zerowej liczby porcji."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.przygotuj_dania({"Ciasto": 0})
+
+    def test_przygotuj_dania_empty(self):
+        """Test przygotowania pustego zamówienia."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.przygotuj_dania({})
+
+
+class TestListaDoZamowienia(unittest.TestCase):
+    """
+    Testy przyrostowo utrzymywanej listy do zamówienia.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        self.sol = Skladnik("Sól", "kg", 0.5, 1, 2.00)
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.sol)
+        self.zdarzenia = []
+        self.zarzadzanie.dodaj_obserwatora_zamowien(
+            lambda skladnik, wymaga: self.zdarzenia.append(
+                (skladnik.nazwa, wymaga)))
+
+    def test_initial_below_minimum(self):
+        """Test składnika dodanego poniżej minimum."""
+        self.assertEqual(self.zarzadzanie.lista_do_zamowienia(), [self.sol])
+
+    def test_crossing_after_stock_change(self):
+        """Test przekroczenia progu przy zużyciu i dostawie."""
+        self.maka.zuzyj(4)
+        self.assertIn(self.maka, self.zarzadzanie.lista_do_zamowienia())
+
+        self.sol.dodaj_zapas(1)
+        self.assertEqual(self.zarzadzanie.lista_do_zamowienia(), [self.maka])
+        self.assertEqual(self.zdarzenia, [("Mąka", True), ("Sól", False)])
+
+    def test_no_event_without_crossing(self):
+        """Test braku powiadomienia bez przekroczenia progu."""
+        self.maka.zuzyj(1)
+        self.sol.zuzyj(0.1)
+        self.assertEqual(self.zdarzenia, [])
+
+    def test_crossing_after_min_change(self):
+        """Test przekroczenia progu po zmianie minimalnej ilości."""
+        self.maka.min_ilosc = 6
+        self.assertIn(self.maka, self.zarzadzanie.lista_do_zamowienia())
+        self.assertEqual(self.zdarzenia, [("Mąka", True)])
+
+    def test_removed_ingredient(self):
+        """Test usunięcia składnika z listy przy usunięciu z systemu."""
+        self.zarzadzanie.usun_skladnik("Sól")
+        self.assertEqual(self.zarzadzanie.lista_do_zamowienia(), [])
+
+    def test_usun_obserwatora_zamowien(self):
+        """Test wyrejestrowania obserwatora."""
+        zdarzenia = []
+
+        def obserwator(skladnik, wymaga):
+            zdarzenia.append(wymaga)
+
+        self.zarzadzanie.dodaj_obserwatora_zamowien(obserwator)
+        self.zarzadzanie.usun_obserwatora_zamowien(obserwator)
+        self.maka.zuzyj(4)
+        self.assertEqual(zdarzenia, [])
+
+
+class TestPartieDostaw(unittest.TestCase):
+    """
+    Testy partii tworzonych przez dostawy i spisywania przeterminowanych.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.teraz = datetime.now()
+        self.mleko = Skladnik("Mleko", "l", 0, 1, 3.00)
+        self.ser = Skladnik("Ser", "kg", 0, 1, 30.00)
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        for skladnik in (self.mleko, self.ser, self.maka):
+            self.zarzadzanie.dodaj_skladnik(skladnik)
+
+        self.zarzadzanie.zarejestruj_dostawe("Mleczarnia", {
+            "Mleko": (10, 3.00, self.teraz + timedelta(days=1)),
+            "Ser": (2, 30.00, self.teraz + timedelta(days=20)),
+        })
+        self.zarzadzanie.zarejestruj_dostawe("Mleczarnia", {
+            "Mleko": (5, 3.10, self.teraz + timedelta(days=5)),
+            "Mąka": (1, 0),
+        })
+
+    def test_dostawa_creates_lots(self):
+        """Test tworzenia partii przez dostawy."""
+        self.assertEqual([p.ilosc for p in self.mleko.partie], [10, 5])
+        self.assertEqual(self.mleko.ilosc_na_stanie, 15)
+        self.assertIsNone(self.maka.data_waznosci)
+
+    def test_expiry_index_follows_lots(self):
+        """Test indeksu dat ważności po zużyciu pierwszej partii."""
+        self.assertEqual(
+            self.zarzadzanie.znajdz_wygasajace(2), [self.mleko])
+
+        self.mleko.zuzyj(10)
+        self.assertEqual(self.zarzadzanie.znajdz_wygasajace(2), [])
+        self.assertEqual(self.zarzadzanie.znajdz_wygasajace(6), [self.mleko])
+
+    def test_spisz_przeterminowane(self):
+        """Test spisania przeterminowanych partii w całym magazynie."""
+        spisane = self.zarzadzanie.spisz_przeterminowane(
+            self.teraz + timedelta(days=3))
+
+        self.assertEqual(spisane, {"Mleko": 10})
+        self.assertEqual(self.mleko.ilosc_na_stanie, 5)
+        self.assertEqual(self.ser.ilosc_na_stanie, 2)
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               15.50 + 60.00 + 21.00)
+
+
+class TestWartoscMagazynu(unittest.TestCase):
+    """
+    Testy bieżącej wyceny magazynu.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50, None,
+                             "Dostawca X", "Suche")
+        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20, None,
+                               "Dostawca Y", "Suche")
+        self.maslo = Skladnik("Masło", "kg", 2, 0.5, 18.50, None,
+                              "Dostawca X", "Nabiał")
+        for skladnik in (self.maka, self.cukier, self.maslo):
+            self.zarzadzanie.dodaj_skladnik(skladnik)
+
+    def test_wartosc_kategorii(self):
+        """Test wartości w podziale na kategorie."""
+        wartosci = self.zarzadzanie.wartosc_kategorii()
+        self.assertAlmostEqual(wartosci["Suche"], 30.10)  # 17.50 + 12.60
+        self.assertAlmostEqual(wartosci["Nabiał"], 37.00)
+
+    def test_wartosc_after_stock_change(self):
+        """Test aktualizacji wartości po dostawie i zużyciu."""
+        self.maka.dodaj_zapas(2)  # +7.00
+        self.maslo.zuzyj(1)  # -18.50
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               55.60)
+        self.assertAlmostEqual(
+            self.zarzadzanie.wartosc_kategorii()["Nabiał"], 18.50)
+
+    def test_wartosc_after_price_change(self):
+        """Test aktualizacji wartości po zmianie ceny."""
+        self.cukier.zmien_cene(5.00)  # 3 * 5.00 = 15.00
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               69.50)
+
+    def test_wartosc_after_removal(self):
+        """Test aktualizacji wartości po usunięciu składników."""
+        self.zarzadzanie.usun_skladnik("Masło")
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               30.10)
+        self.assertNotIn("Nabiał", self.zarzadzanie.wartosc_kategorii())
+
+        # Zmiany usuniętego składnika nie wpływają na wartość
+        self.maslo.dodaj_zapas(10)
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               30.10)
+
+    def test_removal_of_zero_value_ingredient(self):
+        """Test usunięcia składników o zerowej wartości w kategorii."""
+        sol = Skladnik("Sól", "kg", 0, kategoria="Przyprawy")
+        pieprz = Skladnik("Pieprz", "kg", 1, kategoria="Przyprawy")
+        self.zarzadzanie.dodaj_skladnik(sol)
+        self.zarzadzanie.dodaj_skladnik(pieprz)
+
+        self.zarzadzanie.usun_skladnik("Sól")
+        self.zarzadzanie.usun_skladnik("Pieprz")
+        self.assertNotIn("Sól", self.zarzadzanie.skladniki)
+        self.assertNotIn("Przyprawy", self.zarzadzanie.kategorie_skladnikow)
+        self.assertNotIn("Przyprawy", self.zarzadzanie.wartosc_kategorii())
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               67.10)
+
+    def test_uzgodnij_wartosc_magazynu(self):
+        """Test uzgodnienia sum bieżących z pełnym przeliczeniem."""
+        for _ in range(100):
+            self.maka.dodaj_zapas(0.1)
+            self.maka.zuzyj(0.1)
+        self.assertEqual(self.zarzadzanie.uzgodnij_wartosc_magazynu(), 0)
+        self.assertAlmostEqual(self.zarzadzanie.oblicz_wartosc_magazynu(),
+                               67.10)
+
+
+class TestIndeksWaznosci(unittest.TestCase):
+    """
+    Testy indeksu dat ważności składników.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        teraz = datetime.now()
+        self.jogurt = Skladnik("Jogurt", "szt", 5, 2, 1.50,
+                               teraz - timedelta(days=1))
+        self.mleko = Skladnik("Mleko", "l", 5, 2, 3.00,
+                              teraz + timedelta(days=2))
+        self.ser = Skladnik("Ser", "kg", 2, 1, 30.00,
+                            teraz + timedelta(days=10))
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        for skladnik in (self.ser, self.maka, self.mleko, self.jogurt):
+            self.zarzadzanie.dodaj_skladnik(skladnik)
+
+    def test_znajdz_przeterminowane(self):
+        """Test znajdowania przeterminowanych składników z indeksu."""
+        self.assertEqual(self.zarzadzanie.znajdz_przeterminowane(),
+                         [self.jogurt])
+
+    def test_znajdz_wygasajace(self):
+        """Test znajdowania składników wygasających w ciągu N dni."""
+        self.assertEqual(self.zarzadzanie.znajdz_wygasajace(3), [self.mleko])
+        self.assertEqual(self.zarzadzanie.znajdz_wygasajace(30),
+                         [self.mleko, self.ser])
+
+    def test_znajdz_wygasajace_negative(self):
+        """Test wyszukiwania z ujemną liczbą dni."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.znajdz_wygasajace(-1)
+
+    def test_znajdz_wygasajace_przed(self):
+        """Test znajdowania składników wygasających przed terminem."""
+        termin = datetime.now() + timedelta(days=5)
+        self.assertEqual(self.zarzadzanie.znajdz_wygasajace_przed(termin),
+                         [self.jogurt, self.mleko])
+
+    def test_index_after_date_change(self):
+        """Test aktualizacji indeksu po zmianie daty ważności."""
+        self.ser.ustaw_date_waznosci(datetime.now() + timedelta(days=1))
+        self.maka.ustaw_date_waznosci(datetime.now() + timedelta(days=3))
+
+        self.assertEqual(self.zarzadzanie.znajdz_wygasajace(5),
+                         [self.ser, self.mleko, self.maka])
+
+        self.jogurt.data_waznosci = None
+        self.assertEqual(self.zarzadzanie.znajdz_przeterminowane(), [])
+
+    def test_index_after_removal(self):
+        """Test aktualizacji indeksu po usunięciu składnika."""
+        self.zarzadzanie.usun_skladnik("Jogurt")
+        self.assertEqual(self.zarzadzanie.znajdz_przeterminowane(), [])
+
+        # Usunięty składnik nie trafia ponownie do indeksu
+        self.jogurt.data_waznosci = datetime.now() - timedelta(days=2)
+        self.assertEqual(self.zarzadzanie.znajdz_przeterminowane(), [])
+
+
+class TestMaxPorcje(unittest.TestCase):
+    """
+    Testy macierzy wykonalności dań.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20)
+        self.maslo = Skladnik("Masło", "kg", 2, 0.5, 18.50)
+        for skladnik in (self.maka, self.cukier, self.maslo):
+            self.zarzadzanie.dodaj_skladnik(skladnik)
+        self.zarzadzanie.dodaj_przepis(
+            "Ciasto", {"Mąka": 0.5, "Cukier": 0.3, "Masło": 0.2})
+        self.zarzadzanie.dodaj_przepis("Kruszonka", {"Masło": 0.5})
+
+    def test_max_porcje(self):
+        """Test maksymalnej liczby porcji (ograniczenie przez mąkę)."""
+        # Mąka: 10, cukier: 10 (3 / 0.3), masło: 10
+        self.assertEqual(self.zarzadzanie.max_porcje("Ciasto"), 10)
+        self.assertEqual(self.zarzadzanie.max_porcje("Kruszonka"), 4)
+
+    def test_max_porcje_consistent_with_check(self):
+        """Test zgodności z sprawdz_mozliwosc_przygotowania."""
+        self.cukier.zuzyj(0.3)  # 2.7 / 0.3 w arytmetyce float
+        porcje = self.zarzadzanie.max_porcje("Ciasto")
+        self.assertTrue(self.zarzadzanie.sprawdz_mozliwosc_przygotowania(
+            "Ciasto", porcje))
+        self.assertFalse(self.zarzadzanie.sprawdz_mozliwosc_przygotowania(
+            "Ciasto", porcje + 1))
+
+    def test_max_porcje_after_stock_change(self):
+        """Test aktualizacji po zmianie stanu składnika."""
+        self.zarzadzanie.przygotuj_danie("Kruszonka", 2)
+        self.assertEqual(self.zarzadzanie.max_porcje("Kruszonka"), 2)
+        self.assertEqual(self.zarzadzanie.max_porcje("Ciasto"), 5)
+
+        self.maslo.dodaj_zapas(10)
+        self.assertEqual(self.zarzadzanie.max_porcje("Kruszonka"), 22)
+
+    def test_max_porcje_after_recipe_update(self):
+        """Test ponownej kompilacji po aktualizacji przepisu."""
+        self.zarzadzanie.aktualizuj_przepis("Kruszonka", {"Mąka": 1})
+        self.assertEqual(self.zarzadzanie.max_porcje("Kruszonka"), 5)
+
+        # Masło nie wpływa już na kruszonkę
+        self.maslo.zuzyj(2)
+        self.assertEqual(self.zarzadzanie.max_porcje("Kruszonka"), 5)
+        self.assertEqual(self.zarzadzanie.max_porcje("Ciasto"), 0)
+
+    def test_max_porcje_menu(self):
+        """Test liczby porcji dla wszystkich dań."""
+        self.assertEqual(self.zarzadzanie.max_porcje_menu(),
+                         {"Ciasto": 10, "Kruszonka": 4})
+
+        self.zarzadzanie.usun_przepis("Kruszonka")
+        self.assertEqual(self.zarzadzanie.max_porcje_menu(), {"Ciasto": 10})
+
+    def test_max_porcje_non_existing(self):
+        """Test liczby porcji dla nieistniejącego przepisu."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.max_porcje("Nieistniejący")
+
+    def test_availability_observer(self):
+        """Test powiadomień o zmianie wykonalności dań."""
+        zdarzenia = []
+        self.zarzadzanie.dodaj_obserwatora_dostepnosci(
+            lambda nazwa, dostepne: zdarzenia.append((nazwa, dostepne)))
+
+        # Kruszonka: 4 -> 0 porcji, ciasto: 10 -> 0 porcji
+        self.maslo.zuzyj(1)
+        self.assertEqual(zdarzenia, [])
+        self.maslo.zuzyj(1)
+        self.assertCountEqual(zdarzenia, [("Ciasto", False),
+                                          ("Kruszonka", False)])
+
+        # Mąka nie wpływa na kruszonkę
+        zdarzenia.clear()
+        self.maka.zuzyj(5)
+        self.maslo.dodaj_zapas(1)
+        self.assertEqual(zdarzenia, [("Kruszonka", True)])
+
+        zdarzenia.clear()
+        self.zarzadzanie.dodaj_przepis("Lukier", {"Cukier": 0.1})
+        self.assertEqual(zdarzenia, [("Lukier", True)])
+
+    def test_slot_reused_after_removal(self):
+        """Test ponownego użycia slotu po usunięciu składnika."""
+        jajka = Skladnik("Jajka", "szt", 12)
+        self.zarzadzanie.dodaj_skladnik(jajka)
+        self.zarzadzanie.usun_skladnik("Jajka")
+
+        drozdze = Skladnik("Drożdże", "kg", 1)
+        self.zarzadzanie.dodaj_skladnik(drozdze)
+        self.zarzadzanie.dodaj_przepis("Zaczyn", {"Drożdże": 0.25})
+
+        self.assertEqual(self.zarzadzanie.max_porcje("Zaczyn"), 4)
+        # Usunięty składnik nie jest już obserwowany
+        jajka.zuzyj(12)
+        self.assertEqual(self.zarzadzanie.max_porcje("Zaczyn"), 4)
+
+
+class TestTransakcjeMagazynowe(unittest.TestCase):
+    """
+    Testy transakcyjnych dostaw i zbiorczych korekt stanów.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20)
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.cukier)
+        self.czas = datetime(2025, 3, 1, 8, 0)
+
+    def test_dostawa_missing_skladnik_is_atomic(self):
+        """Test braku zmian po dostawie z nieistniejącym składnikiem."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.zarejestruj_dostawe(
+                "Młyn", {"Mąka": (10, 3.00), "Nieistniejący": (1, 1.00)})
+
+        self.assertEqual(self.maka.ilosc_na_stanie, 5)
+        self.assertEqual(self.maka.cena_jednostkowa, 3.50)
+        self.assertEqual(len(self.maka.historia_zmian), 1)
+        self.assertEqual(self.zarzadzanie.dostawy, [])
+        self.assertNotIn("Młyn", self.zarzadzanie.dostawcy)
+
+    def test_dostawa_invalid_line_is_atomic(self):
+        """Test braku zmian po dostawie z błędną ilością lub ceną."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.zarejestruj_dostawe(
+                "Młyn", {"Mąka": (10, 3.00), "Cukier": (0, 4.00)})
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.zarejestruj_dostawe(
+                "Młyn", {"Mąka": (10, 3.00), "Cukier": (1, -4.00)})
+
+        self.assertEqual(self.maka.ilosc_na_stanie, 5)
+        self.assertEqual(self.zarzadzanie.dostawy, [])
+
+    def test_dostawa_invalid_date_is_atomic(self):
+        """Test braku zmian po dostawie z błędną datą ważności partii."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.zarejestruj_dostawe(
+                "Młyn", {"Mąka": (10, 3.00, self.czas),
+                         "Cukier": (1, 4.00, "2025-04-01")})
+
+        self.assertEqual(self.maka.ilosc_na_stanie, 5)
+        self.assertEqual(self.maka.cena_jednostkowa, 3.50)
+        self.assertEqual(len(self.maka.partie), 1)
+        self.assertEqual(len(self.cukier.partie), 1)
+        self.assertEqual(len(self.zarzadzanie.dziennik_dostaw), 0)
+        self.assertEqual(self.zarzadzanie.dostawy, [])
+
+    def test_dostawa_single_timestamp(self):
+        """Test wspólnego czasu wszystkich pozycji dostawy."""
+        self.zarzadzanie.zarejestruj_dostawe(
+            "Młyn", {"Mąka": (10, 3.00), "Cukier": (2, 0)},
+            czas_dostawy=self.czas)
+
+        self.assertEqual(self.maka.historia_zmian[-1][0], self.czas)
+        self.assertEqual(self.cukier.historia_zmian[-1][0], self.czas)
+        self.assertEqual(self.zarzadzanie.dostawy[0]["czas_dostawy"],
+                         self.czas)
+
+    def test_koryguj_stan(self):
+        """Test korekty stanu pojedynczego składnika."""
+        self.assertEqual(self.maka.koryguj_stan(7, "spis", self.czas), 2)
+        self.assertEqual(self.maka.ilosc_na_stanie, 7)
+        self.assertEqual(self.maka.historia_zmian[-1],
+                         (self.czas, "korekta spis", 2))
+
+        self.assertEqual(self.maka.koryguj_stan(4), -3)
+        self.assertEqual(self.maka.ilosc_na_stanie, 4)
+        self.assertEqual(sum(p.ilosc for p in self.maka.partie), 4)
+
+        self.assertEqual(self.maka.koryguj_stan(4), 0)
+        self.assertEqual(len(self.maka.historia_zmian), 3)
+        with self.assertRaises(ValueError):
+            self.maka.koryguj_stan(-1)
+
+    def test_koryguj_stany(self):
+        """Test zbiorczej korekty stanów."""
+        roznice = self.zarzadzanie.koryguj_stany(
+            {"Mąka": 1.5, "Cukier": 3}, czas=self.czas)
+
+        self.assertEqual(roznice, {"Mąka": -3.5})
+        self.assertEqual(self.maka.ilosc_na_stanie, 1.5)
+        self.assertEqual(self.maka.historia_zmian[-1],
+                         (self.czas, "korekta inwentaryzacja", -3.5))
+        self.assertIn(self.maka, self.zarzadzanie.lista_do_zamowienia())
+        self.assertEqual(self.zarzadzanie.oblicz_wartosc_magazynu(), 17.85)
+
+    def test_koryguj_stany_is_atomic(self):
+        """Test braku zmian po zbiorczej korekcie z błędną pozycją."""
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.koryguj_stany({"Mąka": 1, "Nieistniejący": 1})
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.koryguj_stany({"Mąka": 1, "Cukier": -1})
+        self.assertEqual(self.maka.ilosc_na_stanie, 5)
+        self.assertEqual(self.cukier.ilosc_na_stanie, 3)
+
+
+class TestKosztyDan(unittest.TestCase):
+    """
+    Testy kosztów składników dań i raportu marży.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50)
+        self.cukier = Skladnik("Cukier", "kg", 3, 1, 4.20)
+        self.maslo = Skladnik("Masło", "kg", 2, 0.5, 18.50)
+        for skladnik in (self.maka, self.cukier, self.maslo):
+            self.zarzadzanie.dodaj_skladnik(skladnik)
+        self.zarzadzanie.dodaj_przepis(
+            "Ciasto", {"Mąka": 0.5, "Cukier": 0.3, "Masło": 0.2})
+        self.zarzadzanie.dodaj_przepis("Kruszonka", {"Masło": 0.5})
+        self.zarzadzanie.dodaj_przepis("Chleb", {"Mąka": (400, "g")})
+
+    def test_koszt_dania(self):
+        """Test kosztu składników porcji dania."""
+        # 0.5 * 3.50 + 0.3 * 4.20 + 0.2 * 18.50
+        self.assertEqual(self.zarzadzanie.koszt_dania("Ciasto"), 6.71)
+        self.assertEqual(self.zarzadzanie.koszt_dania("Chleb"), 1.4)
+        with self.assertRaises(KeyError):
+            self.zarzadzanie.koszt_dania("Nieistniejące")
+
+    def test_zmien_cene_invalidates_affected(self):
+        """Test przeliczenia tylko dań używających składnika."""
+        self.zarzadzanie.koszty_dan()
+        self.cukier.zmien_cene(5.20)
+
+        self.assertEqual(self.zarzadzanie._nieaktualne_koszty, {"Ciasto"})
+        self.assertEqual(self.zarzadzanie.koszty_dan(),
+                         {"Ciasto": 7.01, "Kruszonka": 9.25, "Chleb": 1.4})
+
+    def test_dostawa_updates_cost(self):
+        """Test aktualizacji kosztu po dostawie z nową ceną."""
+        self.assertEqual(self.zarzadzanie.koszt_dania("Kruszonka"), 9.25)
+        self.zarzadzanie.zarejestruj_dostawe("Mleczarnia",
+                                             {"Masło": (1, 20.00)})
+        self.assertEqual(self.zarzadzanie.koszt_dania("Kruszonka"), 10.0)
+
+    def test_aktualizuj_i_usun_przepis(self):
+        """Test kosztów po aktualizacji i usunięciu przepisu."""
+        self.zarzadzanie.aktualizuj_przepis("Kruszonka", {"Masło": 0.3})
+        self.assertEqual(self.zarzadzanie.koszt_dania("Kruszonka"), 5.55)
+
+        self.zarzadzanie.usun_przepis("Kruszonka")
+        self.assertNotIn("Kruszonka", self.zarzadzanie.koszty_dan())
+
+    def test_raport_marzy(self):
+        """Test raportu marży dla dań z menu."""
+        menu = Menu()
+        menu.dodaj_danie(Danie("Ciasto", 12.00, "Deser"))
+        menu.dodaj_danie(Danie("Herbata", 6.00, "Napój"))
+
+        raport = self.zarzadzanie.raport_marzy(menu)
+        self.assertEqual(list(raport), ["Ciasto"])
+        self.assertEqual(raport["Ciasto"], {
+            "cena": 12.00, "koszt": 6.71, "marza": 5.29,
+            "marza_procent": 44.08})
+
+        self.maka.zmien_cene(5.50)
+        self.assertEqual(
+            self.zarzadzanie.raport_marzy(menu)["Ciasto"]["koszt"], 7.71)
+
+    def test_raport_marzy_lazy_menu(self):
+        """Test raportu marży bez tworzenia dań wczytanego menu."""
+        menu = Menu()
+        menu.dodaj_danie(Danie("Ciasto", 12.00, "Deser"))
+        menu.dodaj_danie(Danie("Kruszonka", 8.00, "Deser"))
+        wczytane = Menu.z_rekordow(menu.rekordy())
+
+        raport = self.zarzadzanie.raport_marzy(wczytane)
+        self.assertEqual(raport, self.zarzadzanie.raport_marzy(menu))
+        self.assertEqual(len(wczytane._dania_numerow), 0)
+
+
+class TestWspolbieznosc(unittest.TestCase):
+    """
+    Testy równoległego przygotowywania dań na wielu stanowiskach.
+    """
+
+    def przygotuj_rownolegle(self, zarzadzanie, dania, watki=8,
+                             proby=50):
+        """Przygotowuje dania w wielu wątkach i zlicza udane porcje."""
+        udane = []
+        bariera = threading.Barrier(watki)
+
+        def stanowisko(numer):
+            bariera.wait()
+            for proba in range(proby):
+                nazwa_dania = dania[(numer + proba) % len(dania)]
+                try:
+                    zarzadzanie.przygotuj_danie(nazwa_dania)
+                    udane.append(nazwa_dania)
+                except ValueError:
+                    pass
+
+        stanowiska = [threading.Thread(target=stanowisko, args=(numer,))
+                      for numer in range(watki)]
+        for watek in stanowiska:
+            watek.start()
+        for watek in stanowiska:
+            watek.join()
+        return udane
+
+    def sprawdz_bez_ujemnych_stanow(self, blokada_globalna):
+        """Sprawdza, że równoległe stanowiska nie wyczerpią stanu poniżej 0."""
+        zarzadzanie = ZarzadzanieSkladnikami(blokada_globalna)
+        zarzadzanie.dodaj_skladnik(Skladnik("Mąka", "kg", 30, 2, 3.50))
+        zarzadzanie.dodaj_skladnik(Skladnik("Cukier", "kg", 50, 1, 4.20))
+        zarzadzanie.dodaj_skladnik(Skladnik("Masło", "kg", 50, 1, 18.50))
+        zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 1, "Cukier": 1})
+        zarzadzanie.dodaj_przepis("Placek", {"Cukier": 1, "Mąka": 1,
+                                             "Masło": 1})
+
+        udane = self.przygotuj_rownolegle(zarzadzanie, ["Ciasto", "Placek"])
+
+        maka = zarzadzanie.skladniki["Mąka"]
+        self.assertEqual(len(udane), 30)
+        self.assertEqual(maka.ilosc_na_stanie, 0)
+        self.assertEqual(len(maka.historia_zmian), 31)
+        self.assertEqual(zarzadzanie.skladniki["Cukier"].ilosc_na_stanie, 20)
+        self.assertEqual(zarzadzanie.max_porcje("Ciasto"), 0)
+        self.assertEqual(zarzadzanie.uzgodnij_wartosc_magazynu(), 0)
+
+    def test_locks_per_skladnik(self):
+        """Test blokad składników przy wspólnych składnikach dań."""
+        self.sprawdz_bez_ujemnych_stanow(False)
+
+    def test_global_lock(self):
+        """Test trybu z jedną blokadą dla całego magazynu."""
+        self.sprawdz_bez_ujemnych_stanow(True)
+
+    def test_disjoint_dishes(self):
+        """Test równoległych dań o rozłącznych składnikach."""
+        zarzadzanie = ZarzadzanieSkladnikami()
+        dania = []
+        for numer in range(4):
+            nazwa = f"Składnik {numer}"
+            zarzadzanie.dodaj_skladnik(Skladnik(nazwa, "kg", 100, 1, 1.0))
+            zarzadzanie.dodaj_przepis(f"Danie {numer}", {nazwa: 0.5})
+            dania.append(f"Danie {numer}")
+
+        udane = self.przygotuj_rownolegle(zarzadzanie, dania)
+
+        self.assertEqual(len(udane), 400)
+        self.assertEqual(len(zarzadzanie.dziennik_dostaw), 0)
+        for numer in range(4):
+            skladnik = zarzadzanie.skladniki[f"Składnik {numer}"]
+            self.assertEqual(skladnik.ilosc_na_stanie, 50)
+            self.assertEqual(len(skladnik.historia_zmian), 101)
+
+
+class TestJednostkiPrzepisow(unittest.TestCase):
+    """
+    Testy kompilacji przepisów do jednostek bazowych składników.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 2, 1, 3.50)
+        self.mleko = Skladnik("Mleko", "l", 1, 0.5, 4.00)
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.mleko)
+        self.zarzadzanie.dodaj_przepis(
+            "Naleśniki", {"Mąka": (250, "g"), "Mleko": (500, "ml")})
+
+    def test_przelicz_jednostke(self):
+        """Test przeliczania jednostek."""
+        self.assertAlmostEqual(przelicz_jednostke(250, "g", "kg"), 0.25)
+        self.assertAlmostEqual(przelicz_jednostke(2, "l", "ml"), 2000)
+        self.assertEqual(przelicz_jednostke(3, "szt", "szt"), 3)
+        with self.assertRaises(ValueError):
+            przelicz_jednostke(1, "g", "l")
+
+    def test_przepis_raw_kept(self):
+        """Test zachowania przepisu w postaci podanej przez użytkownika."""
+        self.assertEqual(self.zarzadzanie.przepisy["Naleśniki"],
+                         {"Mąka": (250, "g"), "Mleko": (500, "ml")})
+
+    def test_zapotrzebowanie_w_jednostkach_bazowych(self):
+        """Test ilości przeliczonych na jednostki składników."""
+        zapotrzebowanie = self.zarzadzanie.zapotrzebowanie_dania(
+            "Naleśniki", 2)
+        self.assertAlmostEqual(zapotrzebowanie["Mąka"], 0.5)
+        self.assertAlmostEqual(zapotrzebowanie["Mleko"], 1.0)
+
+    def test_sprawdz_mozliwosc_przygotowania(self):
+        """Test sprawdzania możliwości na skompilowanym przepisie."""
+        self.assertTrue(self.zarzadzanie.sprawdz_mozliwosc_przygotowania(
+            "Naleśniki", 2))
+        self.assertFalse(self.zarzadzanie.sprawdz_mozliwosc_przygotowania(
+            "Naleśniki", 3))
+        self.assertEqual(self.zarzadzanie.max_porcje("Naleśniki"), 2)
+
+    def test_przygotuj_danie(self):
+        """Test zużycia składników w jednostkach bazowych."""
+        self.zarzadzanie.przygotuj_danie("Naleśniki")
+        self.assertAlmostEqual(self.maka.ilosc_na_stanie, 1.75)
+        self.assertAlmostEqual(self.mleko.ilosc_na_stanie, 0.5)
+        self.assertEqual(self.maka.historia_zmian[-1][1],
+                         "zużycie Naleśniki")
+
+    def test_unknown_conversion(self):
+        """Test przepisu z jednostką niemożliwą do przeliczenia."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.dodaj_przepis("Zupa", {"Mleko": (1, "kg")})
+        self.assertNotIn("Zupa", self.zarzadzanie.przepisy)
+
+    def test_aktualizuj_przepis_jednostki(self):
+        """Test aktualizacji przepisu z mieszanymi jednostkami."""
+        self.zarzadzanie.aktualizuj_przepis(
+            "Naleśniki", {"Mąka": 0.5, "Mleko": (2, "dl")})
+        zapotrzebowanie = self.zarzadzanie.zapotrzebowanie_dania(
+            "Naleśniki")
+        self.assertAlmostEqual(zapotrzebowanie["Mąka"], 0.5)
+        self.assertAlmostEqual(zapotrzebowanie["Mleko"], 0.2)
+
+    def test_zero_with_unit(self):
+        """Test zerowej ilości podanej z jednostką."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.dodaj_przepis("Zupa", {"Mleko": (0, "ml")})
+
+
+class TestPrzepisyZlozone(unittest.TestCase):
+    """
+    Testy przepisów używających innych przepisów.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.pomidory = Skladnik("Pomidory", "kg", 10, 1, 8.00)
+        self.czosnek = Skladnik("Czosnek", "kg", 1, 0.1, 20.00)
+        self.makaron = Skladnik("Makaron", "kg", 5, 1, 6.00)
+        for skladnik in (self.pomidory, self.czosnek, self.makaron):
+            self.zarzadzanie.dodaj_skladnik(skladnik)
+        self.zarzadzanie.dodaj_przepis(
+            "Sos pomidorowy", {"Pomidory": 0.5, "Czosnek": (20, "g")})
+        self.zarzadzanie.dodaj_przepis(
+            "Spaghetti", {"Makaron": 0.2, "Sos pomidorowy": 0.5})
+        self.zarzadzanie.dodaj_przepis(
+            "Spaghetti z czosnkiem",
+            {"Spaghetti": 1, "Czosnek": (10, "g")})
+
+    def test_splaszczone_zapotrzebowanie(self):
+        """Test rozwinięcia przepisów do składników."""
+        zapotrzebowanie = self.zarzadzanie.zapotrzebowanie_dania(
+            "Spaghetti z czosnkiem", 2)
+        self.assertAlmostEqual(zapotrzebowanie["Makaron"], 0.4)
+        self.assertAlmostEqual(zapotrzebowanie["Pomidory"], 0.5)
+        self.assertAlmostEqual(zapotrzebowanie["Czosnek"], 0.04)
+
+    def test_przygotuj_danie(self):
+        """Test zużycia składników przepisu złożonego."""
+        self.zarzadzanie.przygotuj_danie("Spaghetti", 4)
+        self.assertAlmostEqual(self.pomidory.ilosc_na_stanie, 9)
+        self.assertAlmostEqual(self.czosnek.ilosc_na_stanie, 0.96)
+        self.assertAlmostEqual(self.makaron.ilosc_na_stanie, 4.2)
+        self.assertEqual(self.zarzadzanie.max_porcje("Spaghetti"), 21)
+
+    def test_aktualizacja_skladowej(self):
+        """Test przeliczenia dań po zmianie używanego przepisu."""
+        self.zarzadzanie.aktualizuj_przepis(
+            "Sos pomidorowy", {"Pomidory": 1.0})
+        zapotrzebowanie = self.zarzadzanie.zapotrzebowanie_dania(
+            "Spaghetti z czosnkiem")
+        self.assertAlmostEqual(zapotrzebowanie["Pomidory"], 0.5)
+        self.assertAlmostEqual(zapotrzebowanie["Czosnek"], 0.01)
+        self.assertEqual(
+            self.zarzadzanie.max_porcje("Spaghetti z czosnkiem"), 20)
+        self.assertAlmostEqual(
+            self.zarzadzanie.koszt_dania("Spaghetti z czosnkiem"), 5.4)
+
+    def test_zmiana_ceny(self):
+        """Test przeliczenia kosztu dania po zmianie ceny składnika sosu."""
+        self.pomidory.zmien_cene(10.00)
+        self.assertAlmostEqual(
+            self.zarzadzanie.koszt_dania("Spaghetti"), 3.9)
+
+    def test_cykl(self):
+        """Test odrzucenia przepisu tworzącego cykl."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.aktualizuj_przepis(
+                "Sos pomidorowy", {"Pomidory": 0.5, "Spaghetti": 1})
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.aktualizuj_przepis(
+                "Spaghetti", {"Spaghetti": 1})
+        self.assertEqual(self.zarzadzanie.przepisy["Sos pomidorowy"],
+                         {"Pomidory": 0.5, "Czosnek": (20, "g")})
+
+    def test_niepoprawna_ilosc_przepisu(self):
+        """Test ilości przepisu podanej z jednostką."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.dodaj_przepis(
+                "Lasagne", {"Sos pomidorowy": (1, "kg")})
+
+    def test_usun_uzywany_przepis(self):
+        """Test usuwania przepisu używanego przez inne dania."""
+        with self.assertRaises(ValueError):
+            self.zarzadzanie.usun_przepis("Sos pomidorowy")
+        self.zarzadzanie.usun_przepis("Spaghetti z czosnkiem")
+        self.zarzadzanie.usun_przepis("Spaghetti")
+        self.zarzadzanie.usun_przepis("Sos pomidorowy")
+        self.assertEqual(self.zarzadzanie.przepisy, {})
+
+    def test_dodaj_przepisy(self):
+        """Test dodawania przepisów w kolejności zależności."""
+        zarzadzanie = ZarzadzanieSkladnikami()
+        zarzadzanie.dodaj_skladnik(Skladnik("Pomidory", "kg", 10, 1, 8.00))
+        zarzadzanie.dodaj_przepisy({
+            "Zupa": {"Baza": 2},
+            "Baza": {"Pomidory": 0.25},
+        })
+        self.assertAlmostEqual(
+            zarzadzanie.zapotrzebowanie_dania("Zupa")["Pomidory"], 0.5)
+
+        with self.assertRaises(ValueError):
+            zarzadzanie.dodaj_przepisy({
+                "A": {"B": 1},
+                "B": {"A": 1},
+            })
+        with self.assertRaises(KeyError):
+            zarzadzanie.dodaj_przepisy({
+                "Sos": {"Pomidory": 0.1},
+                "Pizza": {"Sos": 1, "Ser": 0.1},
+            })
+        self.assertEqual(set(zarzadzanie.przepisy), {"Zupa", "Baza"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Testy jednostkowe dla modułu inventory_snapshot.
+Testuje klasę MigawkaMagazynu.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+from src.inventory_snapshot import MigawkaMagazynu, PLIK_RUCHOW
+from src.stock_ledger import RejestrRuchow
+
+
+class TestMigawkaMagazynu(unittest.TestCase):
+    """
+    Testy klasy MigawkaMagazynu.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.katalog = tempfile.TemporaryDirectory()
+        self.sciezka = os.path.join(self.katalog.name, "migawka")
+        self.rejestr = RejestrRuchow()
+        self.data = datetime.now() + timedelta(days=30)
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.maka = Skladnik("Mąka", "kg", 5, 2, 3.50, self.data,
+                             "Młyn", "Sypkie", "Regał A",
+                             rejestr=self.rejestr)
+        self.mleko = Skladnik("Mleko", "l", 2, 1, 4.00,
+                              rejestr=self.rejestr)
+        self.zarzadzanie.dodaj_skladnik(self.maka)
+        self.zarzadzanie.dodaj_skladnik(self.mleko)
+        self.zarzadzanie.zarejestruj_dostawe(
+            "Młyn", {"Mąka": (10, 3.00, self.data + timedelta(days=5))})
+        self.zarzadzanie.dodaj_przepis(
+            "Naleśniki", {"Mąka": (250, "g"), "Mleko": 0.5})
+        self.zarzadzanie.przygotuj_danie("Naleśniki", 2)
+
+    def tearDown(self):
+        """Usunięcie plików migawki."""
+        self.katalog.cleanup()
+
+    def test_roundtrip(self):
+        """Test odtworzenia systemu z migawki."""
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            self.assertEqual(migawka.zapisz(self.zarzadzanie), 2)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            zarzadzanie = migawka.zaladuj()
+            maka = zarzadzanie.skladniki["Mąka"]
+
+            self.assertEqual(maka.ilosc_na_stanie, 14.5)
+            self.assertEqual(maka.cena_jednostkowa, 3.00)
+            self.assertEqual(maka.data_waznosci, self.data)
+            self.assertEqual((maka.dostawca, maka.kategoria,
+                              maka.lokalizacja),
+                             ("Młyn", "Sypkie", "Regał A"))
+            self.assertEqual([(p.ilosc, p.data_waznosci, p.dostawa_id)
+                              for p in maka.partie],
+                             [(p.ilosc, p.data_waznosci, p.dostawa_id)
+                              for p in self.maka.partie])
+            self.assertEqual(maka.historia_zmian, self.maka.historia_zmian)
+            self.assertEqual(zarzadzanie.przepisy, self.zarzadzanie.przepisy)
+            self.assertEqual(zarzadzanie.max_porcje("Naleśniki"), 2)
+            self.assertEqual(zarzadzanie.oblicz_wartosc_magazynu(),
+                             self.zarzadzanie.oblicz_wartosc_magazynu())
+
+    def test_nested_recipes(self):
+        """Test odtworzenia przepisów używających innych przepisów."""
+        self.zarzadzanie.dodaj_przepis("Ciasto", {"Mąka": 0.5})
+        self.zarzadzanie.aktualizuj_przepis(
+            "Naleśniki", {"Ciasto": 0.5, "Mleko": 0.5})
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            migawka.zapisz(self.zarzadzanie)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            zarzadzanie = migawka.zaladuj()
+            self.assertEqual(zarzadzanie.przepisy, self.zarzadzanie.przepisy)
+            self.assertEqual(
+                zarzadzanie.zapotrzebowanie_dania("Naleśniki"),
+                {"Mąka": 0.25, "Mleko": 0.5})
+
+    def test_lazy_access(self):
+        """Test tworzenia składnika dopiero przy pierwszym odwołaniu."""
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            migawka.zapisz(self.zarzadzanie)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            self.assertEqual(len(migawka), 2)
+            self.assertIn("Mleko", migawka)
+            self.assertEqual(migawka.nazwy(), ["Mąka", "Mleko"])
+            self.assertEqual(migawka._skladniki, {})
+
+            mleko = migawka["Mleko"]
+            self.assertEqual(mleko.ilosc_na_stanie, 1)
+            self.assertIs(migawka["Mleko"], mleko)
+            self.assertEqual(list(migawka._skladniki), ["Mleko"])
+            with self.assertRaises(KeyError):
+                migawka["Cukier"]
+
+    def test_lazy_history(self):
+        """Test wczytania historii ruchów dopiero przy pierwszym odczycie."""
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            migawka.zapisz(self.zarzadzanie)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            maka = migawka["Mąka"]
+            self.assertEqual(maka.ilosc_na_stanie, 14.5)
+            self.assertNotIn("czasy", maka.rejestr.__dict__)
+
+            self.assertEqual([wpis[1:] for wpis in maka.historia_zmian],
+                             [wpis[1:] for wpis in self.maka.historia_zmian])
+            self.assertIn("czasy", maka.rejestr.__dict__)
+
+    def test_incremental_save(self):
+        """Test zapisu tylko zmienionych rekordów i nowych ruchów."""
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            migawka.zapisz(self.zarzadzanie)
+            rozmiar = os.path.getsize(os.path.join(self.sciezka,
+                                                   PLIK_RUCHOW))
+            self.assertEqual(migawka.zapisz(self.zarzadzanie), 0)
+
+            self.mleko.zuzyj(0.5)
+            self.assertEqual(migawka.zapisz(self.zarzadzanie), 1)
+            self.assertEqual(
+                os.path.getsize(os.path.join(self.sciezka, PLIK_RUCHOW)),
+                rozmiar + 4 + 28)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            mleko = migawka["Mleko"]
+            self.assertEqual(mleko.ilosc_na_stanie, 0.5)
+            self.assertEqual(mleko.historia_zmian[-1][1:],
+                             ("zużycie", -0.5))
+
+    def test_save_loaded_system(self):
+        """Test zapisu zmian w systemie wczytanym z migawki."""
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            migawka.zapisz(self.zarzadzanie)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            zarzadzanie = migawka.zaladuj()
+            zarzadzanie.skladniki["Mąka"].zuzyj(1, "Chleb")
+            zarzadzanie.usun_przepis("Naleśniki")
+            zarzadzanie.usun_skladnik("Mleko")
+            self.assertEqual(migawka.zapisz(zarzadzanie), 2)
+
+        with MigawkaMagazynu(self.sciezka) as migawka:
+            zarzadzanie = migawka.zaladuj()
+            self.assertEqual(list(zarzadzanie.skladniki), ["Mąka"])
+            self.assertEqual(zarzadzanie.przepisy, {})
+            maka = zarzadzanie.skladniki["Mąka"]
+            self.assertEqual(maka.ilosc_na_stanie, 13.5)
+            self.assertEqual(len(maka.historia_zmian),
+                             len(self.maka.historia_zmian) + 1)
+            self.assertEqual(maka.historia_zmian[-1][1], "zużycie Chleb")
+
+    def test_invalid_file(self):
+        """Test otwarcia katalogu z nieprawidłowym plikiem."""
+        os.makedirs(self.sciezka)
+        with open(os.path.join(self.sciezka, "skladniki.bin"), "wb") as plik:
+            plik.write(b"to nie jest migawka")
+
+        with self.assertRaises(ValueError):
+            MigawkaMagazynu(self.sciezka)
+
+
+if __name__ == '__main__':
+    unittest.main()
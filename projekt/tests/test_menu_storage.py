@@ -0,0 +1,137 @@
+"""
+Testy jednostkowe dla modułu menu_storage.
+Testuje zapis i wczytywanie menu w formacie JSON lines i binarnym.
+"""
+
+import os
+import tempfile
+import unittest
+from src.events import SzynaZdarzen
+from src.menu_management import Danie, Menu
+from src.menu_storage import (wczytaj_binarnie, wczytaj_jsonl,
+                              zapisz_binarnie, zapisz_jsonl)
+from src.menu_views import WidokiMenu
+
+
+class TestZapisMenu(unittest.TestCase):
+    """
+    Testy zapisu i wczytywania menu.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.katalog = tempfile.TemporaryDirectory()
+        self.menu = Menu(max_dania_dnia=2)
+        self.menu.dodaj_danie(Danie("Schabowy", 25.99, "danie główne", 20,
+                                    ["Schab", "Jajko", "Bułka tarta"], 850))
+        self.menu.dodaj_danie(Danie("Pomidorowa", 12.50, "zupa",
+                                    skladniki=["Pomidory", "Makaron"]))
+        self.menu.dodaj_danie(Danie("Żurek", 14.00, "zupa", 25,
+                                    ["Zakwas", "Jajko"], 320))
+        self.menu.dania["Pomidorowa"].ustaw_dostepnosc(False)
+        self.menu.dodaj_danie_dnia("Żurek")
+        self.formaty = (
+            (zapisz_jsonl, wczytaj_jsonl,
+             os.path.join(self.katalog.name, "menu.jsonl")),
+            (zapisz_binarnie, wczytaj_binarnie,
+             os.path.join(self.katalog.name, "menu.bin")),
+        )
+
+    def tearDown(self):
+        """Usunięcie plików menu."""
+        self.katalog.cleanup()
+
+    def test_roundtrip(self):
+        """Test odtworzenia menu z pliku."""
+        for zapisz, wczytaj, sciezka in self.formaty:
+            with self.subTest(sciezka=sciezka):
+                zapisz(self.menu, sciezka)
+                menu = wczytaj(sciezka)
+                self.assertEqual(list(menu.rekordy()),
+                                 list(self.menu.rekordy()))
+                self.assertEqual(menu.max_dania_dnia, 2)
+                self.assertEqual([danie.nazwa for danie in menu.dania_dnia],
+                                 ["Żurek"])
+                schabowy = menu.dania["Schabowy"]
+                self.assertEqual(schabowy.data_dodania,
+                                 self.menu.dania["Schabowy"].data_dodania)
+                self.assertEqual(schabowy.skladniki,
+                                 ["Schab", "Jajko", "Bułka tarta"])
+                self.assertIsNone(menu.dania["Pomidorowa"].kalorie)
+                self.assertFalse(menu.dania["Pomidorowa"].dostepne)
+
+    def test_lazy_dishes(self):
+        """Test tworzenia dań dopiero przy pierwszym odczycie."""
+        zapisz_binarnie(self.menu, self.formaty[1][2])
+        menu = wczytaj_binarnie(self.formaty[1][2])
+
+        # Utworzone jest tylko danie dnia
+        self.assertEqual(len(menu._dania_numerow), 1)
+        self.assertEqual(len(menu.dania), 3)
+        self.assertIn("Schabowy", menu.dania)
+        schabowy = menu.dania["Schabowy"]
+        self.assertIs(menu.dania["Schabowy"], schabowy)
+        self.assertEqual(len(menu._dania_numerow), 2)
+
+    def test_indexes_after_load(self):
+        """Test indeksów menu wczytanego z pliku."""
+        zapisz_jsonl(self.menu, self.formaty[0][2])
+        menu = wczytaj_jsonl(self.formaty[0][2])
+
+        self.assertEqual(menu.kategorie, {"danie główne", "zupa"})
+        self.assertEqual(
+            [danie.nazwa for danie in menu.znajdz_dania_po_kategorii("zupa")],
+            ["Pomidorowa", "Żurek"])
+        self.assertEqual(
+            [danie.nazwa for danie in menu.zapytanie(zawiera=["jajko"],
+                                                     max_kalorie=500)],
+            ["Żurek"])
+        self.assertEqual(
+            [danie.nazwa for danie in menu.znajdz_dania_w_cenie(10, 20)],
+            ["Żurek"])
+
+        # Zmiany utworzonych dań trafiają do indeksów
+        menu.dania["Schabowy"].zmien_cene(15.00)
+        menu.dania["Schabowy"].dodaj_skladnik("Kapusta")
+        self.assertEqual(
+            [danie.nazwa for danie in menu.znajdz_dania_w_cenie(10, 20)],
+            ["Żurek", "Schabowy"])
+        self.assertEqual(menu.znajdz_skladniki("kap"), ["kapusta"])
+
+        menu.usun_danie("Żurek")
+        menu.dodaj_danie(Danie("Barszcz", 11.00, "zupa"))
+        self.assertEqual(list(menu.dania),
+                         ["Schabowy", "Pomidorowa", "Barszcz"])
+        self.assertEqual(menu.dania_dnia, [])
+
+    def test_views_after_load(self):
+        """Test unieważniania widoków menu wczytanego z szyną zdarzeń."""
+        for zapisz, wczytaj, sciezka in self.formaty:
+            with self.subTest(sciezka=sciezka):
+                zapisz(self.menu, sciezka)
+                menu = wczytaj(sciezka, szyna=SzynaZdarzen())
+                widoki = WidokiMenu(menu)
+                self.assertIn("14.00 zł", widoki.tekst_kategorii("zupa"))
+
+                menu.dania["Żurek"].zmien_cene(15.00)
+                self.assertIn("15.00 zł", widoki.tekst_kategorii("zupa"))
+                self.assertNotIn("14.00 zł", widoki.tekst_menu())
+
+    def test_invalid_file(self):
+        """Test wczytania pliku, który nie jest menu."""
+        for _, wczytaj, sciezka in self.formaty:
+            with self.subTest(sciezka=sciezka):
+                with open(sciezka, "wb") as plik:
+                    plik.write(b"to nie jest menu")
+                with self.assertRaises(ValueError):
+                    wczytaj(sciezka)
+
+    def test_nul_in_text(self):
+        """Test zapisu binarnego tekstu ze znakiem NUL."""
+        self.menu.dodaj_danie(Danie("Zła\0nazwa", 10.00, "zupa"))
+        with self.assertRaises(ValueError):
+            zapisz_binarnie(self.menu, self.formaty[1][2])
+
+
+if __name__ == '__main__':
+    unittest.main()
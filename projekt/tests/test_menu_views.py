@@ -0,0 +1,114 @@
+"""
+Testy jednostkowe dla modułu menu_views.
+Testuje gotowe widoki menu i ich unieważnianie zdarzeniami.
+"""
+
+import json
+import unittest
+from src.events import SzynaZdarzen
+from src.menu_management import Danie, Menu
+from src.menu_views import WidokiMenu
+
+
+class TestWidokiMenu(unittest.TestCase):
+    """
+    Testy dla klasy WidokiMenu.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.menu = Menu(szyna=SzynaZdarzen())
+        self.menu.dodaj_danie(Danie("Pomidorowa", 12.50, "zupa",
+                                    skladniki=["Pomidory"]))
+        self.menu.dodaj_danie(Danie("Żurek", 14.00, "zupa", kalorie=320))
+        self.menu.dodaj_danie(Danie("Schabowy", 25.99, "danie główne"))
+        self.widoki = WidokiMenu(self.menu)
+
+    def test_category_json(self):
+        """Test widoku kategorii w postaci JSON."""
+        widok = json.loads(self.widoki.json_kategorii("zupa"))
+        self.assertEqual(widok["kategoria"], "zupa")
+        self.assertEqual(widok["dania"][0], {
+            "nazwa": "Pomidorowa", "cena": 12.50, "dostepne": True,
+            "kalorie": None, "skladniki": ["Pomidory"],
+            "danie_dnia": False})
+        self.assertEqual([danie["nazwa"] for danie in widok["dania"]],
+                         ["Pomidorowa", "Żurek"])
+
+    def test_text_views(self):
+        """Test widoków tekstowych."""
+        self.menu.dodaj_danie_dnia("Żurek")
+        self.menu.dania["Pomidorowa"].ustaw_dostepnosc(False)
+        self.assertEqual(self.widoki.tekst_kategorii("zupa"),
+                         "zupa\n"
+                         "  Pomidorowa - 12.50 zł (niedostępne)\n"
+                         "  Żurek - 14.00 zł [danie dnia]\n")
+        self.assertEqual(self.widoki.tekst_menu(),
+                         "danie główne\n"
+                         "  Schabowy - 25.99 zł\n"
+                         "\n" + self.widoki.tekst_kategorii("zupa"))
+
+    def test_menu_json(self):
+        """Test widoku całego menu w postaci JSON."""
+        widok = json.loads(self.widoki.json_menu())
+        self.assertEqual([kategoria["kategoria"]
+                          for kategoria in widok["kategorie"]],
+                         ["danie główne", "zupa"])
+        self.assertIs(self.widoki.json_menu(), self.widoki.json_menu())
+
+    def test_invalidation_per_category(self):
+        """Test unieważnienia tylko kategorii zmienionego dania."""
+        zupy = self.widoki.json_kategorii("zupa")
+        glowne = self.widoki.json_kategorii("danie główne")
+        calosc = self.widoki.json_menu()
+
+        self.menu.dania["Żurek"].zmien_cene(15.00)
+        self.assertIs(self.widoki.json_kategorii("danie główne"), glowne)
+        self.assertIsNot(self.widoki.json_kategorii("zupa"), zupy)
+        self.assertIn(b"15.0", self.widoki.json_kategorii("zupa"))
+        self.assertIsNot(self.widoki.json_menu(), calosc)
+
+    def test_structure_changes(self):
+        """Test widoków po dodaniu i usunięciu dań."""
+        self.widoki.json_menu()
+        self.menu.dodaj_danie(Danie("Sernik", 9.00, "deser"))
+        self.assertIn("deser", self.widoki.tekst_menu())
+
+        self.menu.usun_danie("Schabowy")
+        self.assertNotIn("Schabowy", self.widoki.tekst_menu())
+        with self.assertRaises(KeyError):
+            self.widoki.json_kategorii("danie główne")
+
+    def test_category_change(self):
+        """Test unieważnienia starej i nowej kategorii dania."""
+        self.widoki.tekst_kategorii("zupa")
+        self.widoki.tekst_kategorii("danie główne")
+
+        self.menu.dania["Żurek"].kategoria = "danie główne"
+        self.assertEqual(self.widoki.tekst_kategorii("zupa"),
+                         "zupa\n  Pomidorowa - 12.50 zł\n")
+        self.assertIn("Żurek", self.widoki.tekst_kategorii("danie główne"))
+
+    def test_unchanged_value(self):
+        """Test zachowania widoków przy przypisaniu tej samej wartości."""
+        zupy = self.widoki.json_kategorii("zupa")
+        zurek = self.menu.dania["Żurek"]
+        zurek.zmien_cene(14.00)
+        zurek.ustaw_dostepnosc(True)
+        zurek.kalorie = 320
+        self.assertIs(self.widoki.json_kategorii("zupa"), zupy)
+
+    def test_requires_bus(self):
+        """Test tworzenia widoków dla menu bez szyny zdarzeń."""
+        with self.assertRaises(ValueError):
+            WidokiMenu(Menu())
+
+    def test_detach(self):
+        """Test odłączenia widoków od menu."""
+        self.widoki.odlacz()
+        with self.assertRaises(ValueError):
+            self.widoki.odlacz()
+
+
+if __name__ == '__main__':
+    unittest.main()
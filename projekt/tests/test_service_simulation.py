@@ -0,0 +1,123 @@
+"""
+Testy jednostkowe dla modułu service_simulation.
+Testuje klasy PolitykaZaopatrzenia, ZegarSymulacji i SymulacjaSerwisu.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from src.inventory_control import Skladnik, ZarzadzanieSkladnikami
+from src.menu_management import Danie, Menu
+from src.service_simulation import (PolitykaZaopatrzenia, SymulacjaSerwisu,
+                                    ZegarSymulacji)
+
+
+class TestPolitykaIZegar(unittest.TestCase):
+    """
+    Testy polityki zaopatrzenia i zegara symulacji.
+    """
+
+    def test_polityka_invalid(self):
+        """Test nieprawidłowych parametrów polityki."""
+        with self.assertRaises(ValueError):
+            PolitykaZaopatrzenia(co_ile_dni=0)
+        with self.assertRaises(ValueError):
+            PolitykaZaopatrzenia(dni_realizacji=0)
+
+    def test_zegar(self):
+        """Test przesuwania zegara symulacji."""
+        zegar = ZegarSymulacji(datetime(2025, 1, 6))
+        self.assertEqual(zegar.przesun(timedelta(hours=2)),
+                         datetime(2025, 1, 6, 2))
+        self.assertEqual(zegar.teraz, datetime(2025, 1, 6, 2))
+
+
+class TestSymulacjaSerwisu(unittest.TestCase):
+    """
+    Testy klasy SymulacjaSerwisu.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.zarzadzanie = ZarzadzanieSkladnikami()
+        self.zarzadzanie.dodaj_skladnik(Skladnik("Mąka", "kg", 20, 10, 3.50))
+        self.zarzadzanie.dodaj_skladnik(Skladnik("Mleko", "l", 20, 10, 4.00))
+        self.zarzadzanie.dodaj_skladnik(Skladnik("Sól", "kg", 5, 1, 1.00))
+        self.zarzadzanie.dodaj_przepis("Naleśniki",
+                                       {"Mąka": 0.2, "Mleko": 0.3})
+        self.zarzadzanie.dodaj_przepis("Placki", {"Mąka": 0.3})
+        self.menu = Menu()
+        self.menu.dodaj_danie(Danie("Naleśniki", 18.00, "Deser"))
+        self.menu.dodaj_danie(Danie("Placki", 22.00, "Danie główne"))
+        self.symulacja = SymulacjaSerwisu(
+            self.zarzadzanie, self.menu, {"Naleśniki": 20, "Placki": 10})
+
+    def test_init_invalid(self):
+        """Test symulatora z nieprawidłowymi danymi."""
+        with self.assertRaises(KeyError):
+            SymulacjaSerwisu(self.zarzadzanie, self.menu, {"Pizza": 5})
+        with self.assertRaises(ValueError):
+            SymulacjaSerwisu(self.zarzadzanie, self.menu, {}, dni=0)
+        with self.assertRaises(ValueError):
+            self.symulacja.uruchom(PolitykaZaopatrzenia(), replikacje=0)
+
+    def test_deterministic(self):
+        """Test powtarzalności wyników dla tego samego ziarna."""
+        polityka = PolitykaZaopatrzenia()
+        wynik = self.symulacja.uruchom(polityka, replikacje=5, procesy=1)
+        self.assertEqual(
+            wynik, self.symulacja.uruchom(polityka, replikacje=5, procesy=1))
+        self.assertEqual(wynik["replikacje"], 5)
+        self.assertEqual(set(wynik["prawdopodobienstwo_braku"]),
+                         {"Mąka", "Mleko", "Sól"})
+
+    def test_does_not_change_source(self):
+        """Test niezmienności stanu źródłowego systemu i menu."""
+        self.symulacja.uruchom(PolitykaZaopatrzenia(), replikacje=2,
+                               procesy=1)
+        self.assertEqual(
+            self.zarzadzanie.skladniki["Mąka"].ilosc_na_stanie, 20)
+        self.assertTrue(self.menu.dania["Placki"].dostepne)
+
+    def test_stock_out(self):
+        """Test braków przy zbyt rzadkich i późnych dostawach."""
+        wynik = self.symulacja.uruchom(
+            PolitykaZaopatrzenia(co_ile_dni=7, dni_realizacji=3),
+            replikacje=10, procesy=1)
+
+        self.assertEqual(wynik["prawdopodobienstwo_braku"]["Mąka"], 1.0)
+        self.assertEqual(wynik["prawdopodobienstwo_braku"]["Sól"], 0.0)
+        self.assertGreater(wynik["srednio_utracone"], 0)
+
+    def test_generous_policy(self):
+        """Test braku braków przy codziennych, dużych dostawach."""
+        wynik = self.symulacja.uruchom(
+            PolitykaZaopatrzenia(min_ilosc={"Mąka": 40, "Mleko": 40},
+                                 poziom_docelowy={"Mąka": 80, "Mleko": 80}),
+            replikacje=10, procesy=1)
+
+        self.assertEqual(wynik["prawdopodobienstwo_braku"]["Mąka"], 0.0)
+        self.assertEqual(wynik["srednio_utracone"], 0)
+        self.assertGreater(wynik["srednio_obsluzone"], 150)
+
+    def test_waste(self):
+        """Test strat przy krótkiej przydatności dostarczanych partii."""
+        wynik = self.symulacja.uruchom(
+            PolitykaZaopatrzenia(poziom_docelowy={"Mleko": 100},
+                                 dni_przydatnosci={"Mleko": 1}),
+            replikacje=5, procesy=1)
+
+        self.assertGreater(wynik["srednie_straty"]["Mleko"], 0)
+        self.assertEqual(wynik["srednie_straty"]["Mąka"], 0)
+
+    def test_process_pool(self):
+        """Test zgodności wyników z puli procesów i jednego procesu."""
+        polityka = PolitykaZaopatrzenia(co_ile_dni=2)
+        self.assertEqual(
+            self.symulacja.uruchom(polityka, replikacje=6, ziarno=3,
+                                   procesy=2),
+            self.symulacja.uruchom(polityka, replikacje=6, ziarno=3,
+                                   procesy=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
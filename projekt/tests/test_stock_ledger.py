@@ -0,0 +1,200 @@
+"""
+Testy jednostkowe dla modułu stock_ledger.
+Testuje klasy RejestrRuchow i WidokHistorii.
+"""
+
+import unittest
+from array import array
+from datetime import datetime, timedelta
+from src.stock_ledger import RejestrRuchow, WidokHistorii
+from src.inventory_control import Skladnik
+
+
+class TestRejestrRuchow(unittest.TestCase):
+    """
+    Testy klasy RejestrRuchow.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.rejestr = RejestrRuchow()
+        self.maka = self.rejestr.zarejestruj_skladnik()
+        self.cukier = self.rejestr.zarejestruj_skladnik()
+        self.start = datetime(2025, 3, 1, 8, 0)
+
+        self.rejestr.dopisz(self.maka, self.start, "dostawa", 10, "D1")
+        self.rejestr.dopisz(self.cukier, self.start + timedelta(hours=1),
+                            "dostawa", 5, "D1")
+        self.rejestr.dopisz(self.maka, self.start + timedelta(days=1),
+                            "zużycie", -2, "Ciasto")
+        self.rejestr.dopisz(self.maka, self.start + timedelta(days=2),
+                            "zużycie", -3)
+
+    def test_init(self):
+        """Test inicjalizacji pustego rejestru."""
+        rejestr = RejestrRuchow()
+        self.assertEqual(len(rejestr), 0)
+        self.assertEqual(rejestr.suma(), 0)
+
+    def test_dopisz(self):
+        """Test dopisywania ruchów."""
+        self.assertEqual(len(self.rejestr), 4)
+        self.assertEqual(self.rejestr.czas(0), self.start)
+        self.assertEqual(self.rejestr.operacja(2), "zużycie")
+        self.assertEqual(self.rejestr.referencja(2), "Ciasto")
+        self.assertEqual(self.rejestr.ilosci[2], -2)
+
+    def test_operacje_internowane(self):
+        """Test internowania nazw operacji."""
+        self.assertEqual(self.rejestr.kody_operacji[2],
+                         self.rejestr.kody_operacji[3])
+        self.assertEqual(self.rejestr.kod_operacji("dostawa"),
+                         self.rejestr.kody_operacji[0])
+
+    def test_opis(self):
+        """Test opisu operacji z referencją i bez niej."""
+        self.assertEqual(self.rejestr.opis(0), "dostawa D1")
+        self.assertEqual(self.rejestr.opis(3), "zużycie")
+
+    def test_wiersze_zakres(self):
+        """Test wyszukiwania wierszy w zakresie czasu."""
+        wiersze = self.rejestr.wiersze(od=self.start + timedelta(hours=1),
+                                       do=self.start + timedelta(days=1))
+        self.assertEqual(list(wiersze), [1, 2])
+
+    def test_wiersze_skladnika_w_zakresie(self):
+        """Test wyszukiwania wierszy składnika w zakresie czasu."""
+        wiersze = self.rejestr.wiersze(self.maka,
+                                       od=self.start + timedelta(hours=1))
+        self.assertEqual(list(wiersze), [2, 3])
+
+    def test_suma(self):
+        """Test sumowania ruchów."""
+        self.assertEqual(self.rejestr.suma(self.maka), 5)
+        self.assertEqual(self.rejestr.suma(self.maka, "zużycie"), -5)
+        self.assertEqual(self.rejestr.suma(operacja="dostawa"), 15)
+        self.assertEqual(self.rejestr.suma(operacja="spisanie"), 0)
+        self.assertEqual(
+            self.rejestr.suma(self.maka, do=self.start + timedelta(days=1)),
+            8)
+
+    def test_sumy_skladnikow(self):
+        """Test sum ruchów w podziale na składniki."""
+        self.assertEqual(self.rejestr.sumy_skladnikow("zużycie"),
+                         {self.maka: -5})
+        self.assertEqual(self.rejestr.sumy_skladnikow(),
+                         {self.maka: 5, self.cukier: 5})
+        self.assertEqual(self.rejestr.sumy_skladnikow("spisanie"), {})
+
+    def test_nie_chronologiczny(self):
+        """Test zapytań po dopisaniu ruchu z wcześniejszą datą."""
+        self.rejestr.dopisz(self.cukier, self.start - timedelta(days=1),
+                            "korekta", 1)
+
+        self.assertFalse(self.rejestr.chronologiczny)
+        self.assertEqual(self.rejestr.zakres(od=self.start), (1, 5))
+        self.assertEqual(list(self.rejestr.wiersze(od=self.start)),
+                         [0, 1, 2, 3])
+        self.assertEqual(list(self.rejestr.wiersze(do=self.start)), [0, 4])
+        self.assertEqual(self.rejestr.suma(self.cukier,
+                                           do=self.start), 1)
+
+        # Kolejne ruchy (także wsteczne) trafiają na właściwe miejsce
+        self.rejestr.dopisz(self.maka, self.start + timedelta(hours=12),
+                            "korekta", 1)
+        self.rejestr.dopisz(self.maka, self.start + timedelta(days=3),
+                            "zużycie", -1)
+        self.assertEqual(
+            list(self.rejestr.wiersze(self.maka,
+                                      od=self.start + timedelta(hours=1),
+                                      do=self.start + timedelta(days=1))),
+            [2, 5])
+        self.assertEqual(self.rejestr.suma(od=self.start + timedelta(days=2)),
+                         -4)
+
+    def test_z_kolumn(self):
+        """Test odtworzenia rejestru z kolumn."""
+        teksty = ["", "dostawa", "zużycie", "D1", "Ciasto"]
+        kody = {tekst: kod for kod, tekst in enumerate(teksty)}
+        kolumny = [array("q"), array("i"), array("i"), array("d"),
+                   array("i")]
+        for wiersz in range(len(self.rejestr)):
+            for kolumna, wartosc in zip(kolumny, (
+                    self.rejestr.czasy[wiersz],
+                    self.rejestr.kody_skladnikow[wiersz],
+                    kody[self.rejestr.operacja(wiersz)],
+                    self.rejestr.ilosci[wiersz],
+                    kody[self.rejestr.referencja(wiersz)])):
+                kolumna.append(wartosc)
+
+        rejestr = RejestrRuchow.leniwy(
+            lambda: RejestrRuchow.z_kolumn(*kolumny, teksty, 3))
+        self.assertNotIn("czasy", rejestr.__dict__)
+        self.assertEqual(list(rejestr.wiersze(self.maka)), [0, 2, 3])
+        self.assertEqual(list(rejestr.wiersze(self.cukier)), [1])
+        self.assertEqual(list(rejestr.wiersze(2)), [])
+        self.assertEqual(rejestr.opis(2), "zużycie Ciasto")
+        self.assertEqual(rejestr.suma(self.maka), 5)
+
+
+class TestWidokHistorii(unittest.TestCase):
+    """
+    Testy klasy WidokHistorii.
+    """
+
+    def setUp(self):
+        """Przygotowanie danych do testów."""
+        self.rejestr = RejestrRuchow()
+        self.skladnik = Skladnik("Mąka", "kg", 5, rejestr=self.rejestr)
+
+    def test_widok_historii(self):
+        """Test dekodowania wpisów historii."""
+        self.skladnik.dodaj_zapas(3, "1234")
+        self.skladnik.zuzyj(2, "Ciasto")
+
+        historia = self.skladnik.historia_zmian
+        self.assertIsInstance(historia, WidokHistorii)
+        self.assertEqual(len(historia), 3)
+        self.assertEqual([wpis[1] for wpis in historia],
+                         ["początkowy stan", "dostawa 1234",
+                          "zużycie Ciasto"])
+        self.assertEqual(historia[-1][2], -2)
+        self.assertIsInstance(historia[0][0], datetime)
+
+    def test_widok_historii_slice(self):
+        """Test wycinania fragmentu historii."""
+        self.skladnik.zuzyj(1)
+        wpisy = self.skladnik.historia_zmian[1:]
+        self.assertEqual(len(wpisy), 1)
+        self.assertEqual(wpisy[0][1:], ("zużycie", -1))
+
+    def test_shared_ledger(self):
+        """Test wspólnego rejestru dla wielu składników."""
+        cukier = Skladnik("Cukier", "kg", 3, rejestr=self.rejestr)
+        cukier.zuzyj(1)
+
+        self.assertEqual(len(self.rejestr), 3)
+        self.assertEqual(len(self.skladnik.historia_zmian), 1)
+        self.assertEqual(len(cukier.historia_zmian), 2)
+
+    def test_own_ledger(self):
+        """Test osobnych rejestrów składników bez podanego rejestru."""
+        maka = Skladnik("Mąka", "kg", 5)
+        cukier = Skladnik("Cukier", "kg", 3)
+        self.assertIsNot(maka.rejestr, cukier.rejestr)
+
+        # Ruch wsteczny jednego składnika nie wpływa na inne rejestry
+        maka.dodaj_zapas(1, czas=datetime(2020, 1, 1))
+        self.assertFalse(maka.rejestr.chronologiczny)
+        self.assertTrue(cukier.rejestr.chronologiczny)
+
+    def test_eq(self):
+        """Test porównania widoku z listą."""
+        skladnik = Skladnik("Sól", "kg", rejestr=self.rejestr)
+        self.assertEqual(skladnik.historia_zmian, [])
+        self.assertEqual(self.skladnik.historia_zmian,
+                         list(self.skladnik.historia_zmian))
+
+
+if __name__ == '__main__':
+    unittest.main()